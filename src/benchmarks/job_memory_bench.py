@@ -0,0 +1,64 @@
+"""Benchmark de memória: vaga como dict (formato dos scrapers) x Job com __slots__
+
+Uso (a partir de src/): python -m benchmarks.job_memory_bench [quantidade]
+
+Cada vaga é montada com strings novas, como sai do parsing do HTML/JSON
+(sem o compartilhamento que literais no código teriam). Mede a memória
+retida por vaga com tracemalloc.
+"""
+import gc
+import sys
+import tracemalloc
+from models.job import Job
+
+PLATFORMS = ['LinkedIn', 'Gupy', 'InfoJobs']
+LOCATIONS = ['Salvador, Bahia, Brasil', 'Salvador, BA', 'Lauro de Freitas, Bahia', 'Remoto']
+COMPANIES = [f'Empresa {i}' for i in range(200)]
+
+
+def _fresh(text: str) -> str:
+    """Cópia nova da string (como a devolvida pelo parser)"""
+    return ''.join(list(text))
+
+
+def build_dicts(count: int) -> list:
+    """Vagas no formato dos scrapers (com descrição curta, como a API da Gupy)"""
+    return [{
+        'job_id': str(4000000000 + i),
+        'title': _fresh(f'Estágio em Desenvolvimento de Software {i}'),
+        'company': _fresh(COMPANIES[i % len(COMPANIES)]),
+        'location': _fresh(LOCATIONS[i % len(LOCATIONS)]),
+        'date_posted': _fresh(f'2024-01-{i % 28 + 1:02d}'),
+        'platform': _fresh(PLATFORMS[i % len(PLATFORMS)]),
+        'url': _fresh(f'https://www.linkedin.com/jobs/view/{4000000000 + i}'),
+        'description': _fresh('Vaga de estágio em TI para estudantes de sistemas. ' * 4),
+    } for i in range(count)]
+
+
+def measure(build, count: int) -> float:
+    """Bytes retidos por vaga (só o resultado final fica vivo)"""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    jobs = build(count)
+    gc.collect()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    retained = sum(stat.size_diff for stat in after.compare_to(before, 'filename'))
+    del jobs
+    return retained / count
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    dict_bytes = measure(build_dicts, count)
+    # O Job guarda campos derivados (título normalizado e chave) e mesmo assim ocupa menos
+    job_bytes = measure(lambda n: [Job.from_dict(job) for job in build_dicts(n)], count)
+
+    print(f"📦 {count:,} vagas")
+    print(f"🧾 dict:            {dict_bytes:8,.0f} bytes/vaga")
+    print(f"🧱 Job (__slots__): {job_bytes:8,.0f} bytes/vaga ({1 - job_bytes / dict_bytes:.0%} a menos)")
+
+
+if __name__ == '__main__':
+    main()
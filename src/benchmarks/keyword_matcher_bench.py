@@ -0,0 +1,86 @@
+"""Micro-benchmark: matcher compilado x busca de substrings com any()
+
+Uso (a partir de src/): python -m benchmarks.keyword_matcher_bench
+"""
+import json
+import os
+import random
+import timeit
+from config.settings import JOB_LEVELS, TECH_TITLE_KEYWORDS, EXCLUDE_KEYWORDS, LOCATION_KEYWORDS
+from filters.keyword_matcher import keyword_matcher
+
+SAMPLE_TITLES = [
+    "Estágio em Desenvolvimento de Software",
+    "Analista de Suporte Júnior - Salvador/BA",
+    "Assistente Administrativo",
+    "Auxiliar de Atividades Gerais",
+    "Tech Recruiter Jr",
+    "Desenvolvedor Backend Sênior (Python)",
+    "Estagiário de TI - Infraestrutura e Redes",
+    "Técnico de Informática Trainee",
+    "Desenvolvedora Júnior",
+    "Programadora Jr",
+    "Auxiliares de Suporte Técnico",
+]
+
+
+def load_titles():
+    """Usa as vagas salvas como corpus (com exemplos sintéticos de reforço)"""
+    titles = list(SAMPLE_TITLES)
+    path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'vagas_encontradas.json')
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            titles += [job['title'] for job in json.load(f)]
+    except (FileNotFoundError, KeyError, ValueError):
+        pass
+    random.seed(42)
+    return [random.choice(titles) for _ in range(5000)]
+
+
+def legacy_scan(title: str) -> set:
+    """Abordagem antiga: any(keyword in title) por categoria"""
+    title = title.lower()
+    found = set()
+    if any(keyword in title for keyword in JOB_LEVELS):
+        found.add('level')
+    if any(keyword in title for keyword in TECH_TITLE_KEYWORDS):
+        found.add('tech')
+    if any(keyword in title for keyword in EXCLUDE_KEYWORDS):
+        found.add('exclude')
+    if any(keyword in title for keyword in LOCATION_KEYWORDS):
+        found.add('location')
+    return found
+
+
+def compare(label: str, texts: list):
+    """Mede a vazão das duas abordagens sobre os textos"""
+    legacy_time = min(timeit.repeat(lambda: [legacy_scan(t) for t in texts], number=5, repeat=3))
+    matcher_time = min(timeit.repeat(lambda: [keyword_matcher.scan(t) for t in texts], number=5, repeat=3))
+
+    total = len(texts) * 5
+    print(f"📏 {label}: {total} textos por rodada")
+    print(f"   🐌 any() por substring: {total / legacy_time:,.0f} textos/s")
+    print(f"   ⚡ matcher compilado:   {total / matcher_time:,.0f} textos/s ({legacy_time / matcher_time:.2f}x)")
+
+
+def main():
+    titles = load_titles()
+    compare("Títulos", titles)
+
+    # Título + descrição, como no JobFilter
+    description = (
+        "Buscamos pessoa para atuar com rotinas administrativas, atendimento a clientes, "
+        "organização de documentos e apoio às atividades da equipe. "
+    ) * 8
+    compare("Título + descrição", [f"{title}\n{description}" for title in titles[:1000]])
+
+    # Diferenças de resultado (falsos positivos do substring)
+    print("\n🔎 Diferenças de classificação:")
+    for title in sorted(set(titles)):
+        legacy, compiled = legacy_scan(title), keyword_matcher.scan(title)
+        if legacy != compiled:
+            print(f"  {title!r}: any()={sorted(legacy)} matcher={sorted(compiled)}")
+
+
+if __name__ == "__main__":
+    main()
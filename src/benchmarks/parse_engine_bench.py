@@ -0,0 +1,116 @@
+"""Benchmark dos engines de parsing: tempo e pico de memória por página
+
+Uso (a partir de src/): python -m benchmarks.parse_engine_bench [pasta_de_fixtures]
+
+Usa as páginas em benchmarks/fixtures (linkedin_*.html, gupy_*.html). As
+que estão no repositório reproduzem a marcação da busca pública do LinkedIn
+e do portal da Gupy (cards, filtros, menus, estilos inline, blobs <code> e
+__NEXT_DATA__) com empresas, IDs e URLs fictícios; páginas gravadas com
+driver.page_source podem ser colocadas na mesma pasta.
+
+No selectolax o "scope" não evita o parsing: o lexbor monta a árvore inteira
+e o scope só restringe as buscas seguintes, então o ganho dele vem do
+engine. No bs4 o SoupStrainer de fato pula o resto da página.
+"""
+import glob
+import multiprocessing
+import os
+import sys
+import timeit
+import tracemalloc
+from scrapers.parse_engine import available_engines, get_parse_engine
+from scrapers.linkedin_selenium import LinkedInSeleniumScraper
+from scrapers.gupy_selenium import GupySeleniumScraper
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), 'fixtures')
+
+# Por site: seletores dos cards, do título e subárvore usada no parsing restrito
+SITES = {
+    'linkedin': (LinkedInSeleniumScraper.job_selectors, 'h3', LinkedInSeleniumScraper.results_scope),
+    'gupy': (GupySeleniumScraper.job_selectors, 'h2', GupySeleniumScraper.results_scope),
+}
+
+
+def load_pages(fixtures_dir: str) -> dict:
+    """Páginas salvas por site (<site>_*.html)"""
+    pages = {}
+    for site in SITES:
+        paths = sorted(glob.glob(os.path.join(fixtures_dir, f'{site}_*.html')))
+        if not paths:
+            sys.exit(f"❌ Nenhuma fixture {site}_*.html em {fixtures_dir}")
+        pages[site] = [open(path, 'r', encoding='utf-8').read() for path in paths]
+    return pages
+
+
+def extract(engine, html: str, site: str, scoped: bool) -> int:
+    """Parse + extração dos títulos, como os scrapers fazem"""
+    card_selectors, title_selector, scope = SITES[site]
+    root = engine.parse(html, scope if scoped else None)
+    for selector in card_selectors:
+        cards = engine.select(root, selector)
+        if cards:
+            break
+    titles = [engine.text(found) for found in
+              (engine.select_one(card, title_selector) for card in cards) if found is not None]
+    return len(titles)
+
+
+def measure(engine_name: str, pages: dict, scoped: bool, queue):
+    """Roda em um processo separado para o pico de memória não se misturar"""
+    engine = get_parse_engine(engine_name)
+    results = {}
+    for site, site_pages in pages.items():
+        # Memória primeiro, antes de o processo já ter atingido o pico nas repetições
+        rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss if resource else 0
+        tracemalloc.start()
+        cards = sum(extract(engine, html, site, scoped) for html in site_pages)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss if resource else 0
+
+        elapsed = min(timeit.repeat(
+            lambda: [extract(engine, html, site, scoped) for html in site_pages], number=5, repeat=3
+        )) / (5 * len(site_pages))
+
+        results[site] = {
+            'cards': cards,
+            'ms': elapsed * 1000,
+            'py_peak_kb': peak / 1024,
+            'rss_growth_kb': rss_after - rss_before,  # Inclui memória do C (lxml/selectolax)
+        }
+    queue.put(results)
+
+
+def main():
+    fixtures_dir = sys.argv[1] if len(sys.argv) > 1 else FIXTURES_DIR
+    pages = load_pages(fixtures_dir)
+    for site, site_pages in pages.items():
+        size = sum(len(html) for html in site_pages) / 1024
+        print(f"📄 {site}: {len(site_pages)} página(s), {size:,.0f} KB")
+
+    context = multiprocessing.get_context('spawn')
+    baseline = {}
+    # Do mais lento ao mais rápido; o bs4 sem scope (html.parser) é a referência
+    for engine_name in reversed(available_engines()):
+        for scoped in (False, True):
+            queue = context.Queue()
+            process = context.Process(target=measure, args=(engine_name, pages, scoped, queue))
+            process.start()
+            results = queue.get()
+            process.join()
+
+            label = f"{engine_name}{' + scope' if scoped else ''}"
+            for site, values in results.items():
+                baseline.setdefault(site, values['ms'])
+                print(f"⚙️ {label:<18} {site:<9} {values['ms']:8.2f} ms/página "
+                      f"({baseline[site] / values['ms']:4.1f}x)  pico Python {values['py_peak_kb']:7,.0f} KB  "
+                      f"RSS +{values['rss_growth_kb']:,} KB  [{values['cards']} cards]")
+
+
+if __name__ == '__main__':
+    main()
@@ -11,26 +11,138 @@ TECH_KEYWORDS = ["ti", "tecnologia", "tecnológico", "tecnologica", "tecnologico
                 "programação", "programacao", "desenvolvedor", "developer", "software",
                 "dados", "data", "suporte", "infraestrutura", "redes", "devops"]
 
+# Palavras de TI procuradas nos títulos das vagas (filtro dos scrapers)
+TECH_TITLE_KEYWORDS = [
+    'ti', 't.i', 'tecnologia', 'tecnológico', 'sistema', 'informática',
+    'programação', 'desenvolvedor', 'software', 'dados', 'data',
+    'suporte', 'infraestrutura', 'redes', 'devops', 'developer',
+    'analista', 'technology', 'systems', 'it', 'dev', 'computação',
+    'programador', 'aplicação', 'aplicacoes', 'system',
+    'database', 'banco de dados', 'sql', 'frontend', 'backend',
+    'fullstack', 'mobile', 'web', 'site', 'aplicativo'
+]
+
+# Palavras que descartam a vaga (nível acima do desejado)
+EXCLUDE_KEYWORDS = ["sênior", "senior", "pleno", "especialista", "coordinator", "manager"]
+
 LOCATION = "Salvador, Bahia"
+LOCATION_KEYWORDS = ["salvador", "ssa", "bahia", "ba"]
+
+# Execução concorrente dos scrapers (um worker por site)
+CONCURRENT_SCRAPING = os.getenv('CONCURRENT_SCRAPING', 'true').lower() == 'true'
+MAX_CONCURRENT_SCRAPERS = int(os.getenv('MAX_CONCURRENT_SCRAPERS', '2'))
+
+# Coleta em camadas por site: a próxima só entra se a anterior falhar, for bloqueada ou vier quase vazia
+FETCH_TIERS = [tier.strip() for tier in os.getenv('FETCH_TIERS', 'api,http,selenium').split(',') if tier.strip()]
+TIER_MIN_RESULTS = int(os.getenv('TIER_MIN_RESULTS', '1'))  # Menos vagas que isso é resultado implausível
+TIER_CACHE_TTL = float(os.getenv('TIER_CACHE_TTL', '1800'))  # Segundos reaproveitando o resultado de uma camada
+TIER_FAILURE_COOLDOWN = float(os.getenv('TIER_FAILURE_COOLDOWN', '3600'))  # Camada que falhou fica de fora
+
+# Conexões das APIs (buscas de um site rodam em paralelo)
+API_MAX_CONNECTIONS = int(os.getenv('API_MAX_CONNECTIONS', '10'))
+API_MAX_CONCURRENCY_PER_HOST = int(os.getenv('API_MAX_CONCURRENCY_PER_HOST', '3'))
+API_MAX_PAGES = int(os.getenv('API_MAX_PAGES', '5'))  # Páginas por busca
+
+# Rate limit por host (token bucket: req/s sustentado + rajada)
+RATE_LIMITS = {
+    "default": {"rate": 0.5, "burst": 2},
+    "www.linkedin.com": {"rate": 0.25, "burst": 3},
+    "br.linkedin.com": {"rate": 0.25, "burst": 3},
+    "api.gupy.io": {"rate": 1.0, "burst": 5},
+    "portal.gupy.io": {"rate": 0.5, "burst": 3},
+    "api.infojobs.net": {"rate": 1.0, "burst": 5},
+}
+
+# Pool de drivers do Selenium (reutilizados entre buscas agendadas)
+DRIVER_POOL_SIZE = int(os.getenv('DRIVER_POOL_SIZE', '2'))
+DRIVER_MAX_PAGES = int(os.getenv('DRIVER_MAX_PAGES', '50'))  # Recicla o navegador após N páginas
+DRIVER_IDLE_TIMEOUT = int(os.getenv('DRIVER_IDLE_TIMEOUT', '14400'))  # Segundos ocioso antes de fechar
+
+# Prontidão das páginas no Selenium (cards presentes e estáveis)
+PAGE_READY_TIMEOUT = float(os.getenv('PAGE_READY_TIMEOUT', '15'))
+PAGE_STABLE_SECONDS = float(os.getenv('PAGE_STABLE_SECONDS', '1.0'))
+
+# Bloqueio de recursos no Selenium via CDP (só lemos texto)
+BLOCK_RESOURCES = os.getenv('BLOCK_RESOURCES', 'true').lower() == 'true'
+BLOCKED_RESOURCE_GROUPS = os.getenv('BLOCKED_RESOURCE_GROUPS', 'image,font,media,tracker').split(',')  # + stylesheet
+PAGE_LOAD_STRATEGY = os.getenv('PAGE_LOAD_STRATEGY', 'eager')  # eager: driver.get volta no DOMContentLoaded
+RESOURCE_REPORT = os.getenv('RESOURCE_REPORT', 'true').lower() == 'true'  # Requisições/bytes economizados por página
+
+# Extração dos cards: browser (um execute_script na página) ou html (page_source + parse)
+SELENIUM_EXTRACTION = os.getenv('SELENIUM_EXTRACTION', 'browser')
+
+# Captura do JSON das buscas no tráfego do navegador (Gupy), sem raspar o DOM
+SELENIUM_NETWORK_CAPTURE = os.getenv('SELENIUM_NETWORK_CAPTURE', 'true').lower() == 'true'
+GUPY_CAPTURE_URL = os.getenv('GUPY_CAPTURE_URL', '/api/v1/jobs')  # Trecho da URL do XHR da busca
+
+# Planejamento das buscas (sobreposição medida entre execuções)
+QUERY_STATS_PATH = os.getenv('QUERY_STATS_PATH', 'query_stats.json')
+QUERY_OVERLAP_THRESHOLD = float(os.getenv('QUERY_OVERLAP_THRESHOLD', '0.9'))  # Fração já coberta por outra busca
+QUERY_OVERLAP_MIN_RESULTS = int(os.getenv('QUERY_OVERLAP_MIN_RESULTS', '5'))  # Amostra mínima para pular
+QUERY_REPROBE_RUNS = int(os.getenv('QUERY_REPROBE_RUNS', '10'))  # Busca pulada volta a cada N execuções
+QUERY_MAX_LENGTH = int(os.getenv('QUERY_MAX_LENGTH', '200'))  # Tamanho máximo de uma busca com OR
+
+# Seletor vencedor por site/campo (testado primeiro na próxima página)
+SELECTOR_STATS_PATH = os.getenv('SELECTOR_STATS_PATH', 'selector_stats.json')
+
+# Engine de parsing do HTML: auto, selectolax, lxml ou bs4 (html.parser)
+HTML_PARSER = os.getenv('HTML_PARSER', 'auto')
+
+# Similaridade mínima (Jaccard 0-1) para considerar a mesma vaga em plataformas diferentes
+NEAR_DUPLICATE_THRESHOLD = float(os.getenv('NEAR_DUPLICATE_THRESHOLD', '0.7'))
+
+# Histórico de vagas já vistas (SQLite)
+JOBS_DB_PATH = os.getenv('JOBS_DB_PATH', 'vagas.db')
+LEGACY_JOBS_FILE = "vagas_encontradas.json"  # Importado na primeira execução
+
+# Raspagem incremental: para a paginação/rolagem numa página só com vagas já vistas
+INCREMENTAL_SCRAPING = os.getenv('INCREMENTAL_SCRAPING', 'true').lower() == 'true'
+WATERMARK_MAX_KEYS = int(os.getenv('WATERMARK_MAX_KEYS', '500'))  # Chaves lembradas por busca
+
+# Cache HTTP em disco (respostas das APIs e páginas, revalidadas com ETag/Last-Modified)
+HTTP_CACHE_PATH = os.getenv('HTTP_CACHE_PATH', 'http_cache.db')
+HTTP_CACHE_TTL = float(os.getenv('HTTP_CACHE_TTL', '900'))  # Segundos servindo sem ir à rede
+HTTP_CACHE_MAX_BYTES = int(os.getenv('HTTP_CACHE_MAX_BYTES', str(50 * 1024 * 1024)))
 
 # Horários de execução (horário de Brasília)
 SCHEDULE_TIMES = ["09:00", "12:00", "15:00", "19:00"]
 
 # Webhook do Discord
 DISCORD_WEBHOOK_URL = os.getenv('DISCORD_WEBHOOK_URL', '')
+DISCORD_MAX_RETRIES = int(os.getenv('DISCORD_MAX_RETRIES', '3'))  # Retentativas em 429
+DISCORD_POOL_SIZE = int(os.getenv('DISCORD_POOL_SIZE', '2'))  # Conexões keep-alive com o Discord
+DISCORD_CONNECT_TIMEOUT = float(os.getenv('DISCORD_CONNECT_TIMEOUT', '5'))
+DISCORD_READ_TIMEOUT = float(os.getenv('DISCORD_READ_TIMEOUT', '10'))
+
+# Fila persistente de notificações (entregue por um worker em segundo plano)
+OUTBOX_PATH = os.getenv('OUTBOX_PATH', 'notification_outbox.jsonl')
+OUTBOX_RETRY_BASE = float(os.getenv('OUTBOX_RETRY_BASE', '30'))  # Segundos, dobra a cada falha
+OUTBOX_RETRY_MAX = float(os.getenv('OUTBOX_RETRY_MAX', '1800'))
+OUTBOX_MAX_REJECTIONS = int(os.getenv('OUTBOX_MAX_REJECTIONS', '3'))  # Recusas (4xx) até a vaga sair da fila
+OUTBOX_DEAD_LETTER_PATH = os.getenv('OUTBOX_DEAD_LETTER_PATH', OUTBOX_PATH + '.dead')
+
+# Métricas no formato do Prometheus: endpoint local no modo daemon (0 desliga),
+# arquivo (textfile collector) no modo de execução única (main.py --once)
+METRICS_HOST = os.getenv('METRICS_HOST', '127.0.0.1')
+METRICS_PORT = int(os.getenv('METRICS_PORT', '9108'))
+METRICS_FILE = os.getenv('METRICS_FILE', 'metrics.prom')
+
+# Credenciais da API do InfoJobs (sem elas o site fica desabilitado)
+INFOJOBS_CLIENT_ID = os.getenv('INFOJOBS_CLIENT_ID', '')
+INFOJOBS_CLIENT_SECRET = os.getenv('INFOJOBS_CLIENT_SECRET', '')
 
-# Configurações dos sites
+# Configurações dos sites (só os habilitados têm o scraper importado)
 SITES = {
     "linkedin": {
-        "enabled": True,
+        "enabled": os.getenv('LINKEDIN_ENABLED', 'true').lower() == 'true',
         "base_url": "https://www.linkedin.com/jobs/search/",
     },
     "gupy": {
-        "enabled": True,
+        "enabled": os.getenv('GUPY_ENABLED', 'true').lower() == 'true',
         "base_url": "https://portal.gupy.io/job-search/",
     },
     "infojobs": {
-        "enabled": True,
+        "enabled": bool(INFOJOBS_CLIENT_ID and INFOJOBS_CLIENT_SECRET),
         "base_url": "https://www.infojobs.com.br/",
     }
 }
\ No newline at end of file
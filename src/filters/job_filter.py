@@ -1,13 +1,14 @@
 import re
 from datetime import datetime, timedelta
-from typing import List, Dict
+from typing import List
+from .keyword_matcher import keyword_matcher
+from models.job import JobLike
 
 class JobFilter:
     def __init__(self):
-        self.keywords = ["auxiliar", "estágio", "estagio", "assistente", "junior", "trainer", "jr"]
-        self.exclude_keywords = ["sênior", "senior", "pleno", "especialista", "coordinator", "manager"]
+        self.matcher = keyword_matcher
         
-    def filter_jobs(self, jobs: List[Dict]) -> List[Dict]:
+    def filter_jobs(self, jobs: List[JobLike]) -> List[JobLike]:
         """Filtra as vagas baseado nos critérios definidos"""
         filtered_jobs = []
         
@@ -17,18 +18,15 @@ class JobFilter:
                 
         return filtered_jobs
     
-    def _meets_criteria(self, job: Dict) -> bool:
+    def _meets_criteria(self, job: JobLike) -> bool:
         """Verifica se a vaga atende aos critérios"""
-        title = job.get('title', '').lower()
-        description = job.get('description', '').lower()
+        title = job.get('title', '')
+        description = job.get('description', '')
         
-        # Verifica se contém palavras-chave inclusivas
-        has_inclusive_keyword = any(keyword in title or keyword in description 
-                                  for keyword in self.keywords)
-        
-        # Verifica se NÃO contém palavras-chave exclusivas
-        has_exclusive_keyword = any(keyword in title or keyword in description 
-                                  for keyword in self.exclude_keywords)
+        # Uma única varredura encontra as palavras inclusivas e exclusivas
+        categories = self.matcher.scan(f"{title}\n{description}")
+        has_inclusive_keyword = 'level' in categories
+        has_exclusive_keyword = 'exclude' in categories
         
         # Verifica se é recente (últimas 24h)
         is_recent = self._is_recent(job.get('date_posted'))
@@ -0,0 +1,110 @@
+import string
+from typing import Dict, Iterable, List, Set
+from config.settings import JOB_LEVELS, TECH_TITLE_KEYWORDS, EXCLUDE_KEYWORDS, LOCATION_KEYWORDS
+
+def _build_fold_table() -> bytes:
+    """Tabela latin-1 -> ASCII minúsculo: remove acentos e troca pontuação por espaço"""
+    table = bytearray(range(256))
+    for char in string.punctuation.encode('ascii'):
+        table[char] = ord(' ')
+    for upper in range(ord('A'), ord('Z') + 1):
+        table[upper] = upper + 32
+    accented, plain = 'áàâãäéèêëíìîïóòôõöúùûüçñý', 'aaaaaeeeeiiiiooooouuuucny'
+    for char, folded in zip(accented + accented.upper() + 'ÿ', plain + plain + 'y'):
+        table[ord(char)] = ord(folded)
+    return bytes(table)
+
+
+_FOLD_TABLE = _build_fold_table()
+
+
+def tokenize(text: str) -> List[bytes]:
+    """Quebra o texto em palavras normalizadas (sem acento, sem pontuação)
+
+    Tudo roda em C (encode/translate/split); a tabela já passa para minúsculas,
+    o que evita o str.lower() (lento em texto com acentos). Pontos são
+    removidos em vez de virar espaço, então 'T.I.' vira 'ti' e 'Jr.' vira 'jr'.
+    """
+    if not text:
+        return []
+    return text.encode('latin-1', 'replace').translate(_FOLD_TABLE, b'.').split()
+
+
+def inflections(word: bytes) -> Set[bytes]:
+    """Plural e feminino da palavra normalizada (desenvolvedor -> desenvolvedora, desenvolvedores)"""
+    forms = {word, word + b's'}
+    if len(word) < 4:
+        return forms
+    if word.endswith(b'or'):
+        forms.update((word + b'a', word + b'as', word + b'es'))
+    elif word.endswith(b'ao'):
+        forms.add(word[:-2] + b'oes')
+    elif word.endswith(b'o'):
+        forms.update((word[:-1] + b'a', word[:-1] + b'as'))
+    elif word.endswith(b'r'):
+        forms.add(word + b'es')
+    return forms
+
+
+class KeywordMatcher:
+    """Compila todas as categorias de palavras-chave em um único índice
+
+    O texto é normalizado e quebrado em palavras uma única vez e as palavras
+    são cruzadas com o índice de todas as categorias juntas (interseção de
+    conjuntos). As palavras são comparadas inteiras, sem acentos e com as
+    flexões de gênero e número ('desenvolvedora', 'juniores'): 'ti' não casa
+    com 'atividades' nem 'it' com 'recruiter'.
+    """
+
+    def __init__(self, categories: Dict[str, Iterable[str]]):
+        self.words = {}
+        self.phrases = {}
+        for category, keywords in categories.items():
+            for keyword in keywords:
+                tokens = tokenize(keyword)
+                if not tokens:
+                    continue
+                if len(tokens) == 1:
+                    for form in inflections(tokens[0]):
+                        self.words.setdefault(form, set()).add(category)
+                else:
+                    phrase = b' '.join(tokens)
+                    self.phrases.setdefault(phrase, set()).add(category)
+                    self.phrases.setdefault(phrase + b's', set()).add(category)
+
+        # Expressões com várias palavras só são testadas se a primeira aparecer
+        self.phrase_heads = frozenset(phrase.split(b' ', 1)[0] for phrase in self.phrases)
+        # Palavras e inícios de expressão numa só interseção com o texto
+        self.lookup_keys = frozenset(self.words) | self.phrase_heads
+
+    def scan(self, text: str) -> Set[str]:
+        """Retorna as categorias presentes no texto"""
+        tokens = tokenize(text)
+        hits = self.lookup_keys.intersection(tokens)
+
+        found = set()
+        for word in hits:
+            categories = self.words.get(word)
+            if categories:
+                found |= categories
+
+        if self.phrases and not self.phrase_heads.isdisjoint(hits):
+            joined = b' ' + b' '.join(tokens) + b' '
+            for phrase, categories in self.phrases.items():
+                if b' ' + phrase + b' ' in joined:
+                    found |= categories
+
+        return found
+
+    def matches(self, text: str, category: str) -> bool:
+        """Verifica se o texto contém alguma palavra da categoria"""
+        return category in self.scan(text)
+
+
+# Matcher compartilhado por todos os filtros
+keyword_matcher = KeywordMatcher({
+    'level': JOB_LEVELS,
+    'tech': TECH_TITLE_KEYWORDS,
+    'exclude': EXCLUDE_KEYWORDS,
+    'location': LOCATION_KEYWORDS,
+})
\ No newline at end of file
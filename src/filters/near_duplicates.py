@@ -0,0 +1,102 @@
+import hashlib
+import random
+from typing import List, Dict, Set, Tuple
+from .keyword_matcher import tokenize
+from models.job import JobLike
+from config.settings import NEAR_DUPLICATE_THRESHOLD
+
+_MERSENNE_PRIME = (1 << 61) - 1
+
+
+class NearDuplicateDetector:
+    """Detecta a mesma vaga publicada em plataformas diferentes (MinHash + LSH)
+
+    Título, empresa e local são normalizados e quebrados em trigramas de
+    caracteres; a assinatura MinHash é dividida em bandas (LSH) e só vagas
+    que caem no mesmo balde de alguma banda são comparadas, em vez de todos
+    os pares.
+    """
+
+    def __init__(self, threshold: float = NEAR_DUPLICATE_THRESHOLD, num_perm: int = 64,
+                 cross_platform_only: bool = True):
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.cross_platform_only = cross_platform_only
+        self.bands, self.rows = self._choose_bands(threshold, num_perm)
+
+        rng = random.Random(1)
+        self.permutations = [
+            (rng.randrange(1, _MERSENNE_PRIME), rng.randrange(0, _MERSENNE_PRIME))
+            for _ in range(num_perm)
+        ]
+
+    def _choose_bands(self, threshold: float, num_perm: int) -> Tuple[int, int]:
+        """Escolhe bandas x linhas cujo limiar do LSH, (1/b)^(1/r), fica abaixo do desejado"""
+        options = [(b, num_perm // b) for b in range(1, num_perm + 1) if num_perm % b == 0]
+        # Limiar do LSH um pouco abaixo do desejado: prefere candidatos a mais do que perder pares
+        return min(options, key=lambda option: abs((1 / option[0]) ** (1 / option[1]) - (threshold - 0.1)))
+
+    def _folded(self, job: JobLike, field: str) -> bytes:
+        """Campo normalizado (o título do Job já vem normalizado)"""
+        if field == 'title' and hasattr(job, 'title_folded'):
+            return job.title_folded
+        return b' '.join(tokenize(job.get(field, '')))
+
+    def _shingles(self, job: JobLike) -> Set[int]:
+        """Trigramas de caracteres do texto normalizado da vaga"""
+        text = b' | '.join(self._folded(job, field) for field in ('title', 'company', 'location'))
+        return {
+            int.from_bytes(hashlib.blake2b(text[i:i + 3], digest_size=8).digest(), 'little')
+            for i in range(max(1, len(text) - 2))
+        }
+
+    def _signature(self, shingles: Set[int]) -> List[int]:
+        return [
+            min((a * shingle + b) % _MERSENNE_PRIME for shingle in shingles)
+            for a, b in self.permutations
+        ]
+
+    def find_duplicates(self, jobs: List[Dict]) -> Tuple[List[Dict], List[Tuple[Dict, Dict, float]]]:
+        """Retorna as vagas únicas e os pares (mantida, duplicada, similaridade)"""
+        shingles = [self._shingles(job) for job in jobs]
+        signatures = [self._signature(job_shingles) for job_shingles in shingles]
+
+        # LSH: vagas com uma banda idêntica viram candidatas
+        candidates = set()
+        for band in range(self.bands):
+            buckets = {}
+            start = band * self.rows
+            for index, signature in enumerate(signatures):
+                bucket = tuple(signature[start:start + self.rows])
+                for other in buckets.get(bucket, []):
+                    candidates.add((other, index))
+                buckets.setdefault(bucket, []).append(index)
+
+        # Confirma os candidatos com a similaridade de Jaccard exata
+        representative = list(range(len(jobs)))
+        merges = []
+        for first, second in sorted(candidates):
+            if representative[second] != second:
+                continue
+            if self.cross_platform_only and jobs[first].get('platform') == jobs[second].get('platform'):
+                continue
+
+            union = len(shingles[first] | shingles[second])
+            similarity = len(shingles[first] & shingles[second]) / union if union else 0.0
+            if similarity >= self.threshold:
+                kept = representative[first]
+                representative[second] = kept
+                merges.append((jobs[kept], jobs[second], similarity))
+
+        unique_jobs = [job for index, job in enumerate(jobs) if representative[index] == index]
+        return unique_jobs, merges
+
+    def filter_jobs(self, jobs: List[Dict]) -> List[Dict]:
+        """Remove as duplicatas entre plataformas e informa o que foi mesclado"""
+        unique_jobs, merges = self.find_duplicates(jobs)
+
+        for kept, duplicate, similarity in merges:
+            print(f"🔗 Mesclada: '{duplicate.get('title')}' ({duplicate.get('platform')}) "
+                  f"= '{kept.get('title')}' ({kept.get('platform')}) [{similarity:.0%}]")
+
+        return unique_jobs
\ No newline at end of file
@@ -1,62 +1,162 @@
-import schedule
 import time
+_STARTUP_STARTED_AT = time.perf_counter()  # Mede o import dos módulos abaixo
+
+import sys
+import schedule
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from scrapers.linkedin_selenium import LinkedInSeleniumScraper
-from scrapers.gupy_selenium import GupySeleniumScraper
+from scrapers.registry import (enabled_sites, site_tiers, browser_loaded, get_driver_pool,
+                               report_import_timings)
+from scrapers.tiered_fetcher import TieredFetcher
+from scrapers.selector_strategy import selector_strategy
+from scrapers.query_planner import query_stats
+from scrapers.resource_blocker import resource_savings
+from utils.http_cache import get_http_cache
 from filters.job_filter import JobFilter
-from utils.helpers import save_jobs_to_file, load_previous_jobs, get_new_jobs
+from filters.near_duplicates import NearDuplicateDetector
+from utils.helpers import save_jobs_to_file, get_new_jobs
 from utils.discord_notifier import DiscordNotifier
-from config.settings import JOB_LEVELS, TECH_KEYWORDS, LOCATION, SCHEDULE_TIMES
+from utils.outbox import NotificationOutbox
+from utils.rate_limiter import rate_limiter
+from utils.job_ids import assign_job_keys
+from utils.watermarks import watermarks
+from utils.metrics import metrics, JOBS_STAGE, JOBS_LAST_RUN, DEDUP_HITS, RUN_SECONDS, LAST_RUN_TIMESTAMP
+from config.settings import (JOB_LEVELS, LOCATION, SCHEDULE_TIMES,
+                             CONCURRENT_SCRAPING, MAX_CONCURRENT_SCRAPERS,
+                             METRICS_HOST, METRICS_PORT, METRICS_FILE, OUTBOX_PATH, JOBS_DB_PATH)
+
+_STARTUP_SECONDS = time.perf_counter() - _STARTUP_STARTED_AT
 
 class VagasTIBot:
     def __init__(self):
-        # Usa Selenium para ambos (mais confiável)
-        self.scrapers = {
-            'linkedin': LinkedInSeleniumScraper(),
-            'gupy': GupySeleniumScraper(),
-        }
+        # Sites habilitados em SITES; API primeiro, HTTP e Selenium só quando a camada anterior falha
+        self.scrapers = {site: TieredFetcher(site, site_tiers(site)) for site in enabled_sites()}
         self.filter = JobFilter()
+        self.near_duplicates = NearDuplicateDetector()
         self.notifier = DiscordNotifier()
+        self.outbox = NotificationOutbox(self.notifier)
         
     def run_search(self):
-        """Executa busca usando Selenium"""
-        print(f"🚀 Iniciando busca Selenium às {datetime.now().strftime('%d/%m/%Y %H:%M:%S')}")
+        """Executa a busca em todos os sites"""
+        print(f"🚀 Iniciando busca às {datetime.now().strftime('%d/%m/%Y %H:%M:%S')}")
         
-        all_jobs = []
+        started_at = time.time()
         
-        for site_name, scraper in self.scrapers.items():
-            print(f"🔍 Buscando vagas no {site_name.capitalize()} (Selenium)...")
-            try:
-                jobs = scraper.scrape_jobs(JOB_LEVELS, TECH_KEYWORDS, LOCATION)
-                all_jobs.extend(jobs)
-                print(f"✅ {len(jobs)} vagas encontradas no {site_name.capitalize()}")
-            except Exception as e:
-                print(f"❌ Erro no {site_name.capitalize()}: {e}")
+        if CONCURRENT_SCRAPING and len(self.scrapers) > 1:
+            all_jobs = self._scrape_concurrently()
+        else:
+            all_jobs = self._scrape_sequentially()
+        
+        print(f"⏱️ Coleta concluída em {time.time() - started_at:.1f}s")
+        RUN_SECONDS.observe(time.time() - started_at, phase='scrape')
+        report_import_timings()
+        print("🧱 Camadas: " + ', '.join(
+            f"{site_name.capitalize()} = {fetcher.last_tier or 'nenhuma'}"
+            for site_name, fetcher in self.scrapers.items()
+        ))
+        rate_limiter.report()
+        resource_savings.report()
+        selector_strategy.save()
+        query_stats.save()
+        get_http_cache().report()
+        assign_job_keys(all_jobs)
+        self._record_stage('scraped', all_jobs)
         
         # Resto do processo...
         filtered_jobs = self.filter.filter_jobs(all_jobs)
         print(f"📊 {len(filtered_jobs)} vagas após filtro")
+        self._record_stage('filtered', filtered_jobs)
         
-        previous_jobs = load_previous_jobs()
-        new_jobs = get_new_jobs(filtered_jobs, previous_jobs)
+        # Mesma vaga publicada em mais de uma plataforma
+        unique_jobs = self.near_duplicates.filter_jobs(filtered_jobs)
+        if len(unique_jobs) < len(filtered_jobs):
+            print(f"🔗 {len(filtered_jobs) - len(unique_jobs)} duplicatas entre plataformas removidas")
+        DEDUP_HITS.inc(len(filtered_jobs) - len(unique_jobs), kind='near_duplicate')
+        self._record_stage('unique', unique_jobs)
         
+        new_jobs = get_new_jobs(unique_jobs)
+        DEDUP_HITS.inc(len(unique_jobs) - len(new_jobs), kind='seen_before')
+        self._record_stage('new', new_jobs)
+        
+        # Grava as novas na fila persistente antes de marcá-las como vistas
+        if new_jobs:
+            queued = self.outbox.enqueue(new_jobs)
+            print(f"🎉 {len(new_jobs)} NOVAS VAGAS! {queued} na fila para o Discord...")
+        
+        # Salva também as duplicatas para não voltarem como novas
         if filtered_jobs:
             save_jobs_to_file(filtered_jobs)
         
-        if new_jobs:
-            print(f"🎉 {len(new_jobs)} NOVAS VAGAS! Enviando para Discord...")
-            self.notifier.send_jobs(new_jobs)
-        else:
+        # Só agora as buscas avançam a posição (uma falha antes disso refaz tudo)
+        watermarks.commit()
+        
+        if not new_jobs:
             print("📭 Nenhuma vaga nova encontrada.")
             self.notifier.send_jobs([])
         
+        RUN_SECONDS.observe(time.time() - started_at, phase='total')
+        LAST_RUN_TIMESTAMP.set(time.time())
         print("=" * 60)
     
+    def _record_stage(self, stage: str, jobs: list):
+        """Vagas por site que chegaram à etapa (total acumulado e valor da última execução)"""
+        per_site = Counter((job.get('platform') or 'desconhecido').lower() for job in jobs)
+        for site in set(self.scrapers) | set(per_site):
+            JOBS_STAGE.inc(per_site[site], site=site, stage=stage)
+            JOBS_LAST_RUN.set(per_site[site], site=site, stage=stage)
+    
+    def _scrape_site(self, site_name: str, fetcher) -> list:
+        """Executa a coleta em camadas de um site (erros ficam isolados por site)"""
+        print(f"🔍 Buscando vagas no {site_name.capitalize()}...")
+        try:
+            jobs = fetcher.fetch()
+            print(f"✅ {len(jobs)} vagas encontradas no {site_name.capitalize()} "
+                  f"(camada: {fetcher.last_tier or 'nenhuma'})")
+            return jobs
+        except Exception as e:
+            print(f"❌ Erro no {site_name.capitalize()}: {e}")
+            return []
+    
+    def _scrape_sequentially(self) -> list:
+        """Executa os scrapers um após o outro"""
+        all_jobs = []
+        for site_name, scraper in self.scrapers.items():
+            all_jobs.extend(self._scrape_site(site_name, scraper))
+        return all_jobs
+    
+    def _scrape_concurrently(self) -> list:
+        """Executa cada scraper em seu próprio worker e junta os resultados conforme terminam"""
+        all_jobs = []
+        max_workers = max(1, min(MAX_CONCURRENT_SCRAPERS, len(self.scrapers)))
+        
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='scraper') as executor:
+            futures = {
+                executor.submit(self._scrape_site, site_name, scraper): site_name
+                for site_name, scraper in self.scrapers.items()
+            }
+            for future in as_completed(futures):
+                site_name = futures[future]
+                try:
+                    all_jobs.extend(future.result())
+                except Exception as e:
+                    print(f"❌ Erro no worker do {site_name.capitalize()}: {e}")
+        
+        return all_jobs
+    
     def setup_scheduler(self):
         """Configura o agendador"""
         for schedule_time in SCHEDULE_TIMES:
             schedule.every().day.at(schedule_time).do(self.run_search)
             print(f"⏰ Agendada busca às {schedule_time} (horário de Brasília)")
+        
+        # Fecha navegadores ociosos demais entre as buscas
+        schedule.every(30).minutes.do(self._evict_idle_drivers)
+    
+    def _evict_idle_drivers(self):
+        """Só mexe no pool se o Selenium chegou a ser usado"""
+        if browser_loaded():
+            get_driver_pool().evict_idle()
     
     def run(self):
         """Executa o bot"""
@@ -65,18 +165,59 @@ class VagasTIBot:
         print(f"🎯 Níveis: {', '.join(JOB_LEVELS)}")
         print(f"🔧 Área: TI/Technology")
         print(f"⏰ Horários: {', '.join(SCHEDULE_TIMES)}")
+        print(f"🌐 Sites: {', '.join(self.scrapers) or 'nenhum habilitado'}")
+        report_import_timings(_STARTUP_SECONDS)
         print("=" * 60)
         
+        # Só aquece o navegador se o Selenium for a primeira camada de algum site
+        browser_sites = [fetcher for fetcher in self.scrapers.values() if fetcher.needs_browser]
+        if browser_sites:
+            get_driver_pool().warm_up(len(browser_sites))
+        
+        # Worker que entrega as notificações em segundo plano
+        self.outbox.start()
+        metrics.serve(METRICS_PORT, METRICS_HOST)
+        
         # Busca imediata
         self.run_search()
         
         # Agendador
         self.setup_scheduler()
         
-        while True:
-            schedule.run_pending()
-            time.sleep(60)
+        try:
+            while True:
+                schedule.run_pending()
+                time.sleep(60)
+        finally:
+            self.outbox.stop()
+            self.notifier.close()
+            metrics.shutdown()
+            if browser_loaded():
+                get_driver_pool().shutdown()
+    
+    def run_once(self):
+        """Uma busca só (cron/GitHub Actions): entrega a fila e grava as métricas em arquivo
+        
+        A fila (OUTBOX_PATH) e o histórico (JOBS_DB_PATH) só valem entre
+        execuções se o ambiente guardar esses arquivos (ex.: cache do Actions);
+        num runner novo o que não foi entregue se perde.
+        """
+        print(f"🌐 Sites: {', '.join(self.scrapers) or 'nenhum habilitado'}")
+        report_import_timings(_STARTUP_SECONDS)
+        try:
+            self.run_search()
+            if not self.outbox.drain():
+                print(f"📬 {len(self.outbox.pending)} notificações não entregues ficam em {OUTBOX_PATH}; "
+                      f"só serão reenviadas se esse arquivo e {JOBS_DB_PATH} forem mantidos até a próxima execução")
+        finally:
+            self.notifier.close()
+            if browser_loaded():
+                get_driver_pool().shutdown()
+            metrics.dump(METRICS_FILE)
 
 if __name__ == "__main__":
     bot = VagasTIBot()
-    bot.run()
\ No newline at end of file
+    if '--once' in sys.argv[1:]:
+        bot.run_once()
+    else:
+        bot.run()
\ No newline at end of file
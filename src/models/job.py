@@ -0,0 +1,153 @@
+import re
+import sys
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Union
+from filters.keyword_matcher import tokenize
+from utils.job_ids import job_key
+
+# Campos da vaga na ordem em que vão para o dict/JSON
+FIELDS = ('title', 'company', 'location', 'date_posted', 'platform', 'url', 'description', 'job_id', 'job_key')
+_FIELD_SET = frozenset(FIELDS)
+
+
+# Vaga em qualquer das duas formas (scrapers ainda devolvem dicts)
+JobLike = Union['Job', Dict]
+
+
+_RELATIVE_DATE = re.compile(r'(\d+)\s*(minutos?|min|minutes?|horas?|hours?|h|dias?|days?|d|semanas?|weeks?)\b')
+_RELATIVE_UNITS = {'min': 'minutes', 'hor': 'hours', 'hou': 'hours', 'h': 'hours', 'dia': 'days', 'day': 'days',
+                   'd': 'days', 'sem': 'weeks', 'wee': 'weeks'}
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def parse_posting_time(date_posted: str, now: datetime = None) -> Optional[datetime]:
+    """Data de publicação: ISO ('2024-01-05', '2024-01-05T10:00:00Z') ou relativa ('há 3 horas')"""
+    if not date_posted:
+        return None
+    text = str(date_posted).strip()
+    try:
+        parsed = datetime.fromisoformat(text.replace('Z', '+00:00'))
+        return parsed if parsed.tzinfo is None else parsed.astimezone().replace(tzinfo=None)
+    except ValueError:
+        pass
+
+    match = _RELATIVE_DATE.search(text.lower())
+    if not match:
+        return None
+    unit = match.group(2)
+    unit = _RELATIVE_UNITS.get(unit[:3], _RELATIVE_UNITS.get(unit[:1]))
+    return (now or datetime.now()) - timedelta(**{unit: int(match.group(1))})
+
+
+class Job:
+    """Vaga com campos fixos (__slots__), no lugar do dict montado por cada scraper
+
+    Plataforma, local e empresa são internados (as mesmas poucas strings se
+    repetem em todas as vagas) e o título normalizado (usado na detecção de
+    duplicatas), a data de publicação (usada nos watermarks) e a chave
+    canônica são calculados uma vez só. get/[]/in continuam funcionando como
+    no dict, então filtros e notificador aceitam os dois.
+    """
+
+    __slots__ = FIELDS + ('title_folded', 'posted_at', 'extra')
+
+    def __init__(self, title: str = '', company: str = None, location: str = None, date_posted: str = None,
+                 platform: str = None, url: str = None, description: str = None, job_id: str = None,
+                 job_key: str = None, extra: Dict = None):
+        self.title = title or ''
+        self.company = _intern(company)
+        self.location = _intern(location)
+        self.date_posted = _intern(date_posted)
+        self.platform = _intern(platform)
+        self.url = url
+        self.description = description
+        self.job_id = str(job_id) if job_id is not None else None
+        self.extra = extra or None  # Campos fora do padrão (raros)
+
+        self.title_folded = b' '.join(tokenize(self.title))
+        self.posted_at = parse_posting_time(self.date_posted)
+        self.job_key = job_key or _key_of(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'Job':
+        known = {name: data[name] for name in FIELDS if name in data}
+        extra = {name: value for name, value in data.items() if name not in known}
+        return cls(extra=extra, **known)
+
+    @classmethod
+    def coerce(cls, job: Union['Job', Dict]) -> 'Job':
+        """Job a partir de um Job ou dict (na entrada do pipeline)"""
+        return job if isinstance(job, cls) else cls.from_dict(job)
+
+    def to_dict(self) -> Dict:
+        """Dict para JSON/banco (sem os campos derivados; None fica de fora)"""
+        data = {name: getattr(self, name) for name in FIELDS if getattr(self, name) is not None}
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+    # Compatibilidade com o acesso de dict dos consumidores
+    def get(self, name: str, default=None):
+        if name in _FIELD_SET:
+            value = getattr(self, name)
+        elif self.extra:
+            value = self.extra.get(name)
+        else:
+            value = None
+        return default if value is None else value
+
+    def __getitem__(self, name: str):
+        """Campo vazio devolve None; só nome desconhecido levanta KeyError"""
+        if name in _FIELD_SET:
+            return getattr(self, name)
+        if self.extra and name in self.extra:
+            return self.extra[name]
+        raise KeyError(name)
+
+    def __setitem__(self, name: str, value):
+        if name in _FIELD_SET:
+            setattr(self, name, value)
+        else:
+            self.extra = dict(self.extra or {}, **{name: value})
+
+    def __contains__(self, name: str) -> bool:
+        return self.get(name) is not None
+
+    def __repr__(self) -> str:
+        return f"Job({self.platform}: {self.title!r} @ {self.company})"
+
+
+class _FieldView:
+    """Visão mínima de dict para calcular a chave antes do job_key existir"""
+
+    __slots__ = ('job',)
+
+    def __init__(self, job: Job):
+        self.job = job
+
+    def get(self, name: str, default=None):
+        return getattr(self.job, name, default) if name in _FIELD_SET else default
+
+
+def _key_of(job: Job) -> str:
+    return job_key(_FieldView(job))
+
+
+def posting_time(job: JobLike) -> Optional[datetime]:
+    """Data de publicação já calculada no Job (num dict, é parseada na hora)"""
+    if isinstance(job, Job):
+        return job.posted_at
+    return parse_posting_time(job.get('date_posted'))
+
+
+def to_jobs(jobs: Iterable[Union[Job, Dict]]) -> List[Job]:
+    """Converte a saída dos scrapers (dicts) em Jobs"""
+    return [Job.coerce(job) for job in jobs if job]
+
+
+def job_to_dict(job: Union[Job, Dict]) -> Dict:
+    """Dict serializável de um Job ou dict (na saída: banco, fila, JSON)"""
+    return job.to_dict() if isinstance(job, Job) else job
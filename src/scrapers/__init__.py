@@ -1,4 +1,15 @@
-from .linkedin_scraper import LinkedInScraper
-from .gupy_scraper import GupyScraper
+import importlib
 
-__all__ = ['LinkedInScraper', 'GupyScraper']
\ No newline at end of file
+# Importados sob demanda: "from scrapers import X" não carrega o Selenium de todos os scrapers
+_LAZY_EXPORTS = {
+    'LinkedInScraper': '.linkedin_scraper',
+    'GupyScraper': '.gupy_scraper',
+}
+
+__all__ = ['LinkedInScraper', 'GupyScraper']
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        return getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
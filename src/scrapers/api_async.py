@@ -0,0 +1,164 @@
+import asyncio
+import json
+import time
+from typing import List, Dict, Callable, Awaitable, AsyncIterator, Optional
+from urllib.parse import urlparse
+import aiohttp
+from .api_base import ApiBaseScraper, BLOCKED_STATUSES
+from .query_planner import QueryPlanner
+from utils.rate_limiter import rate_limiter
+from utils.http_cache import get_http_cache
+from utils.metrics import observe_request, count_page, count_error
+from utils.watermarks import Watermark
+from config.settings import API_MAX_CONNECTIONS, API_MAX_CONCURRENCY_PER_HOST, API_MAX_PAGES
+
+class AsyncApiBaseScraper(ApiBaseScraper):
+    """Base assíncrona: executa todas as buscas de um site em paralelo"""
+
+    def __init__(self):
+        super().__init__()
+        self.http = None
+        self._host_semaphores = {}
+
+    def run_queries(self, queries: List[str], search: Callable[[str], Awaitable[List[Dict]]],
+                    planner: QueryPlanner = None) -> List[Dict]:
+        """Executa as buscas em paralelo a partir de código síncrono"""
+        return asyncio.run(self._run_queries(queries, search, planner))
+
+    async def _run_queries(self, queries: List[str], search: Callable[[str], Awaitable[List[Dict]]],
+                           planner: QueryPlanner = None) -> List[Dict]:
+        """Dispara as buscas sobre um único pool de conexões"""
+        connector = aiohttp.TCPConnector(
+            limit=API_MAX_CONNECTIONS,
+            limit_per_host=API_MAX_CONCURRENCY_PER_HOST
+        )
+        timeout = aiohttp.ClientTimeout(total=30)
+
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout,
+                                         headers=dict(self.session.headers)) as http:
+            self.http = http
+            self._host_semaphores = {}
+            durations = {}
+
+            async def timed_search(query: str):
+                started_at = time.perf_counter()
+                try:
+                    return await search(query)
+                finally:
+                    durations[query] = time.perf_counter() - started_at
+
+            try:
+                results = await asyncio.gather(
+                    *(timed_search(query) for query in queries),
+                    return_exceptions=True
+                )
+            finally:
+                self.http = None
+
+        all_jobs = []
+        for query, result in zip(queries, results):
+            if isinstance(result, Exception):
+                print(f"❌ Erro na busca '{query}': {result}")
+            elif result:
+                all_jobs.extend(result)
+                if planner:
+                    planner.record(query, result, durations.get(query))
+                print(f"✅ {len(result)} vagas encontradas para '{query}'")
+            else:
+                print(f"❌ Nenhuma vaga encontrada para '{query}'")
+                if planner:
+                    planner.record(query, [], durations.get(query))
+
+        return all_jobs
+
+    async def paginate(self, fetch_page: Callable[[int], Awaitable[Optional[List[Dict]]]],
+                       page_size: int, max_pages: int = None,
+                       watermark: Watermark = None) -> AsyncIterator[Dict]:
+        """Gera as vagas página por página, já buscando a próxima página em paralelo
+        
+        Para quando uma página vem incompleta, ao atingir max_pages, quando o
+        consumidor para de iterar ou numa página só com vagas já vistas em
+        execuções anteriores (watermark).
+        """
+        max_pages = max_pages or API_MAX_PAGES
+        next_page = asyncio.ensure_future(fetch_page(0))
+
+        try:
+            for page in range(max_pages):
+                jobs = await next_page
+                next_page = None
+                if not jobs:
+                    return
+
+                # Página só com vagas já vistas: as próximas também são antigas
+                already_seen = watermark is not None and watermark.page_is_seen(jobs)
+                if watermark is not None:
+                    watermark.observe(jobs)
+
+                # Prefetch: a próxima página baixa enquanto esta é consumida
+                is_full_page = len(jobs) >= page_size
+                if is_full_page and not already_seen and page + 1 < max_pages:
+                    next_page = asyncio.ensure_future(fetch_page(page + 1))
+
+                for job in jobs:
+                    yield job
+
+                if already_seen:
+                    print(f"⏹️ '{watermark.query}': página {page + 1} só com vagas já vistas, parando")
+                    return
+                if not is_full_page:
+                    return
+        finally:
+            if next_page is not None and not next_page.done():
+                next_page.cancel()
+
+    async def fetch_async(self, url: str, params: dict = None, headers: dict = None, as_json: bool = True):
+        """Faz requisição assíncrona respeitando o limite de concorrência por host"""
+        host = urlparse(url).netloc
+        semaphore = self._host_semaphores.setdefault(host, asyncio.Semaphore(API_MAX_CONCURRENCY_PER_HOST))
+
+        # Rotaciona User-Agent
+        request_headers = dict(headers) if headers else {}
+        request_headers['User-Agent'] = self.ua.random
+
+        # Resposta recente no cache: nem vai à rede
+        cache = get_http_cache()
+        cached = cache.lookup(url, params)
+        if cache.is_fresh(cached):
+            count_page(url, 'cache')
+            return cached.json() if as_json else cached.text()
+        request_headers.update(cache.conditional_headers(cached))
+
+        async with semaphore:
+            try:
+                # Aguarda o rate limiter do host
+                await rate_limiter.acquire_async(url)
+
+                started_at = time.perf_counter()
+                async with self.http.get(url, params=params, headers=request_headers) as response:
+                    observe_request(url, response.status, time.perf_counter() - started_at)
+                    rate_limiter.feedback(url, response.status, response.headers.get('Retry-After'))
+
+                    if response.status == 304 and cached is not None:
+                        count_page(url, 'revalidated')
+                        cached = cache.revalidated(cached)
+                        return cached.json() if as_json else cached.text()
+
+                    if response.status == 200:
+                        body = await response.read()
+                        cache.store(url, params, response.headers, body)
+                        count_page(url, 'network')
+                        if as_json:
+                            return json.loads(body)
+                        return body.decode(response.get_encoding(), 'replace')
+
+                    print(f"❌ API retornou status {response.status} para {url}")
+                    if response.status in BLOCKED_STATUSES:
+                        self.blocked = True
+                    count_error(url, 'blocked' if response.status in BLOCKED_STATUSES else 'status')
+                    return None
+
+            except Exception as e:
+                print(f"❌ Erro na requisição API: {e}")
+                count_error(url, 'error')
+                return None
\ No newline at end of file
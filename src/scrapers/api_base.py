@@ -1,13 +1,23 @@
-import requests
 import time
-import random
+import requests
 from typing import List, Dict
 from fake_useragent import UserAgent
+from utils.rate_limiter import rate_limiter
+from utils.http_cache import get_http_cache
+from utils.metrics import observe_request, count_page, count_error
+from filters.keyword_matcher import keyword_matcher
+from .parse_engine import get_parse_engine
+
+# Status que indicam bloqueio (999 é a resposta anti-bot do LinkedIn)
+BLOCKED_STATUSES = (401, 403, 429, 999)
 
 class ApiBaseScraper:
     def __init__(self):
         self.ua = UserAgent()
         self.session = requests.Session()
+        self.last_wait = 0.0
+        self.blocked = False
+        self.parser = get_parse_engine()
         self.setup_session()
     
     def setup_session(self):
@@ -26,57 +36,61 @@ class ApiBaseScraper:
     def make_api_request(self, url: str, params: dict = None, headers: dict = None) -> dict:
         """Faz requisição para API com tratamento de erro"""
         try:
-            # Delay entre requests
-            time.sleep(random.uniform(1, 3))
+            # Resposta recente no cache: nem vai à rede
+            cache = get_http_cache()
+            cached = cache.lookup(url, params)
+            if cache.is_fresh(cached):
+                count_page(url, 'cache')
+                return cached.json()
+            
+            # Aguarda o rate limiter do host
+            self.last_wait = rate_limiter.acquire(url)
             
             # Rotaciona User-Agent
             if headers:
                 headers['User-Agent'] = self.ua.random
             else:
                 headers = {'User-Agent': self.ua.random}
+            headers.update(cache.conditional_headers(cached))
             
+            started_at = time.perf_counter()
             response = self.session.get(
                 url, 
                 params=params, 
                 headers=headers,
                 timeout=30
             )
+            observe_request(url, response.status_code, time.perf_counter() - started_at)
+            rate_limiter.feedback(url, response.status_code, response.headers.get('Retry-After'))
+            
+            if response.status_code == 304 and cached is not None:
+                count_page(url, 'revalidated')
+                return cache.revalidated(cached).json()
             
             if response.status_code == 200:
+                cache.store(url, params, response.headers, response.content)
+                count_page(url, 'network')
                 return response.json()
             else:
                 print(f"❌ API retornou status {response.status_code} para {url}")
+                if response.status_code in BLOCKED_STATUSES:
+                    self.blocked = True
+                count_error(url, 'blocked' if response.status_code in BLOCKED_STATUSES else 'status')
                 return None
                 
         except Exception as e:
             print(f"❌ Erro na requisição API: {e}")
+            count_error(url, 'error')
             return None
     
     def filter_tech_jobs(self, jobs: List[Dict]) -> List[Dict]:
         """Filtra vagas de TI"""
-        tech_keywords = [
-            'ti', 't.i', 'tecnologia', 'tecnológico', 'sistema', 'informática',
-            'programação', 'desenvolvedor', 'software', 'dados', 'data',
-            'suporte', 'infraestrutura', 'redes', 'devops', 'developer',
-            'analista', 'technology', 'systems', 'it', 'dev', 'computação',
-            'programador', 'software', 'aplicação', 'aplicacoes', 'system',
-            'database', 'banco de dados', 'sql', 'frontend', 'backend',
-            'fullstack', 'mobile', 'web', 'site', 'aplicativo'
-        ]
-        
         filtered_jobs = []
         for job in jobs:
-            title = job.get('title', '').lower()
-            description = job.get('description', '').lower()
-            
-            # Verifica se é vaga de TI
-            is_tech_job = any(keyword in title for keyword in tech_keywords)
-            
-            # Verifica nível (estágio, junior, etc.)
-            levels = ['estágio', 'estagio', 'junior', 'jr', 'assistente', 'auxiliar', 'trainer']
-            is_desired_level = any(level in title for level in levels)
+            categories = keyword_matcher.scan(job.get('title', ''))
             
-            if is_tech_job and is_desired_level:
+            # Vaga de TI e no nível desejado (estágio, junior, etc.)
+            if 'tech' in categories and 'level' in categories:
                 filtered_jobs.append(job)
         
         return filtered_jobs
\ No newline at end of file
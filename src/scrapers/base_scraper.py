@@ -1,13 +1,22 @@
 from abc import ABC, abstractmethod
-import requests
-from bs4 import BeautifulSoup
+import json
 import time
-import random
+import requests
 import cloudscraper
+from typing import Dict
 from fake_useragent import UserAgent
 from urllib.parse import urlencode
+from utils.rate_limiter import rate_limiter
+from utils.http_cache import get_http_cache
+from utils.metrics import observe_request, count_page, count_error
+from .api_base import BLOCKED_STATUSES
+from .parse_engine import get_parse_engine
+from .selector_strategy import selector_strategy
 
 class BaseScraper(ABC):
+    # Nome do site nas estatísticas de seletores (None desativa a ordem adaptativa)
+    site = None
+    
     def __init__(self):
         self.ua = UserAgent()
         self.scraper = cloudscraper.create_scraper(
@@ -17,6 +26,9 @@ class BaseScraper(ABC):
                 'mobile': False
             }
         )
+        self.last_wait = 0.0
+        self.blocked = False
+        self.parser = get_parse_engine()
         self.setup_headers()
     
     def setup_headers(self):
@@ -40,28 +52,75 @@ class BaseScraper(ABC):
     def scrape_jobs(self) -> list:
         pass
     
-    def make_request(self, url: str, params: dict = None) -> BeautifulSoup:
-        """Faz requisição com proteção anti-bot"""
+    def make_request(self, url: str, params: dict = None, scope=None):
+        """Faz requisição com proteção anti-bot (scope limita o parsing à lista de vagas)"""
+        body = self._fetch(url, params)
+        return self.parser.parse(body, scope) if body is not None else None
+    
+    def make_json_request(self, url: str, params: dict = None, headers: dict = None):
+        """Mesma requisição anti-bot (cloudscraper) para endpoints JSON"""
+        body = self._fetch(url, params, headers, check_blocked=False)
+        if body is None:
+            return None
+        try:
+            return json.loads(body)
+        except ValueError as e:
+            print(f"❌ Resposta não é JSON em {url}: {e}")
+            return None
+    
+    def _fetch(self, url: str, params: dict = None, headers: dict = None, check_blocked: bool = True):
+        """Corpo da resposta (cache, rate limiter e detecção de bloqueio); None se falhar"""
         try:
-            # Delay humanoide entre requests
-            time.sleep(random.uniform(2, 5))
+            # Página recente no cache: nem vai à rede
+            cache = get_http_cache()
+            cached = cache.lookup(url, params)
+            if cache.is_fresh(cached):
+                count_page(url, 'cache')
+                return cached.body
+            
+            # Aguarda o rate limiter do host
+            self.last_wait = rate_limiter.acquire(url)
             
             # Rotação de User-Agent
             self.headers['User-Agent'] = self.ua.random
             self.scraper.headers.update(self.headers)
             
-            response = self.scraper.get(url, params=params, timeout=30)
+            request_headers = dict(headers or {})
+            request_headers.update(cache.conditional_headers(cached))
+            started_at = time.perf_counter()
+            response = self.scraper.get(url, params=params, timeout=30, headers=request_headers)
+            observe_request(url, response.status_code, time.perf_counter() - started_at)
+            rate_limiter.feedback(url, response.status_code, response.headers.get('Retry-After'))
+            
+            if response.status_code == 304 and cached is not None:
+                count_page(url, 'revalidated')
+                return cache.revalidated(cached).body
+            
+            # Status de bloqueio (403/429/999) não é erro comum: a camada deve esfriar
+            if response.status_code in BLOCKED_STATUSES:
+                print(f"❌ Site bloqueou o acesso (status {response.status_code}) em {url}")
+                self.blocked = True
+                if response.status_code != 429:  # 429 já foi penalizado pelo feedback
+                    rate_limiter.penalize(url)
+                count_error(url, 'blocked')
+                return None
             response.raise_for_status()
             
             # Verifica se não foi bloqueado
-            if self._is_blocked(response.text):
+            if check_blocked and self._is_blocked(response.text):
                 print("❌ Site bloqueou o acesso. Tentando contornar...")
+                self.blocked = True
+                rate_limiter.penalize(url)
+                count_error(url, 'blocked')
                 return None
                 
-            return BeautifulSoup(response.content, 'html.parser')
+            cache.store(url, params, response.headers, response.content)
+            count_page(url, 'network')
+            return response.content
             
         except Exception as e:
             print(f"❌ Erro na requisição para {url}: {e}")
+            count_error(url, 'error')
             return None
     
     def _is_blocked(self, html: str) -> bool:
@@ -73,31 +132,60 @@ class BaseScraper(ABC):
         html_lower = html.lower()
         return any(indicator in html_lower for indicator in blocked_indicators)
     
-    def smart_find_element(self, soup: BeautifulSoup, selectors: list):
-        """Tenta múltiplos seletores até encontrar o elemento"""
-        for selector in selectors:
-            element = soup.select_one(selector)
-            if element:
+    def smart_find_element(self, root, selectors: list, field: str = None, hits: Dict = None):
+        """Tenta múltiplos seletores (vencedor anterior primeiro) até encontrar o elemento
+        
+        Ao buscar o campo card a card, passe o mesmo dict hits para a página
+        inteira e chame record_selector_hits uma vez no fim: assim um card
+        fora do padrão não troca sozinho o seletor vencedor.
+        """
+        for selector in self._ordered_selectors(field, selectors):
+            element = self.parser.select_one(root, selector)
+            if element is not None:
+                self._count_selector(field, selector, 1, hits)
                 return element
         return None
     
-    def smart_find_all(self, soup: BeautifulSoup, selectors: list):
-        """Tenta múltiplos seletores até encontrar elementos"""
-        for selector in selectors:
-            elements = soup.select(selector)
+    def smart_find_all(self, root, selectors: list, field: str = 'cards', hits: Dict = None):
+        """Tenta múltiplos seletores (vencedor anterior primeiro) até encontrar elementos"""
+        for selector in self._ordered_selectors(field, selectors):
+            elements = self.parser.select(root, selector)
             if elements:
+                self._count_selector(field, selector, len(elements), hits)
                 return elements
         return []
     
+    def _ordered_selectors(self, field: str, selectors: list) -> list:
+        if not (self.site and field):
+            return list(selectors)
+        return selector_strategy.order(self.site, field, selectors)
+    
+    def _count_selector(self, field: str, selector: str, count: int, hits: Dict = None):
+        """Soma o acerto em hits (página em andamento) ou registra na hora"""
+        if not field:
+            return
+        if hits is None:
+            self.record_selector_hits({field: {selector: count}})
+            return
+        field_hits = hits.setdefault(field, {})
+        field_hits[selector] = field_hits.get(selector, 0) + count
+    
+    def record_selector_hits(self, hits: Dict[str, Dict[str, int]]):
+        """Registra quais seletores casaram em cada campo nesta página"""
+        if not self.site:
+            return
+        for field, field_hits in hits.items():
+            selector_strategy.record(self.site, field, field_hits)
+    
     def extract_text_safe(self, element, default="N/A"):
         """Extrai texto com segurança"""
-        if element:
-            text = element.get_text(strip=True)
+        if element is not None:
+            text = self.parser.text(element)
             return text if text else default
         return default
     
     def extract_attr_safe(self, element, attr, default="N/A"):
         """Extrai atributo com segurança"""
-        if element and element.get(attr):
-            return element.get(attr)
+        if element is not None and self.parser.attr(element, attr):
+            return self.parser.attr(element, attr)
         return default
\ No newline at end of file
@@ -0,0 +1,157 @@
+import threading
+import time
+from typing import Callable, List, Optional
+
+
+class PooledDriver:
+    """Driver do pool com os dados de ciclo de vida"""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.created_at = time.time()
+        self.last_used = self.created_at
+        self.pages_served = 0
+
+
+class DriverPool:
+    """Pool de ChromeDrivers reutilizados entre buscas agendadas"""
+
+    def __init__(self, factory: Callable, max_size: int = 2, max_pages: int = 50,
+                 idle_timeout: float = 14400, acquire_timeout: float = 300):
+        self.factory = factory
+        self.max_size = max(1, max_size)
+        self.max_pages = max_pages
+        self.idle_timeout = idle_timeout
+        self.acquire_timeout = acquire_timeout
+        self._idle: List[PooledDriver] = []
+        self._in_use = 0
+        self._condition = threading.Condition()
+
+    def acquire(self) -> Optional[PooledDriver]:
+        """Retira um driver saudável do pool (cria um novo se houver espaço)"""
+        deadline = time.time() + self.acquire_timeout
+
+        with self._condition:
+            while True:
+                self._evict_idle_locked()
+
+                while self._idle:
+                    pooled = self._idle.pop()
+                    if self._is_healthy(pooled):
+                        self._in_use += 1
+                        return pooled
+                    print("⚠️ Driver do pool não respondeu, descartando...")
+                    self._quit(pooled)
+
+                if self._in_use < self.max_size:
+                    self._in_use += 1
+                    break
+
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    print("❌ Timeout aguardando driver livre no pool")
+                    return None
+                self._condition.wait(remaining)
+
+        # Cria o driver fora do lock (o startup do Chrome é lento)
+        pooled = self._create()
+        if pooled is None:
+            with self._condition:
+                self._in_use -= 1
+                self._condition.notify()
+        return pooled
+
+    def release(self, pooled: PooledDriver, discard: bool = False):
+        """Devolve o driver ao pool, reciclando-o se necessário"""
+        if pooled is None:
+            return
+
+        pooled.last_used = time.time()
+        recycle = discard or (self.max_pages and pooled.pages_served >= self.max_pages)
+
+        if recycle:
+            print(f"♻️ Reciclando driver após {pooled.pages_served} páginas")
+            self._quit(pooled)
+
+        with self._condition:
+            self._in_use -= 1
+            if not recycle:
+                self._idle.append(pooled)
+            self._condition.notify()
+
+    def warm_up(self, count: int = 1):
+        """Inicia drivers antecipadamente para a primeira busca não pagar o startup"""
+        count = min(count, self.max_size)
+
+        with self._condition:
+            missing = count - len(self._idle) - self._in_use
+            if missing <= 0:
+                return
+            self._in_use += missing
+
+        print(f"🔥 Aquecendo {missing} driver(s) do Chrome...")
+        for _ in range(missing):
+            pooled = self._create()
+            with self._condition:
+                self._in_use -= 1
+                if pooled is not None:
+                    self._idle.append(pooled)
+                self._condition.notify()
+
+    def evict_idle(self):
+        """Fecha drivers ociosos há mais tempo que o limite configurado"""
+        with self._condition:
+            self._evict_idle_locked()
+
+    def shutdown(self):
+        """Fecha todos os drivers ociosos do pool"""
+        with self._condition:
+            idle, self._idle = self._idle, []
+        for pooled in idle:
+            self._quit(pooled)
+
+    def stats(self) -> dict:
+        """Resumo do estado do pool"""
+        with self._condition:
+            return {
+                'idle': len(self._idle),
+                'in_use': self._in_use,
+                'max_size': self.max_size,
+            }
+
+    def _evict_idle_locked(self):
+        if not self.idle_timeout:
+            return
+
+        now = time.time()
+        keep = []
+        for pooled in self._idle:
+            if now - pooled.last_used > self.idle_timeout:
+                print("🧹 Fechando driver ocioso do pool")
+                self._quit(pooled)
+            else:
+                keep.append(pooled)
+        self._idle = keep
+
+    def _create(self) -> Optional[PooledDriver]:
+        try:
+            driver = self.factory()
+        except Exception as e:
+            print(f"❌ Erro ao criar driver do pool: {e}")
+            return None
+        if driver is None:
+            return None
+        return PooledDriver(driver)
+
+    def _is_healthy(self, pooled: PooledDriver) -> bool:
+        """Health check: o driver ainda executa JavaScript?"""
+        try:
+            return pooled.driver.execute_script("return 1") == 1
+        except Exception:
+            return False
+
+    def _quit(self, pooled: PooledDriver):
+        try:
+            pooled.driver.quit()
+        except Exception:
+            pass
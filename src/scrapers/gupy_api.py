@@ -1,46 +1,53 @@
-from .api_base import ApiBaseScraper
+from .api_async import AsyncApiBaseScraper
+from .query_planner import QueryPlanner
 from typing import List, Dict
 import urllib.parse
+from utils.watermarks import watermarks
+from utils.metrics import count_cards
 
-class GupyApiScraper(ApiBaseScraper):
+class GupyApiScraper(AsyncApiBaseScraper):
     def __init__(self):
         super().__init__()
         self.base_url = "https://api.gupy.io/api/v1/jobs"
     
     def scrape_jobs(self, job_levels: List[str], tech_keywords: List[str], location: str = "salvador") -> List[Dict]:
         """Busca vagas usando API oficial da Gupy"""
-        all_jobs = []
+        planner = QueryPlanner('gupy')
+        search_queries = planner.plan(job_levels, label='Gupy API')
         
-        search_queries = [
-            "estágio", "estagio", "junior", "assistente", "auxiliar"
-        ]
-        
-        for query in search_queries:
-            print(f"🔍 Buscando na Gupy API: {query}")
-            
-            jobs = self._search_gupy_api(query, location)
-            if jobs:
-                all_jobs.extend(jobs)
-                print(f"✅ {len(jobs)} vagas encontradas para '{query}'")
-            else:
-                print(f"❌ Nenhuma vaga encontrada para '{query}'")
+        print(f"🔍 Buscando na Gupy API: {', '.join(search_queries)}")
+        all_jobs = self.run_queries(
+            search_queries,
+            lambda query: self._search_gupy_api(query, location),
+            planner
+        )
         
         # Filtra vagas de TI
         tech_jobs = self.filter_tech_jobs(all_jobs)
         return tech_jobs
     
-    def _search_gupy_api(self, query: str, location: str) -> List[Dict]:
-        """Faz busca na API da Gupy"""
+    async def _search_gupy_api(self, query: str, location: str, limit: int = 50) -> List[Dict]:
+        """Faz busca na API da Gupy (todas as páginas)"""
+        return [
+            job async for job in self.paginate(
+                lambda page: self._fetch_gupy_page(query, location, limit, page * limit),
+                page_size=limit,
+                watermark=watermarks.get('gupy', f"{query}|{location}")
+            )
+        ]
+    
+    async def _fetch_gupy_page(self, query: str, location: str, limit: int, offset: int) -> List[Dict]:
+        """Busca uma página da API da Gupy"""
         jobs = []
         
         params = {
             'jobName': query,
             'city': location,
-            'limit': 50,
-            'offset': 0
+            'limit': limit,
+            'offset': offset
         }
         
-        data = self.make_api_request(self.base_url, params)
+        data = await self.fetch_async(self.base_url, params)
         
         if data and 'data' in data:
             for job_data in data['data']:
@@ -48,35 +55,46 @@ class GupyApiScraper(ApiBaseScraper):
                 if job:
                     jobs.append(job)
         
+        count_cards('gupy', 'api', len(jobs))
         return jobs
     
     def _parse_gupy_job(self, job_data: dict) -> Dict:
         """Parse dos dados da vaga da Gupy"""
-        try:
-            title = job_data.get('name', '').strip()
-            company = job_data.get('company', {}).get('name', 'N/A').strip()
-            
-            # Localização
-            city = job_data.get('city', 'Salvador')
-            state = job_data.get('state', 'BA')
-            location = f"{city}, {state}"
-            
-            # URL
-            job_id = job_data.get('id')
-            url = f"https://portal.gupy.io/job/{job_id}" if job_id else "#"
-            
-            # Data de publicação
-            published_date = job_data.get('publishedDate', 'Recent')
-            
-            return {
-                'title': title,
-                'company': company,
-                'location': location,
-                'date_posted': published_date,
-                'platform': 'Gupy',
-                'url': url,
-                'description': job_data.get('description', '')
-            }
-        except Exception as e:
-            print(f"❌ Erro ao parsear vaga Gupy: {e}")
-            return None
\ No newline at end of file
+        return parse_gupy_job(job_data)
+
+
+def parse_gupy_job(job_data: dict) -> Dict:
+    """Parse dos dados da vaga da Gupy (API pública e XHR do portal capturado no Selenium)"""
+    try:
+        title = job_data.get('name', '').strip()
+        company = job_data.get('company') or {}
+        company = (company.get('name') if isinstance(company, dict) else company) \
+            or job_data.get('careerPageName') or 'N/A'
+        company = company.strip()
+        
+        # Localização (a busca do portal é nacional: sem cidade não dá para supor Salvador)
+        location = ', '.join(part for part in (job_data.get('city'), job_data.get('state')) if part)
+        if not location:
+            remote = job_data.get('workplaceType') == 'remote' or job_data.get('isRemoteWork')
+            location = 'Remoto' if remote else 'N/A'
+        
+        # URL (o portal já manda a URL da página de carreira)
+        job_id = job_data.get('id')
+        url = job_data.get('jobUrl') or (f"https://portal.gupy.io/job/{job_id}" if job_id else "#")
+        
+        # Data de publicação
+        published_date = job_data.get('publishedDate', 'Recent')
+        
+        return {
+            'job_id': str(job_id) if job_id else None,
+            'title': title,
+            'company': company,
+            'location': location,
+            'date_posted': published_date,
+            'platform': 'Gupy',
+            'url': url,
+            'description': job_data.get('description', '')
+        }
+    except Exception as e:
+        print(f"❌ Erro ao parsear vaga Gupy: {e}")
+        return None
\ No newline at end of file
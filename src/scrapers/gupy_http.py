@@ -0,0 +1,53 @@
+import time
+from .base_scraper import BaseScraper
+from .gupy_api import parse_gupy_job
+from .query_planner import QueryPlanner
+from typing import List, Dict
+from filters.keyword_matcher import keyword_matcher
+from utils.watermarks import watermarks
+from utils.metrics import count_cards
+from config.settings import API_MAX_PAGES
+
+class GupyHttpScraper(BaseScraper):
+    """API do portal da Gupy (a mesma do XHR da página) via cloudscraper, sem navegador"""
+    site = 'gupy'
+
+    def __init__(self):
+        super().__init__()
+        self.base_url = "https://employability-portal.gupy.io/api/v1/jobs"
+
+    def scrape_jobs(self, job_levels: List[str], tech_keywords: List[str], location: str = "salvador") -> List[Dict]:
+        """Busca vagas no JSON do portal da Gupy"""
+        jobs = []
+        planner = QueryPlanner(self.site)
+
+        for query in planner.plan(job_levels, label='Gupy (HTTP)'):
+            print(f"🔍 Buscando na Gupy (HTTP): {query}")
+            started_at = time.perf_counter()
+            query_jobs = self._search_gupy_portal(query, location)
+            planner.record(query, query_jobs, time.perf_counter() - started_at)
+            jobs.extend(query_jobs)
+            print(f"📝 {len(query_jobs)} vagas encontradas para '{query}'")
+
+        return [job for job in jobs if keyword_matcher.matches(job['title'], 'tech')]
+
+    def _search_gupy_portal(self, query: str, location: str, limit: int = 50) -> List[Dict]:
+        """Todas as páginas da busca (para na última ou numa página já vista)"""
+        watermark = watermarks.get(self.site, f"{query}|{location}")
+        headers = {'Accept': 'application/json', 'Referer': 'https://portal.gupy.io/'}
+        jobs = []
+
+        for page in range(API_MAX_PAGES):
+            params = {'jobName': query, 'city': location, 'limit': limit, 'offset': page * limit}
+            data = self.make_json_request(self.base_url, params, headers)
+            if not isinstance(data, dict) or not data.get('data'):
+                break
+
+            page_jobs = [job for job in map(parse_gupy_job, data['data']) if job]
+            count_cards(self.site, 'http', len(page_jobs))
+            jobs.extend(page_jobs)
+            if len(data['data']) < limit or watermark.page_is_seen(page_jobs):
+                break
+
+        watermark.observe(jobs)
+        return jobs
@@ -1,11 +1,17 @@
 from .selenium_base import SeleniumScraper
-from bs4 import BeautifulSoup
+from .parse_engine import ParseScope
 from typing import List, Dict
 import urllib.parse
 import time
 import random
 
 class GupyScraper(SeleniumScraper):
+    results_scope = ParseScope('main')
+    
+    # Cards que indicam que a listagem carregou (ou o aviso de sem resultados)
+    ready_selectors = ['[data-testid="job-card"]', '[class*="job-card"]']
+    no_results_selectors = ['[data-testid*="no-results"]', '[class*="no-results"]']
+    
     def __init__(self):
         super().__init__(headless=True)
     
@@ -14,6 +20,10 @@ class GupyScraper(SeleniumScraper):
         jobs = []
         
         try:
+            if not self.setup_driver():
+                print("❌ Nenhum driver disponível para a Gupy")
+                return []
+            
             search_queries = [
                 "estágio TI",
                 "junior TI", 
@@ -27,8 +37,6 @@ class GupyScraper(SeleniumScraper):
                 jobs.extend(query_jobs)
                 print(f"📝 Encontradas {len(query_jobs)} vagas para '{query}'")
                 
-                self.human_delay(2, 4)
-                
         except Exception as e:
             print(f"❌ Erro no Gupy Scraper: {e}")
         finally:
@@ -45,23 +53,30 @@ class GupyScraper(SeleniumScraper):
             url = f"https://portal.gupy.io/job-search?jobName={encoded_query}&city={location}"
             
             print(f"🌐 Acessando: {url}")
-            self.driver.get(url)
+            self.navigate(url)
             
-            self.human_delay(3, 5)
-            self.scroll_page()
+            # Aguarda os cards carregarem (ou o aviso de sem resultados)
+            state = self.wait_for_page_ready(self.ready_selectors, self.no_results_selectors)
+            if state == 'no_results':
+                print("📭 Nenhum resultado encontrado para esta busca")
+                return []
+            if state == 'timeout':
+                print("⚠️ Página da Gupy não carregou a tempo")
             
-            # Aguarda resultados
-            self.wait_for_element('[data-testid="job-card"]', timeout=10)
+            # Faz scroll para carregar mais vagas e espera a lista estabilizar
+            if state == 'results':
+                self.scroll_page(scroll_pauses=1)
+                self.wait_for_page_ready(self.ready_selectors, self.no_results_selectors)
             
-            soup = BeautifulSoup(self.driver.page_source, 'html.parser')
-            jobs = self._extract_jobs_from_html(soup)
+            root = self.parse_page(self.results_scope)
+            jobs = self._extract_jobs_from_html(root)
             
         except Exception as e:
             print(f"❌ Erro na busca da Gupy: {e}")
             
         return jobs
     
-    def _extract_jobs_from_html(self, soup: BeautifulSoup) -> List[Dict]:
+    def _extract_jobs_from_html(self, root) -> List[Dict]:
         """Extrai vagas do HTML da Gupy"""
         jobs = []
         
@@ -72,7 +87,7 @@ class GupyScraper(SeleniumScraper):
         ]
         
         for selector in job_selectors:
-            job_elements = soup.select(selector)
+            job_elements = self.parser.select(root, selector)
             if job_elements:
                 print(f"✅ Encontrados {len(job_elements)} elementos na Gupy")
                 for job_elem in job_elements:
@@ -111,17 +126,13 @@ class GupyScraper(SeleniumScraper):
     
     def _extract_text(self, element, selectors, default="N/A"):
         """Extrai texto usando múltiplos seletores"""
-        for selector in selectors:
-            found = element.select_one(selector)
-            if found and found.get_text(strip=True):
-                return found.get_text(strip=True)
-        return default
+        return self._extract_text_safe(element, selectors, default)
     
     def _extract_gupy_url(self, job_elem):
         """Extrai URL da Gupy"""
-        link = job_elem.select_one('a[href*="/job/"]')
-        if link and link.get('href'):
-            href = link.get('href')
+        link = self.parser.select_one(job_elem, 'a[href*="/job/"]')
+        href = self.parser.attr(link, 'href') if link is not None else None
+        if href:
             if href.startswith('/'):
                 return f"https://portal.gupy.io{href}"
             return href
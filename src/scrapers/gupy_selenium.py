@@ -1,12 +1,55 @@
 from .selenium_base import SeleniumScraper
-from bs4 import BeautifulSoup
-from typing import List, Dict
+from .parse_engine import ParseScope
+from .query_planner import QueryPlanner
+from .gupy_api import parse_gupy_job
+from typing import List, Dict, Optional
 import urllib.parse
 import time
-import random
 from selenium.webdriver.common.by import By
+from filters.keyword_matcher import keyword_matcher
+from utils.watermarks import watermarks
+from utils.metrics import count_cards
+from config.settings import GUPY_CAPTURE_URL, API_MAX_PAGES
 
 class GupySeleniumScraper(SeleniumScraper):
+    site = 'gupy'
+    
+    # Seletores mais abrangentes
+    job_selectors = [
+        'div[data-testid="job-card"]',
+        '[data-testid*="job-card"]',
+        'a[href*="/job/"]',
+        '.sc-be4b7f4c-0',
+        '[class*="job-card"]',
+        'div[class*="sc-"]'  # Seletores genéricos da Gupy
+    ]
+    
+    # Seletores específicos para saber se a listagem carregou
+    # (os genéricos de styled-components aparecem antes dos cards)
+    ready_selectors = [
+        '[data-testid*="job-card"]',
+        'a[href*="/job/"]',
+        '[class*="job-card"]'
+    ]
+    
+    no_results_selectors = [
+        '[data-testid*="no-results"]',
+        '[data-testid*="empty"]',
+        '[class*="no-results"]'
+    ]
+    
+    # Campos de cada card: (seletores, atributo ou None para o texto)
+    card_fields = {
+        'title': (['h2', '[data-testid*="title"]', 'strong', 'span[class*="title"]'], None),
+        'company': (['p', '[data-testid*="company"]', 'span[class*="company"]'], None),
+        'location': (['span', '[data-testid*="location"]', 'div[class*="location"]'], None),
+        'url': (['a', '[href*="/job/"]'], 'href'),
+        'date': (['time'], 'datetime'),
+    }
+    
+    # Os cards ficam no <main>; cabeçalho, filtros e rodapé não são parseados
+    results_scope = ParseScope('main')
+    
     def __init__(self):
         super().__init__(headless=True)
     
@@ -15,23 +58,22 @@ class GupySeleniumScraper(SeleniumScraper):
         jobs = []
         
         try:
-            # Buscas mais específicas para Salvador
-            search_queries = [
-                "estágio",
-                "estagio", 
-                "junior",
-                "assistente",
-                "auxiliar"
-            ]
+            if not self.setup_driver():
+                print("❌ Nenhum driver disponível para a Gupy")
+                return []
+            
+            # Uma busca por nível (sem variantes de acento nem buscas redundantes)
+            planner = QueryPlanner(self.site)
+            search_queries = planner.plan(job_levels, label='Gupy')
             
             for query in search_queries:
                 print(f"🔍 Buscando na Gupy: {query}")
+                started_at = time.perf_counter()
                 query_jobs = self._search_gupy_site(query, location)
+                planner.record(query, query_jobs, time.perf_counter() - started_at)
                 jobs.extend(query_jobs)
                 print(f"📝 {len(query_jobs)} vagas encontradas para '{query}'")
                 
-                self.human_delay(2, 4)
-                
         except Exception as e:
             print(f"❌ Erro no Gupy Scraper: {e}")
         finally:
@@ -50,20 +92,37 @@ class GupySeleniumScraper(SeleniumScraper):
             url = f"https://portal.gupy.io/job-search?jobName={encoded_query}"
             
             print(f"🌐 Acessando Gupy: {url}")
-            self.driver.get(url)
+            capturing = self.enable_network_capture()
+            self.navigate(url)
+            
+            # O portal monta os cards a partir de um XHR: usa o JSON dele direto
+            if capturing:
+                network_jobs = self._search_gupy_network(query, location)
+                if network_jobs is not None:
+                    # Localização veio do JSON: filtra pelo valor real, sem supor Salvador
+                    return [job for job in network_jobs if self._is_in_salvador(job, allow_missing=False)]
+                print("⚠️ JSON da busca não capturado, extraindo do HTML")
             
-            # Aguarda carregamento
-            self.human_delay(4, 6)
+            # Aguarda os cards carregarem (ou o aviso de sem resultados)
+            state = self.wait_for_page_ready(self.ready_selectors, self.no_results_selectors)
+            if state == 'no_results':
+                print("📭 Nenhum resultado encontrado para esta busca")
+                return []
+            if state == 'timeout':
+                print("⚠️ Página da Gupy não carregou a tempo")
             
             # Tenta mudar para Salvador se possível
             self._try_set_salvador_location()
             
-            # Faz scroll para carregar mais vagas
-            self.scroll_page(scroll_pauses=3)
-            
-            # Pega o HTML
-            soup = BeautifulSoup(self.driver.page_source, 'html.parser')
-            jobs = self._extract_gupy_jobs(soup)
+            # Faz scroll para carregar mais vagas, só enquanto aparecem vagas novas
+            jobs = self.scroll_for_new_jobs(
+                lambda: self._extract_gupy_jobs(
+                    self.extract_cards(self.job_selectors, self.card_fields, limit=15, scope=self.results_scope)
+                ),
+                lambda: self.scroll_page(scroll_pauses=1),
+                steps=3,
+                watermark=watermarks.get(self.site, f"{query}|{location}")
+            )
             
             # Filtra por Salvador localmente
             jobs = [job for job in jobs if self._is_in_salvador(job)]
@@ -73,6 +132,49 @@ class GupySeleniumScraper(SeleniumScraper):
             
         return jobs
     
+    def _search_gupy_network(self, query: str, location: str) -> Optional[List[Dict]]:
+        """Vagas do JSON da busca capturado no tráfego do navegador (None se não houver)
+        
+        As páginas seguintes são pedidas pela própria página (mesma sessão),
+        trocando o offset na URL do XHR capturado.
+        """
+        captured = self.capture_json_responses(GUPY_CAPTURE_URL)
+        captured = [(url, payload) for url, payload in captured
+                    if isinstance(payload, dict) and isinstance(payload.get('data'), list)]
+        if not captured:
+            return None
+        
+        search_url, payload = captured[0]
+        watermark = watermarks.get(self.site, f"{query}|{location}")
+        jobs, offset = [], 0
+        for page in range(API_MAX_PAGES):
+            page_jobs = [job for job in map(parse_gupy_job, payload.get('data') or []) if job]
+            count_cards(self.site, 'network', len(page_jobs))
+            jobs.extend(page_jobs)
+            offset += len(payload.get('data') or [])
+            
+            total = (payload.get('pagination') or {}).get('total')
+            if not page_jobs or total is None or offset >= total:
+                break
+            if watermark.page_is_seen(page_jobs):
+                print(f"⏹️ '{query}': página {page + 1} só com vagas já vistas, parando")
+                break
+            
+            payload = self.fetch_json_in_browser(self._with_offset(search_url, offset))
+            if not isinstance(payload, dict):
+                break
+        
+        watermark.observe(jobs)
+        print(f"📡 {len(jobs)} vagas da Gupy lidas do JSON da busca")
+        return jobs
+    
+    def _with_offset(self, url: str, offset: int) -> str:
+        """URL do XHR da busca apontando para outro offset"""
+        parts = urllib.parse.urlsplit(url)
+        params = dict(urllib.parse.parse_qsl(parts.query, keep_blank_values=True))
+        params['offset'] = str(offset)
+        return urllib.parse.urlunsplit(parts._replace(query=urllib.parse.urlencode(params)))
+    
     def _try_set_salvador_location(self):
         """Tenta definir localização como Salvador"""
         try:
@@ -114,108 +216,52 @@ class GupySeleniumScraper(SeleniumScraper):
         except Exception as e:
             print(f"⚠️ Não foi possível definir localização: {e}")
     
-    def _extract_gupy_jobs(self, soup: BeautifulSoup) -> List[Dict]:
-        """Extrai vagas do HTML da Gupy com seletores melhorados"""
+    def _extract_gupy_jobs(self, cards: List[Dict]) -> List[Dict]:
+        """Monta as vagas a partir dos campos extraídos dos cards"""
         jobs = []
         
-        # Seletores mais abrangentes
-        job_selectors = [
-            'div[data-testid="job-card"]',
-            '[data-testid*="job-card"]',
-            'a[href*="/job/"]',
-            '.sc-be4b7f4c-0',
-            '[class*="job-card"]',
-            'div[class*="sc-"]'  # Seletores genéricos da Gupy
-        ]
-        
-        for selector in job_selectors:
-            job_elements = soup.select(selector)
-            if job_elements:
-                print(f"✅ Encontrados {len(job_elements)} elementos na Gupy")
-                for job_elem in job_elements[:15]:  # Limita para performance
-                    try:
-                        job = self._parse_gupy_job_element(job_elem)
-                        if job:
-                            jobs.append(job)
-                    except Exception as e:
-                        continue
-                break
+        if cards:
+            print(f"✅ Encontrados {len(cards)} elementos na Gupy")
+        for fields in cards:
+            try:
+                job = self._parse_gupy_job_element(fields)
+                if job:
+                    jobs.append(job)
+            except Exception:
+                continue
         
+        count_cards(self.site, 'dom', len(jobs))
         return jobs
     
-    def _parse_gupy_job_element(self, job_elem) -> Dict:
-        """Parseia um elemento de vaga da Gupy"""
-        # Título
-        title_selectors = ['h2', '[data-testid*="title"]', 'strong', 'span[class*="title"]']
-        title = self._extract_text_safe(job_elem, title_selectors)
-        
+    def _parse_gupy_job_element(self, fields: Dict) -> Dict:
+        """Parseia os campos de um card de vaga da Gupy"""
+        title = fields.get('title')
         if not title:
             return None
-            
-        # Empresa
-        company_selectors = ['p', '[data-testid*="company"]', 'span[class*="company"]']
-        company = self._extract_text_safe(job_elem, company_selectors, "Empresa não informada")
-        
-        # Localização
-        location_selectors = ['span', '[data-testid*="location"]', 'div[class*="location"]']
-        location = self._extract_text_safe(job_elem, location_selectors, "Salvador, BA")
         
-        # URL
-        url = self._extract_gupy_url(job_elem)
+        url = fields.get('url') or "#"
+        if url.startswith('/'):
+            url = f"https://portal.gupy.io{url}"
         
         return {
             'title': title,
-            'company': company,
-            'location': location,
-            'date_posted': 'Recent',
+            'company': fields.get('company') or "Empresa não informada",
+            'location': fields.get('location') or "Salvador, BA",
+            'date_posted': fields.get('date') or 'Recent',
             'platform': 'Gupy',
             'url': url
         }
     
-    def _extract_text_safe(self, element, selectors, default="N/A"):
-        """Extrai texto com segurança"""
-        for selector in selectors:
-            found = element.select_one(selector)
-            if found and found.get_text(strip=True):
-                return found.get_text(strip=True)
-        return default
-    
-    def _extract_gupy_url(self, job_elem):
-        """Extrai URL da vaga na Gupy"""
-        link_selectors = ['a', '[href*="/job/"]']
-        for selector in link_selectors:
-            link = job_elem.select_one(selector)
-            if link and link.get('href'):
-                href = link.get('href')
-                if href.startswith('/'):
-                    return f"https://portal.gupy.io{href}"
-                return href
-        return "#"
-    
-    def _is_in_salvador(self, job: Dict) -> bool:
+    def _is_in_salvador(self, job: Dict, allow_missing: bool = True) -> bool:
         """Filtra apenas vagas em Salvador com critérios mais flexíveis"""
-        location = job['location'].lower()
-        salvador_indicators = ['salvador', 'ssa', 'bahia', 'ba']
+        location = (job.get('location') or 'N/A').lower()
         
-        # Se não tem localização, assume que pode ser de Salvador
-        if location == 'salvador, ba' or location == 'n/a':
+        # Card sem localização no HTML: assume que pode ser de Salvador
+        if location == 'salvador, ba' or (location == 'n/a' and allow_missing):
             return True
             
-        return any(indicator in location for indicator in salvador_indicators)
+        return keyword_matcher.matches(location, 'location')
     
     def _filter_tech_jobs(self, jobs: List[Dict]) -> List[Dict]:
         """Filtra vagas de TI"""
-        tech_keywords = [
-            'ti', 't.i', 'tecnologia', 'tecnológico', 'sistema', 'informática',
-            'programação', 'desenvolvedor', 'software', 'dados', 'data',
-            'suporte', 'infraestrutura', 'redes', 'devops', 'developer',
-            'analista', 'technology', 'systems', 'it', 'dev', 'computação'
-        ]
-        
-        filtered_jobs = []
-        for job in jobs:
-            title = job['title'].lower()
-            if any(keyword in title for keyword in tech_keywords):
-                filtered_jobs.append(job)
-        
-        return filtered_jobs
\ No newline at end of file
+        return [job for job in jobs if keyword_matcher.matches(job['title'], 'tech')]
\ No newline at end of file
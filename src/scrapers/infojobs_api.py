@@ -1,8 +1,12 @@
-from .api_base import ApiBaseScraper
+from .api_async import AsyncApiBaseScraper
+from .query_planner import QueryPlanner
 from typing import List, Dict
 import base64
+import requests
+from utils.watermarks import watermarks
+from utils.metrics import count_cards
 
-class InfoJobsApiScraper(ApiBaseScraper):
+class InfoJobsApiScraper(AsyncApiBaseScraper):
     def __init__(self, client_id: str, client_secret: str):
         super().__init__()
         self.client_id = client_id
@@ -48,23 +52,31 @@ class InfoJobsApiScraper(ApiBaseScraper):
             print("❌ Access token não disponível para InfoJobs")
             return []
         
-        all_jobs = []
+        planner = QueryPlanner('infojobs')
+        search_queries = planner.plan(job_levels, label='InfoJobs API')
         
-        for level in job_levels:
-            print(f"🔍 Buscando no InfoJobs API: {level}")
-            
-            jobs = self._search_infojobs_api(level, location)
-            if jobs:
-                all_jobs.extend(jobs)
-                print(f"✅ {len(jobs)} vagas encontradas para '{level}'")
-            else:
-                print(f"❌ Nenhuma vaga encontrada para '{level}'")
+        print(f"🔍 Buscando no InfoJobs API: {', '.join(search_queries)}")
+        all_jobs = self.run_queries(
+            search_queries,
+            lambda level: self._search_infojobs_api(level, location),
+            planner
+        )
         
         tech_jobs = self.filter_tech_jobs(all_jobs)
         return tech_jobs
     
-    def _search_infojobs_api(self, query: str, location: str) -> List[Dict]:
-        """Faz busca na API do InfoJobs"""
+    async def _search_infojobs_api(self, query: str, location: str, limit: int = 20) -> List[Dict]:
+        """Faz busca na API do InfoJobs (todas as páginas)"""
+        return [
+            job async for job in self.paginate(
+                lambda page: self._fetch_infojobs_page(query, location, limit, page + 1),
+                page_size=limit,
+                watermark=watermarks.get('infojobs', f"{query}|{location}")
+            )
+        ]
+    
+    async def _fetch_infojobs_page(self, query: str, location: str, limit: int, page: int) -> List[Dict]:
+        """Busca uma página da API do InfoJobs (páginas começam em 1)"""
         jobs = []
         
         headers = {
@@ -77,10 +89,11 @@ class InfoJobsApiScraper(ApiBaseScraper):
         params = {
             'q': search_query,
             'city': location,
-            'maxResults': 20
+            'maxResults': limit,
+            'page': page
         }
         
-        data = self.make_api_request(self.base_url, params, headers)
+        data = await self.fetch_async(self.base_url, params, headers)
         
         if data and 'offers' in data:
             for offer in data['offers']:
@@ -88,6 +101,7 @@ class InfoJobsApiScraper(ApiBaseScraper):
                 if job:
                     jobs.append(job)
         
+        count_cards('infojobs', 'api', len(jobs))
         return jobs
     
     def _parse_infojobs_offer(self, offer: dict) -> Dict:
@@ -107,6 +121,7 @@ class InfoJobsApiScraper(ApiBaseScraper):
             updated = offer.get('updated', 'Recent')
             
             return {
+                'job_id': offer.get('id'),
                 'title': title,
                 'company': company,
                 'location': location,
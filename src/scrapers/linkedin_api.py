@@ -1,76 +1,66 @@
-from .api_base import ApiBaseScraper
-from typing import List, Dict
+from .api_async import AsyncApiBaseScraper
+from .query_planner import QueryPlanner
+from typing import List, Dict, Optional
+from utils.job_ids import job_key, extract_native_id
 import urllib.parse
 from datetime import datetime, timedelta
+from utils.watermarks import watermarks
+from utils.metrics import count_cards
 
-class LinkedInApiScraper(ApiBaseScraper):
+class LinkedInApiScraper(AsyncApiBaseScraper):
     def __init__(self):
         super().__init__()
         self.base_url = "https://www.linkedin.com/jobs-guest/jobs/api/seeMoreJobPostings/search"
     
     def scrape_jobs(self, job_levels: List[str], tech_keywords: List[str], location: str = "Salvador, Bahia") -> List[Dict]:
         """Busca vagas usando API não oficial do LinkedIn"""
-        all_jobs = []
+        # (nível OR ...) AND (termo de TI OR ...) em vez de uma busca por combinação
+        planner = QueryPlanner('linkedin')
+        search_keywords = planner.plan(job_levels, tech_keywords, label='LinkedIn API')
         
-        # Keywords de busca otimizadas
-        search_keywords = [
-            "estágio ti",
-            "junior ti", 
-            "assistente ti",
-            "auxiliar ti",
-            "estagio tecnologia",
-            "junior tecnologia",
-            "assistente tecnologia",
-            "auxiliar tecnologia"
-        ]
-        
-        for keyword in search_keywords:
-            print(f"🔍 Buscando no LinkedIn API: {keyword}")
-            
-            jobs = self._search_linkedin_api(keyword, location)
-            if jobs:
-                all_jobs.extend(jobs)
-                print(f"✅ {len(jobs)} vagas encontradas para '{keyword}'")
-            else:
-                print(f"❌ Nenhuma vaga encontrada para '{keyword}'")
+        print(f"🔍 Buscando no LinkedIn API: {len(search_keywords)} buscas em paralelo")
+        all_jobs = self.run_queries(
+            search_keywords,
+            lambda keyword: self._search_linkedin_api(keyword, location),
+            planner
+        )
         
         # Filtra vagas de TI
         tech_jobs = self.filter_tech_jobs(all_jobs)
         return self._remove_duplicates(tech_jobs)
     
-    def _search_linkedin_api(self, keyword: str, location: str, limit: int = 25) -> List[Dict]:
-        """Faz busca na API do LinkedIn"""
-        jobs = []
-        
+    async def _search_linkedin_api(self, keyword: str, location: str, limit: int = 10) -> List[Dict]:
+        """Faz busca na API do LinkedIn (todas as páginas)"""
+        return [
+            job async for job in self.paginate(
+                lambda page: self._fetch_linkedin_page(keyword, location, page * limit),
+                page_size=limit,
+                watermark=watermarks.get('linkedin', f"{keyword}|{location}")
+            )
+        ]
+    
+    async def _fetch_linkedin_page(self, keyword: str, location: str, start: int) -> List[Dict]:
+        """Busca uma página da API do LinkedIn"""
         params = {
             'keywords': keyword,
             'location': location,
             'f_TPR': 'r86400',  # Últimas 24 horas
-            'start': 0
+            'start': start
         }
         
-        try:
-            # A API retorna HTML mesmo, mas é mais estável
-            response = self.session.get(self.base_url, params=params, timeout=30)
-            
-            if response.status_code == 200:
-                jobs = self._parse_linkedin_html(response.text)
-            else:
-                print(f"❌ LinkedIn API retornou status {response.status_code}")
-                
-        except Exception as e:
-            print(f"❌ Erro na API LinkedIn: {e}")
+        # A API retorna HTML mesmo, mas é mais estável
+        html = await self.fetch_async(self.base_url, params, as_json=False)
         
-        return jobs
+        if not html:
+            return []
+        return self._parse_linkedin_html(html)
     
     def _parse_linkedin_html(self, html: str) -> List[Dict]:
         """Parse do HTML retornado pela API"""
-        from bs4 import BeautifulSoup
-        
         jobs = []
-        soup = BeautifulSoup(html, 'html.parser')
+        root = self.parser.parse(html)
         
-        job_cards = soup.find_all('li')
+        job_cards = self.parser.select(root, 'li')
         
         for card in job_cards:
             try:
@@ -80,42 +70,12 @@ class LinkedInApiScraper(ApiBaseScraper):
             except Exception as e:
                 continue
         
+        count_cards('linkedin', 'api', len(jobs))
         return jobs
     
-    def _extract_job_from_card(self, card) -> Dict:
+    def _extract_job_from_card(self, card) -> Optional[Dict]:
         """Extrai dados de um card de vaga"""
-        # Título
-        title_elem = card.find('h3', class_='base-search-card__title')
-        if not title_elem:
-            return None
-            
-        title = title_elem.get_text(strip=True)
-        
-        # Empresa
-        company_elem = card.find('h4', class_='base-search-card__subtitle')
-        company = company_elem.get_text(strip=True) if company_elem else 'N/A'
-        
-        # Localização
-        location_elem = card.find('span', class_='job-search-card__location')
-        location = location_elem.get_text(strip=True) if location_elem else 'Salvador, Bahia'
-        
-        # Data
-        date_elem = card.find('time')
-        date_posted = date_elem.get('datetime') if date_elem else 'Recent'
-        
-        # URL
-        link_elem = card.find('a', class_='base-card__full-link')
-        url = link_elem.get('href') if link_elem else '#'
-        
-        return {
-            'title': title,
-            'company': company,
-            'location': location,
-            'date_posted': date_posted,
-            'platform': 'LinkedIn',
-            'url': url,
-            'description': ''  # API não retorna descrição
-        }
+        return parse_linkedin_card(self.parser, card)
     
     def _remove_duplicates(self, jobs: List[Dict]) -> List[Dict]:
         """Remove vagas duplicadas"""
@@ -123,9 +83,50 @@ class LinkedInApiScraper(ApiBaseScraper):
         unique_jobs = []
         
         for job in jobs:
-            identifier = f"{job['title']}_{job['company']}"
+            identifier = job_key(job)
             if identifier not in seen:
                 seen.add(identifier)
                 unique_jobs.append(job)
         
-        return unique_jobs
\ No newline at end of file
+        return unique_jobs
+
+
+def parse_linkedin_card(parser, card) -> Optional[Dict]:
+    """Extrai dados de um card de vaga (mesmo HTML na API de visitante e na página de busca)"""
+    # Título
+    title_elem = parser.select_one(card, 'h3.base-search-card__title')
+    if title_elem is None:
+        return None
+    
+    title = parser.text(title_elem)
+    
+    # Empresa
+    company_elem = parser.select_one(card, 'h4.base-search-card__subtitle')
+    company = (parser.text(company_elem) if company_elem is not None else None) or 'N/A'
+    
+    # Localização
+    location_elem = parser.select_one(card, 'span.job-search-card__location')
+    location = parser.text(location_elem) if location_elem is not None else 'Salvador, Bahia'
+    
+    # Data
+    date_elem = parser.select_one(card, 'time')
+    date_posted = (parser.attr(date_elem, 'datetime') if date_elem is not None else None) or 'Recent'
+    
+    # URL
+    link_elem = parser.select_one(card, 'a.base-card__full-link')
+    url = (parser.attr(link_elem, 'href') if link_elem is not None else None) or '#'
+    
+    # ID nativo (data-entity-urn="urn:li:jobPosting:<id>")
+    urn_elem = parser.select_one(card, '[data-entity-urn]')
+    urn = parser.attr(urn_elem, 'data-entity-urn') if urn_elem is not None else None
+    
+    return {
+        'job_id': extract_native_id('linkedin', urn, url),
+        'title': title,
+        'company': company,
+        'location': location,
+        'date_posted': date_posted,
+        'platform': 'LinkedIn',
+        'url': url,
+        'description': ''  # API não retorna descrição
+    }
\ No newline at end of file
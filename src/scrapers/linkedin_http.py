@@ -0,0 +1,81 @@
+import time
+from .base_scraper import BaseScraper
+from .linkedin_api import parse_linkedin_card
+from .parse_engine import ParseScope
+from .query_planner import QueryPlanner
+from typing import List, Dict
+from filters.keyword_matcher import keyword_matcher
+from utils.job_ids import job_key
+from utils.watermarks import watermarks
+from utils.metrics import count_cards
+
+class LinkedInHttpScraper(BaseScraper):
+    """Página pública de busca do LinkedIn via cloudscraper (sem navegador)"""
+    site = 'linkedin'
+
+    job_selectors = [
+        'ul.jobs-search__results-list > li',
+        'div.base-card',
+        '[data-entity-urn*="jobPosting"]'
+    ]
+
+    # Só a lista de resultados é parseada
+    results_scope = ParseScope(attr='class', contains=('jobs-search__results-list',))
+
+    def __init__(self):
+        super().__init__()
+        self.base_url = "https://www.linkedin.com/jobs/search"
+
+    def scrape_jobs(self, job_levels: List[str], tech_keywords: List[str], location: str = "Salvador, Bahia") -> List[Dict]:
+        """Busca vagas no HTML da página de busca do LinkedIn"""
+        jobs = []
+        planner = QueryPlanner(self.site)
+
+        for query in planner.plan(job_levels, label='LinkedIn (HTTP)'):
+            print(f"🔍 Buscando no LinkedIn (HTTP): {query}")
+            started_at = time.perf_counter()
+            query_jobs = self._search_linkedin_page(query, location)
+            planner.record(query, query_jobs, time.perf_counter() - started_at)
+            jobs.extend(query_jobs)
+            print(f"📝 {len(query_jobs)} vagas encontradas para '{query}'")
+
+        return self._filter_relevant_jobs(self._remove_duplicates(jobs))
+
+    def _search_linkedin_page(self, query: str, location: str) -> List[Dict]:
+        """Primeira página de resultados (a página de visitante lista ~25 vagas)"""
+        params = {
+            'keywords': query,
+            'location': location,
+            'f_TPR': 'r86400',  # Últimas 24 horas
+            'sortBy': 'DD'
+        }
+        root = self.make_request(self.base_url, params, scope=self.results_scope)
+        if root is None:
+            return []
+
+        jobs = []
+        for card in self.smart_find_all(root, self.job_selectors):
+            try:
+                job = parse_linkedin_card(self.parser, card)
+                if job:
+                    jobs.append(job)
+            except Exception:
+                continue
+
+        count_cards(self.site, 'http', len(jobs))
+        watermarks.get(self.site, f"{query}|{location}").observe(jobs)
+        return jobs
+
+    def _filter_relevant_jobs(self, jobs: List[Dict]) -> List[Dict]:
+        """Filtra vagas relevantes: TI + Salvador"""
+        return [
+            job for job in jobs
+            if keyword_matcher.matches(job['title'], 'tech') and keyword_matcher.matches(job['location'], 'location')
+        ]
+
+    def _remove_duplicates(self, jobs: List[Dict]) -> List[Dict]:
+        """Remove vagas duplicadas"""
+        unique_jobs = {}
+        for job in jobs:
+            unique_jobs.setdefault(job_key(job), job)
+        return list(unique_jobs.values())
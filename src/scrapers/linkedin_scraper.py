@@ -1,11 +1,19 @@
 from .selenium_base import SeleniumScraper
-from bs4 import BeautifulSoup
+from .parse_engine import ParseScope
 from typing import List, Dict
+from utils.job_ids import job_key
 import urllib.parse
 import time
 import random
+from filters.keyword_matcher import keyword_matcher
 
 class LinkedInScraper(SeleniumScraper):
+    results_scope = ParseScope(attr='class', contains=('jobs-search__results-list',))
+    
+    # Cards que indicam que a listagem carregou (ou o aviso de sem resultados)
+    ready_selectors = ['.jobs-search__results-list li', '.job-search-card', '.base-card']
+    no_results_selectors = ['.jobs-search__no-results', '.results__container--no-results']
+    
     def __init__(self):
         super().__init__(headless=True)  # Headless=True para GitHub Actions
     
@@ -14,6 +22,10 @@ class LinkedInScraper(SeleniumScraper):
         jobs = []
         
         try:
+            if not self.setup_driver():
+                print("❌ Nenhum driver disponível para o LinkedIn")
+                return []
+            
             search_queries = [
                 "estágio TI",
                 "junior TI", 
@@ -29,9 +41,6 @@ class LinkedInScraper(SeleniumScraper):
                 jobs.extend(query_jobs)
                 print(f"📝 Encontradas {len(query_jobs)} vagas para '{query}'")
                 
-                # Delay entre buscas
-                self.human_delay(3, 6)
-                
         except Exception as e:
             print(f"❌ Erro no LinkedIn Scraper: {e}")
         finally:
@@ -50,27 +59,31 @@ class LinkedInScraper(SeleniumScraper):
             url = f"https://www.linkedin.com/jobs/search/?keywords={encoded_query}&location={encoded_location}&f_TPR=r86400"
             
             print(f"🌐 Acessando: {url}")
-            self.driver.get(url)
+            self.navigate(url)
             
-            # Aguarda carregamento
-            self.human_delay(3, 5)
+            # Aguarda os cards carregarem (ou o aviso de sem resultados)
+            state = self.wait_for_page_ready(self.ready_selectors, self.no_results_selectors)
+            if state == 'no_results':
+                print("📭 Nenhum resultado encontrado para esta busca")
+                return []
+            if state == 'timeout':
+                print("⚠️ Página do LinkedIn não carregou a tempo")
             
-            # Faz scroll para carregar mais vagas
-            self.scroll_page()
-            
-            # Aguarda resultados
-            self.wait_for_element(".jobs-search__results-list", timeout=10)
+            # Faz scroll para carregar mais vagas e espera a lista estabilizar
+            if state == 'results':
+                self.scroll_page(scroll_pauses=1)
+                self.wait_for_page_ready(self.ready_selectors, self.no_results_selectors)
             
             # Pega HTML da página
-            soup = BeautifulSoup(self.driver.page_source, 'html.parser')
-            jobs = self._extract_jobs_from_html(soup)
+            root = self.parse_page(self.results_scope)
+            jobs = self._extract_jobs_from_html(root)
             
         except Exception as e:
             print(f"❌ Erro na busca do LinkedIn: {e}")
             
         return jobs
     
-    def _extract_jobs_from_html(self, soup: BeautifulSoup) -> List[Dict]:
+    def _extract_jobs_from_html(self, root) -> List[Dict]:
         """Extrai vagas do HTML"""
         jobs = []
         
@@ -84,7 +97,7 @@ class LinkedInScraper(SeleniumScraper):
         ]
         
         for selector in job_selectors:
-            job_elements = soup.select(selector)
+            job_elements = self.parser.select(root, selector)
             if job_elements:
                 print(f"✅ Encontrados {len(job_elements)} elementos com selector: {selector}")
                 for job_elem in job_elements:
@@ -143,18 +156,14 @@ class LinkedInScraper(SeleniumScraper):
     
     def _extract_text(self, element, selectors, default="N/A"):
         """Extrai texto usando múltiplos seletores"""
-        for selector in selectors:
-            found = element.select_one(selector)
-            if found and found.get_text(strip=True):
-                return found.get_text(strip=True)
-        return default
+        return self._extract_text_safe(element, selectors, default)
     
     def _extract_url(self, element, selectors):
         """Extrai URL usando múltiplos seletores"""
         for selector in selectors:
-            found = element.select_one(selector)
-            if found and found.get('href'):
-                href = found.get('href')
+            found = self.parser.select_one(element, selector)
+            href = self.parser.attr(found, 'href') if found is not None else None
+            if href:
                 if href.startswith('/'):
                     return f"https://www.linkedin.com{href}"
                 return href
@@ -162,22 +171,14 @@ class LinkedInScraper(SeleniumScraper):
     
     def _is_relevant_job(self, job: Dict) -> bool:
         """Filtra vagas relevantes de TI"""
-        tech_keywords = [
-            'ti', 't.i', 'tecnologia', 'tecnológico', 'sistema', 'informática',
-            'programação', 'desenvolvedor', 'software', 'dados', 'data',
-            'suporte', 'infraestrutura', 'redes', 'devops', 'developer',
-            'analista', 'technology', 'systems', 'it', 'dev', 'computação'
-        ]
-        
-        title = job['title'].lower()
-        return any(keyword in title for keyword in tech_keywords)
+        return keyword_matcher.matches(job['title'], 'tech')
     
     def _remove_duplicates(self, jobs: List[Dict]) -> List[Dict]:
         """Remove duplicatas"""
         seen = set()
         unique = []
         for job in jobs:
-            identifier = f"{job['title']}_{job['company']}"
+            identifier = job_key(job)
             if identifier not in seen:
                 seen.add(identifier)
                 unique.append(job)
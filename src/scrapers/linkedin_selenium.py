@@ -1,12 +1,49 @@
 from .selenium_base import SeleniumScraper
-from bs4 import BeautifulSoup
+from .parse_engine import ParseScope
+from .query_planner import QueryPlanner
 from typing import List, Dict
 import urllib.parse
 import time
 import random
-from selenium.webdriver.common.by import By
+from filters.keyword_matcher import keyword_matcher
+from utils.job_ids import extract_native_id
+from utils.watermarks import watermarks
+from utils.metrics import count_cards
 
 class LinkedInSeleniumScraper(SeleniumScraper):
+    site = 'linkedin'
+    
+    # Múltiplos seletores tentativos
+    job_selectors = [
+        'li.jobs-search-results__list-item',
+        'div.job-search-card',
+        'div.base-card',
+        '[data-entity-urn*="jobPosting"]',
+        '.occludable-update'
+    ]
+    
+    no_results_selectors = [
+        '.jobs-search__no-results',
+        '.results__container--no-results',
+        '.search-no-results',
+        'h1[class*="no-results"]'
+    ]
+    
+    # Campos de cada card: (seletores, atributo ou None para o texto)
+    card_fields = {
+        'title': (['h3.base-search-card__title', '.job-card-list__title', 'span.job-card-title', 'h3'], None),
+        'company': (['h4.base-search-card__subtitle', '.job-card-container__primary-description', 'h4'], None),
+        'location': (['span.job-search-card__location', '.job-card-container__metadata-item'], None),
+        'url': (['a.base-card__full-link', 'a.job-card-container__link', 'a[href*="/jobs/view"]'], 'href'),
+        'urn': (['[data-entity-urn]'], 'data-entity-urn'),
+        'date': (['time'], 'datetime'),
+    }
+    
+    # Só a lista de resultados é parseada (visitante e logado)
+    results_scope = ParseScope(attr='class', contains=(
+        'jobs-search__results-list', 'jobs-search-results-list', 'scaffold-layout__list'
+    ))
+    
     def __init__(self):
         super().__init__(headless=True)
     
@@ -15,24 +52,22 @@ class LinkedInSeleniumScraper(SeleniumScraper):
         jobs = []
         
         try:
-            # Buscas mais genéricas para evitar bloqueio
-            search_queries = [
-                "estágio",
-                "estagio",
-                "junior", 
-                "assistente",
-                "auxiliar"
-            ]
+            if not self.setup_driver():
+                print("❌ Nenhum driver disponível para o LinkedIn")
+                return []
+            
+            # Buscas genéricas (só o nível) para evitar bloqueio, juntas com OR
+            planner = QueryPlanner(self.site)
+            search_queries = planner.plan(job_levels, label='LinkedIn')
             
             for query in search_queries:
                 print(f"🔍 Buscando no LinkedIn: {query}")
+                started_at = time.perf_counter()
                 query_jobs = self._search_linkedin_smart(query, location)
+                planner.record(query, query_jobs, time.perf_counter() - started_at)
                 jobs.extend(query_jobs)
                 print(f"📝 {len(query_jobs)} vagas encontradas para '{query}'")
                 
-                # Delay maior para evitar rate limiting
-                self.human_delay(5, 8)
-                
         except Exception as e:
             print(f"❌ Erro no LinkedIn Scraper: {e}")
         finally:
@@ -52,22 +87,25 @@ class LinkedInSeleniumScraper(SeleniumScraper):
             url = f"https://www.linkedin.com/jobs/search/?keywords={encoded_query}&location={encoded_location}&f_TPR=r86400"
             
             print(f"🌐 Acessando LinkedIn: {url}")
-            self.driver.get(url)
-            
-            # Aguarda mais tempo para carregar
-            self.human_delay(5, 7)
+            self.navigate(url)
             
-            # Verifica se há resultados
-            if self._no_results_found():
+            # Aguarda os cards carregarem (ou o aviso de sem resultados)
+            state = self.wait_for_page_ready(self.job_selectors, self.no_results_selectors)
+            if state == 'no_results':
                 print("📭 Nenhum resultado encontrado para esta busca")
                 return []
+            if state == 'timeout':
+                print("⚠️ Página do LinkedIn não carregou a tempo")
                 
-            # Scroll mais humanoide
-            self._human_like_scroll()
-            
-            # Pega o HTML
-            soup = BeautifulSoup(self.driver.page_source, 'html.parser')
-            jobs = self._extract_linkedin_jobs(soup)
+            # Scroll humanoide, só enquanto aparecem vagas novas (limitado para performance)
+            jobs = self.scroll_for_new_jobs(
+                lambda: self._extract_linkedin_jobs(
+                    self.extract_cards(self.job_selectors, self.card_fields, limit=15, scope=self.results_scope)
+                ),
+                self._human_like_scroll_step,
+                steps=random.randint(2, 4),
+                watermark=watermarks.get(self.site, f"{query}|{location}")
+            )
             
             # Filtra por data no código também (backup)
             jobs = self._filter_recent_jobs(jobs)
@@ -77,124 +115,51 @@ class LinkedInSeleniumScraper(SeleniumScraper):
             
         return jobs
     
-    def _no_results_found(self) -> bool:
-        """Verifica se não há resultados"""
-        no_results_selectors = [
-            '.jobs-search__no-results',
-            '.results__container--no-results',
-            '.search-no-results',
-            'h1[class*="no-results"]'
-        ]
-        
-        for selector in no_results_selectors:
-            element = self.driver.find_elements(By.CSS_SELECTOR, selector)
-            if element:
-                return True
-        return False
-    
-    def _human_like_scroll(self):
+    def _human_like_scroll_step(self):
         """Scroll mais humanoide para evitar detecção"""
-        scroll_actions = random.randint(2, 4)
-        for i in range(scroll_actions):
-            # Scroll de tamanhos variados
-            scroll_pixels = random.randint(300, 800)
-            self.driver.execute_script(f"window.scrollBy(0, {scroll_pixels});")
-            self.human_delay(1, 2)
+        # Scroll de tamanhos variados
+        scroll_pixels = random.randint(300, 800)
+        self.driver.execute_script(f"window.scrollBy(0, {scroll_pixels});")
+        self.human_delay(1, 2)
     
-    def _extract_linkedin_jobs(self, soup: BeautifulSoup) -> List[Dict]:
-        """Extrai vagas do LinkedIn com seletores mais flexíveis"""
+    def _extract_linkedin_jobs(self, cards: List[Dict]) -> List[Dict]:
+        """Monta as vagas a partir dos campos extraídos dos cards"""
         jobs = []
         
-        # Múltiplos seletores tentativos
-        job_selectors = [
-            'li.jobs-search-results__list-item',
-            'div.job-search-card',
-            'div.base-card',
-            '[data-entity-urn*="jobPosting"]',
-            '.occludable-update'
-        ]
-        
-        for selector in job_selectors:
-            job_elements = soup.select(selector)
-            if job_elements:
-                print(f"✅ Encontrados {len(job_elements)} elementos no LinkedIn")
-                for job_elem in job_elements[:15]:  # Limita para performance
-                    try:
-                        job = self._parse_linkedin_job(job_elem)
-                        if job:
-                            jobs.append(job)
-                    except Exception as e:
-                        continue
-                break
-        
+        if cards:
+            print(f"✅ Encontrados {len(cards)} elementos no LinkedIn")
+        for fields in cards:
+            try:
+                job = self._parse_linkedin_job(fields)
+                if job:
+                    jobs.append(job)
+            except Exception:
+                continue
+        
+        count_cards(self.site, 'dom', len(jobs))
         return jobs
     
-    def _parse_linkedin_job(self, job_elem) -> Dict:
-        """Parseia um elemento de vaga do LinkedIn"""
-        # Título
-        title_selectors = [
-            'h3.base-search-card__title',
-            '.job-card-list__title', 
-            'span.job-card-title',
-            'h3'
-        ]
-        title = self._extract_text_safe(job_elem, title_selectors)
-        
+    def _parse_linkedin_job(self, fields: Dict) -> Dict:
+        """Parseia os campos de um card de vaga do LinkedIn"""
+        title = fields.get('title')
         if not title:
             return None
-            
-        # Empresa
-        company_selectors = [
-            'h4.base-search-card__subtitle',
-            '.job-card-container__primary-description',
-            'h4'
-        ]
-        company = self._extract_text_safe(job_elem, company_selectors, "Empresa não informada")
-        
-        # Localização
-        location_selectors = [
-            'span.job-search-card__location',
-            '.job-card-container__metadata-item'
-        ]
-        location = self._extract_text_safe(job_elem, location_selectors, "Salvador, Bahia")
         
-        # URL
-        url = self._extract_linkedin_url(job_elem)
+        url = fields.get('url') or "#"
+        if url.startswith('/'):
+            url = f"https://www.linkedin.com{url}"
         
         return {
+            # ID nativo (data-entity-urn="urn:li:jobPosting:<id>")
+            'job_id': extract_native_id('linkedin', fields.get('urn'), url),
             'title': title,
-            'company': company,
-            'location': location,
-            'date_posted': 'Recent',
+            'company': fields.get('company') or "Empresa não informada",
+            'location': fields.get('location') or "Salvador, Bahia",
+            'date_posted': fields.get('date') or 'Recent',
             'platform': 'LinkedIn',
             'url': url
         }
     
-    def _extract_text_safe(self, element, selectors, default="N/A"):
-        """Extrai texto com segurança"""
-        for selector in selectors:
-            found = element.select_one(selector)
-            if found and found.get_text(strip=True):
-                return found.get_text(strip=True)
-        return default
-    
-    def _extract_linkedin_url(self, job_elem):
-        """Extrai URL do LinkedIn"""
-        url_selectors = [
-            'a.base-card__full-link',
-            'a.job-card-container__link',
-            'a[href*="/jobs/view"]'
-        ]
-        
-        for selector in url_selectors:
-            link = job_elem.select_one(selector)
-            if link and link.get('href'):
-                href = link.get('href')
-                if href.startswith('/'):
-                    return f"https://www.linkedin.com{href}"
-                return href
-        return "#"
-    
     def _filter_recent_jobs(self, jobs: List[Dict]) -> List[Dict]:
         """Filtra vagas recentes (últimas 24h)"""
         from datetime import datetime, timedelta
@@ -227,21 +192,11 @@ class LinkedInSeleniumScraper(SeleniumScraper):
     
     def _filter_relevant_jobs(self, jobs: List[Dict]) -> List[Dict]:
         """Filtra vagas relevantes: TI + Salvador"""
-        tech_keywords = [
-            'ti', 't.i', 'tecnologia', 'tecnológico', 'sistema', 'informática',
-            'programação', 'desenvolvedor', 'software', 'dados', 'data',
-            'suporte', 'infraestrutura', 'redes', 'devops', 'developer',
-            'analista', 'technology', 'systems', 'it', 'dev', 'computação'
-        ]
-        
         filtered_jobs = []
         for job in jobs:
-            title = job['title'].lower()
-            location = job['location'].lower()
-            
             # Verifica se é de TI E está em Salvador
-            is_tech = any(keyword in title for keyword in tech_keywords)
-            is_salvador = 'salvador' in location or 'ba' in location or 'bahia' in location
+            is_tech = keyword_matcher.matches(job['title'], 'tech')
+            is_salvador = keyword_matcher.matches(job['location'], 'location')
             
             if is_tech and is_salvador:
                 filtered_jobs.append(job)
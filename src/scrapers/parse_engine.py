@@ -0,0 +1,155 @@
+from abc import ABC, abstractmethod
+from typing import Iterable, List, Optional
+from bs4 import BeautifulSoup, SoupStrainer
+from bs4.builder import builder_registry
+from config.settings import HTML_PARSER
+
+try:
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser
+except ImportError:  # selectolax é opcional
+    HTMLParser = None
+
+
+class ParseScope:
+    """Subárvore da página que interessa (ex.: só a lista de vagas)
+
+    Casa elementos com a tag informada e/ou cujo atributo contém um dos
+    valores. Funciona como um SoupStrainer: o resto da página nem vira árvore.
+    """
+
+    def __init__(self, tag: str = None, attr: str = None, contains: Iterable[str] = ()):
+        self.tag = tag
+        self.attr = attr
+        self.contains = tuple(contains)
+
+    def strainer(self) -> SoupStrainer:
+        if not self.attr:
+            return SoupStrainer(self.tag)
+        contains = self.contains
+        return SoupStrainer(self.tag, attrs={
+            self.attr: lambda value: bool(value) and any(part in value for part in contains)
+        })
+
+    def css(self) -> str:
+        tag = self.tag or ''
+        if not self.attr:
+            return tag
+        return ', '.join(f'{tag}[{self.attr}*="{part}"]' for part in self.contains)
+
+
+class ParseEngine(ABC):
+    """Interface comum de parsing usada pelos scrapers (árvores são do engine)"""
+
+    name = ''
+
+    @abstractmethod
+    def parse(self, html, scope: ParseScope = None):
+        """Monta a árvore da página (ou só da subárvore do scope)"""
+
+    @abstractmethod
+    def select(self, node, selector: str) -> list:
+        pass
+
+    @abstractmethod
+    def select_one(self, node, selector: str):
+        pass
+
+    @abstractmethod
+    def text(self, node) -> str:
+        """Texto do elemento sem espaços nas pontas"""
+
+    @abstractmethod
+    def attr(self, node, name: str) -> Optional[str]:
+        pass
+
+
+class SoupEngine(ParseEngine):
+    """BeautifulSoup com html.parser ou lxml como construtor da árvore"""
+
+    def __init__(self, features: str = 'html.parser'):
+        self.features = features
+        self.name = 'bs4' if features == 'html.parser' else features
+
+    def parse(self, html, scope: ParseScope = None):
+        if scope is not None:
+            soup = BeautifulSoup(html, self.features, parse_only=scope.strainer())
+            if soup.contents:
+                return soup
+            # Estrutura mudou e o scope não casou: volta para a página inteira
+        return BeautifulSoup(html, self.features)
+
+    def select(self, node, selector: str) -> list:
+        return node.select(selector)
+
+    def select_one(self, node, selector: str):
+        return node.select_one(selector)
+
+    def text(self, node) -> str:
+        return node.get_text(strip=True)
+
+    def attr(self, node, name: str) -> Optional[str]:
+        return node.get(name)
+
+
+class SelectolaxEngine(ParseEngine):
+    """selectolax/lexbor (parser em C com seletores CSS nativos)"""
+
+    name = 'selectolax'
+
+    def parse(self, html, scope: ParseScope = None):
+        if isinstance(html, bytes):
+            html = html.decode('utf-8', 'replace')
+        tree = HTMLParser(html)
+        # O lexbor sempre monta a árvore inteira: o scope só restringe as buscas seguintes
+        if scope is not None:
+            root = tree.css_first(scope.css())
+            if root is not None:
+                return root
+        return tree
+
+    def select(self, node, selector: str) -> list:
+        return node.css(selector)
+
+    def select_one(self, node, selector: str):
+        return node.css_first(selector)
+
+    def text(self, node) -> str:
+        return node.text(strip=True)
+
+    def attr(self, node, name: str) -> Optional[str]:
+        return node.attributes.get(name)
+
+
+def available_engines() -> List[str]:
+    """Engines instalados, do mais rápido para o mais lento"""
+    engines = []
+    if HTMLParser is not None:
+        engines.append('selectolax')
+    if builder_registry.lookup('lxml') is not None:
+        engines.append('lxml')
+    engines.append('bs4')
+    return engines
+
+
+_engines = {}
+
+
+def get_parse_engine(name: str = HTML_PARSER) -> ParseEngine:
+    """Engine compartilhado ('auto' escolhe o mais rápido instalado)"""
+    if name == 'auto':
+        name = available_engines()[0]
+
+    engine = _engines.get(name)
+    if engine is None:
+        if name == 'selectolax':
+            if HTMLParser is None:
+                raise ValueError("selectolax não está instalado")
+            engine = SelectolaxEngine()
+        elif name == 'lxml':
+            engine = SoupEngine('lxml')
+        elif name in ('bs4', 'html.parser'):
+            engine = SoupEngine('html.parser')
+        else:
+            raise ValueError(f"Engine de parsing desconhecido: {name}")
+        _engines[name] = engine
+    return engine
@@ -0,0 +1,192 @@
+import atexit
+import hashlib
+import json
+import os
+import threading
+from typing import Dict, List, Optional
+from config.settings import (QUERY_STATS_PATH, QUERY_OVERLAP_THRESHOLD, QUERY_OVERLAP_MIN_RESULTS,
+                             QUERY_REPROBE_RUNS, QUERY_MAX_LENGTH)
+from filters.keyword_matcher import tokenize
+from utils.job_ids import job_key
+from utils.metrics import QUERY_SECONDS, QUERY_JOBS
+
+# Sintaxe de busca de cada plataforma (boolean: aceita OR/AND com parênteses)
+PLATFORM_SYNTAX = {
+    'linkedin': {'boolean': True},
+    'gupy': {'boolean': False},
+    'infojobs': {'boolean': False},
+}
+
+# Buscas até este tamanho aparecem por extenso no label das métricas
+QUERY_LABEL_MAX_LENGTH = 32
+
+
+def fold_terms(terms: List[str]) -> List[str]:
+    """Remove variantes de acento/caixa ('estágio' = 'estagio'), mantendo a primeira"""
+    folded = {}
+    for term in terms:
+        key = b' '.join(tokenize(term))
+        if key and key not in folded:
+            folded[key] = term
+    return list(folded.values())
+
+
+def query_label(query: str) -> str:
+    """Id curto e estável da busca para os labels das métricas
+
+    Buscas curtas ficam como estão; as longas (OR de vários termos) viram o
+    primeiro termo + hash, para não criar labels enormes no Prometheus.
+    """
+    if len(query) <= QUERY_LABEL_MAX_LENGTH:
+        return query
+    first_term = query.strip('("').replace('"', ' ').split(' OR ')[0].split(')')[0].strip()
+    digest = hashlib.sha1(query.encode('utf-8')).hexdigest()[:8]
+    return f"{first_term[:QUERY_LABEL_MAX_LENGTH - 10]}#{digest}"
+
+
+def drop_contained_terms(terms: List[str]) -> List[str]:
+    """Remove termos que contêm outro termo inteiro ('tecnologia da informação' ⊃ 'tecnologia')"""
+    tokenized = [(term, b' ' + b' '.join(tokenize(term)) + b' ') for term in terms]
+    return [
+        term for term, padded in tokenized
+        if not any(other != padded and other in padded for _, other in tokenized)
+    ]
+
+
+class QueryStats:
+    """Resultados de cada busca na última execução (persistidos) para medir sobreposição"""
+
+    def __init__(self, path: str = QUERY_STATS_PATH):
+        self.path = path
+        self.stats = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+        if os.path.exists(path):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    self.stats = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"⚠️ Não foi possível ler {path}: {e}")
+
+    def record(self, platform: str, query: str, keys: List[str]):
+        with self._lock:
+            self.stats.setdefault(platform, {})[query] = {'keys': sorted(set(keys)), 'skipped': 0}
+            self._dirty = True
+
+    def keys(self, platform: str, query: str) -> Optional[set]:
+        with self._lock:
+            entry = self.stats.get(platform, {}).get(query)
+            return set(entry['keys']) if entry else None
+
+    def skip(self, platform: str, query: str) -> bool:
+        """Conta uma execução pulada; True enquanto não for hora de testar a busca de novo"""
+        with self._lock:
+            entry = self.stats.get(platform, {}).get(query)
+            if entry is None or entry['skipped'] + 1 >= QUERY_REPROBE_RUNS:
+                return False
+            entry['skipped'] += 1
+            self._dirty = True
+            return True
+
+    def save(self):
+        with self._lock:
+            if not self._dirty:
+                return
+            tmp_path = self.path + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.stats, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+
+
+class QueryPlanner:
+    """Monta o menor conjunto de buscas de uma plataforma
+
+    1. junta variantes de acento e termos contidos em outros;
+    2. usa OR/AND onde a plataforma aceita, em buscas de até QUERY_MAX_LENGTH;
+    3. pula buscas cujos resultados da última execução já vieram quase todos
+       em outra busca (testadas de novo a cada QUERY_REPROBE_RUNS execuções).
+    """
+
+    def __init__(self, platform: str, stats: QueryStats = None):
+        self.platform = platform
+        self.boolean = PLATFORM_SYNTAX.get(platform, {}).get('boolean', False)
+        self.stats = stats or query_stats
+
+    def plan(self, levels: List[str], tech_terms: List[str] = None, label: str = None) -> List[str]:
+        """Buscas a executar (níveis x termos de TI, se informados)"""
+        naive = len(levels) * (len(tech_terms) if tech_terms else 1)
+
+        levels = drop_contained_terms(fold_terms(levels))
+        tech_terms = drop_contained_terms(fold_terms(tech_terms)) if tech_terms else []
+
+        if self.boolean:
+            queries = self._boolean_queries(levels, tech_terms)
+        elif tech_terms:
+            queries = [f"{level} {term}" for level in levels for term in tech_terms]
+        else:
+            queries = levels
+
+        planned = self._drop_redundant(queries)
+        print(f"🧭 {label or self.platform}: {len(planned)} buscas (plano ingênuo: {naive}, "
+              f"{naive - len(planned)} requisições economizadas)")
+        return planned
+
+    def record(self, query: str, jobs: List[Dict], seconds: float = None):
+        """Guarda o resultado da busca para as estatísticas de sobreposição (e nas métricas)"""
+        self.stats.record(self.platform, query, [job_key(job) for job in jobs])
+        label = query_label(query)
+        QUERY_JOBS.inc(len(jobs), site=self.platform, query=label)
+        if seconds is not None:
+            QUERY_SECONDS.observe(seconds, site=self.platform, query=label)
+
+    def _boolean_queries(self, levels: List[str], tech_terms: List[str]) -> List[str]:
+        """(nível OR nível) AND (termo OR termo), quebrando os termos pelo tamanho máximo"""
+        if not tech_terms:
+            return self._chunk(levels, lambda group: group)
+
+        prefix = f"{self._or_group(levels)} AND "
+        return self._chunk(tech_terms, lambda group: prefix + group, reserved=len(prefix))
+
+    def _chunk(self, terms: List[str], build, reserved: int = 0) -> List[str]:
+        """Agrupa termos em OR respeitando o tamanho máximo da busca"""
+        queries, chunk = [], []
+        for term in terms:
+            candidate = chunk + [term]
+            if chunk and reserved + len(self._or_group(candidate)) > QUERY_MAX_LENGTH:
+                queries.append(build(self._or_group(chunk)))
+                candidate = [term]
+            chunk = candidate
+        if chunk:
+            queries.append(build(self._or_group(chunk)))
+        return queries
+
+    def _or_group(self, terms: List[str]) -> str:
+        quoted = [f'"{term}"' if ' ' in term else term for term in terms]
+        if len(quoted) == 1:
+            return quoted[0]
+        return '(' + ' OR '.join(quoted) + ')'
+
+    def _drop_redundant(self, queries: List[str]) -> List[str]:
+        """Pula buscas cujos resultados vieram quase todos em outra busca mantida"""
+        kept = []
+        for query in queries:
+            keys = self.stats.keys(self.platform, query)
+            covering = None
+            if keys and len(keys) >= QUERY_OVERLAP_MIN_RESULTS:
+                for other in kept:
+                    other_keys = self.stats.keys(self.platform, other) or set()
+                    if len(keys & other_keys) / len(keys) >= QUERY_OVERLAP_THRESHOLD:
+                        covering = other
+                        break
+
+            if covering and self.stats.skip(self.platform, query):
+                print(f"⏭️ '{query}' pulada: resultados já vêm em '{covering}'")
+                continue
+            kept.append(query)
+        return kept
+
+
+# Estatísticas compartilhadas por todos os planejadores
+query_stats = QueryStats()
+atexit.register(query_stats.save)
@@ -0,0 +1,99 @@
+import importlib
+import sys
+import threading
+import time
+from typing import Callable, Dict, List
+from config.settings import SITES, FETCH_TIERS, INFOJOBS_CLIENT_ID, INFOJOBS_CLIENT_SECRET
+
+# Backend de cada camada por site ("módulo:Classe"), importado só quando a camada é usada
+SCRAPER_REGISTRY = {
+    'linkedin': {
+        'api': 'scrapers.linkedin_api:LinkedInApiScraper',
+        'http': 'scrapers.linkedin_http:LinkedInHttpScraper',
+        'selenium': 'scrapers.linkedin_selenium:LinkedInSeleniumScraper',
+    },
+    'gupy': {
+        'api': 'scrapers.gupy_api:GupyApiScraper',
+        'http': 'scrapers.gupy_http:GupyHttpScraper',
+        'selenium': 'scrapers.gupy_selenium:GupySeleniumScraper',
+    },
+    'infojobs': {
+        'api': 'scrapers.infojobs_api:InfoJobsApiScraper',
+    },
+}
+
+# Argumentos do construtor dos backends que precisam de credenciais
+SCRAPER_ARGS = {
+    'scrapers.infojobs_api:InfoJobsApiScraper': lambda: (INFOJOBS_CLIENT_ID, INFOJOBS_CLIENT_SECRET),
+}
+
+# Módulo que traz o Selenium/undetected-chromedriver/webdriver-manager
+BROWSER_MODULE = 'scrapers.selenium_base'
+
+_import_timings = {}
+_import_lock = threading.Lock()
+
+
+def load_backend(path: str):
+    """Importa a classe do backend ('módulo:Classe'), medindo o tempo do import"""
+    module_name, class_name = path.split(':')
+    with _import_lock:
+        if module_name not in sys.modules:
+            started_at = time.perf_counter()
+            importlib.import_module(module_name)
+            elapsed = time.perf_counter() - started_at
+            _import_timings[module_name] = elapsed
+            print(f"📦 {module_name} importado em {elapsed * 1000:.0f} ms")
+    return getattr(sys.modules[module_name], class_name)
+
+
+def lazy_factory(path: str) -> Callable:
+    """Cria o scraper importando o backend só na primeira chamada"""
+    def create():
+        scraper_class = load_backend(path)
+        args = SCRAPER_ARGS.get(path, lambda: ())()
+        return scraper_class(*args)
+    return create
+
+
+def enabled_sites() -> List[str]:
+    """Sites habilitados em SITES que têm backend registrado"""
+    sites = []
+    for site, config in SITES.items():
+        if not config.get('enabled'):
+            continue
+        if site not in SCRAPER_REGISTRY:
+            print(f"⚠️ Site '{site}' habilitado mas sem scraper registrado")
+            continue
+        sites.append(site)
+    return sites
+
+
+def site_tiers(site: str, tiers: List[str] = None) -> Dict[str, Callable]:
+    """Fábricas preguiçosas das camadas do site, na ordem de FETCH_TIERS"""
+    backends = SCRAPER_REGISTRY[site]
+    return {tier: lazy_factory(backends[tier]) for tier in (tiers or FETCH_TIERS) if tier in backends}
+
+
+def browser_loaded() -> bool:
+    """O Selenium já foi importado nesta execução"""
+    return BROWSER_MODULE in sys.modules
+
+
+def get_driver_pool():
+    """Pool de drivers (importa o Selenium só aqui)"""
+    return importlib.import_module(BROWSER_MODULE).get_driver_pool()
+
+
+def import_timings() -> Dict[str, float]:
+    with _import_lock:
+        return dict(_import_timings)
+
+
+def report_import_timings(startup_seconds: float = None):
+    """Imprime o tempo de import na inicialização e dos backends carregados até agora"""
+    if startup_seconds is not None:
+        print(f"⚡ Inicialização: módulos carregados em {startup_seconds * 1000:.0f} ms "
+              f"(Selenium {'carregado' if browser_loaded() else 'não carregado'})")
+    for module_name, elapsed in sorted(import_timings().items(), key=lambda item: -item[1]):
+        print(f"📦 {module_name}: {elapsed * 1000:.0f} ms")
@@ -0,0 +1,196 @@
+import json
+import threading
+import time
+from typing import Dict, Optional
+from config.settings import (BLOCK_RESOURCES, BLOCKED_RESOURCE_GROUPS, PAGE_LOAD_STRATEGY, RESOURCE_REPORT,
+                             SELENIUM_NETWORK_CAPTURE)
+
+# Padrões de URL bloqueados por grupo (Network.setBlockedURLs aceita curinga *)
+BLOCK_PATTERNS = {
+    'image': ['*.png*', '*.jpg*', '*.jpeg*', '*.gif*', '*.webp*', '*.avif*', '*.svg*', '*.ico*',
+              '*media.licdn.com/dms/image*'],
+    'font': ['*.woff*', '*.woff2*', '*.ttf*', '*.otf*', '*.eot*', '*fonts.googleapis.com*', '*fonts.gstatic.com*'],
+    'media': ['*.mp4*', '*.webm*', '*.m3u8*', '*.mp3*', '*.ogg*', '*dms.licdn.com/playlist*'],
+    'tracker': ['*google-analytics.com*', '*googletagmanager.com*', '*doubleclick.net*',
+                '*connect.facebook.net*', '*facebook.com/tr*', '*hotjar.com*', '*clarity.ms*',
+                '*bat.bing.com*', '*px.ads.linkedin.com*', '*snap.licdn.com*', '*analytics.tiktok.com*',
+                '*hs-scripts.com*', '*newrelic.com*', '*nr-data.net*', '*sentry.io*'],
+    'stylesheet': ['*.css*'],
+}
+
+# Tamanho típico (bytes transferidos) por tipo de recurso: o bloqueado não chega a ser
+# baixado, então a economia é só uma estimativa (contagem x tamanho típico), não medida
+TYPICAL_BYTES = {
+    'Image': 30 * 1024,
+    'Font': 40 * 1024,
+    'Media': 500 * 1024,
+    'Script': 25 * 1024,
+    'Stylesheet': 15 * 1024,
+    'Other': 5 * 1024,
+}
+
+
+def blocked_url_patterns(groups=None) -> list:
+    """Padrões de URL dos grupos habilitados"""
+    groups = BLOCKED_RESOURCE_GROUPS if groups is None else groups
+    patterns = []
+    for group in groups:
+        patterns.extend(BLOCK_PATTERNS.get(group.strip().lower(), []))
+    return patterns
+
+
+def configure_options(options):
+    """Carregamento 'eager' (não espera imagens/iframes) e log de rede (relatório e captura de JSON)"""
+    options.page_load_strategy = PAGE_LOAD_STRATEGY
+    if (BLOCK_RESOURCES and RESOURCE_REPORT) or SELENIUM_NETWORK_CAPTURE:
+        options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+    return options
+
+
+def install_blocking(driver) -> bool:
+    """Ativa o bloqueio via CDP no driver (False se o driver não suportar)"""
+    if not BLOCK_RESOURCES:
+        return False
+    patterns = blocked_url_patterns()
+    if not patterns:
+        return False
+    try:
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': patterns})
+        return True
+    except Exception as e:
+        print(f"⚠️ Bloqueio de recursos indisponível: {e}")
+        return False
+
+
+class PageLoadStats:
+    """Requisições e bytes de uma página, a partir do log de performance do Chrome"""
+
+    def __init__(self, url: str = None):
+        self.url = url
+        self.loaded = 0
+        self.loaded_bytes = 0
+        self.blocked = 0
+        self.estimated_saved_bytes = 0
+        self.blocked_by_type = {}
+        self.seconds = 0.0
+
+    def add_events(self, entries):
+        """Soma os eventos de rede (Network.loadingFinished / loadingFailed)"""
+        for entry in entries:
+            try:
+                message = json.loads(entry['message'])['message']
+            except (KeyError, TypeError, ValueError):
+                continue
+            method, params = message.get('method'), message.get('params', {})
+            if method == 'Network.loadingFinished':
+                self.loaded += 1
+                self.loaded_bytes += int(params.get('encodedDataLength') or 0)
+            elif method == 'Network.loadingFailed' and self._was_blocked(params):
+                resource_type = params.get('type') or 'Other'
+                self.blocked += 1
+                self.estimated_saved_bytes += TYPICAL_BYTES.get(resource_type, TYPICAL_BYTES['Other'])
+                self.blocked_by_type[resource_type] = self.blocked_by_type.get(resource_type, 0) + 1
+
+    def _was_blocked(self, params: Dict) -> bool:
+        return bool(params.get('blockedReason')) or 'ERR_BLOCKED_BY_CLIENT' in (params.get('errorText') or '')
+
+    def summary(self) -> str:
+        by_type = ', '.join(f"{count} {name}" for name, count in
+                            sorted(self.blocked_by_type.items(), key=lambda item: -item[1]))
+        return (f"{self.blocked} requisições bloqueadas (estimativa: ~{self.estimated_saved_bytes / 1024:,.0f} KB "
+                f"economizados"
+                f"{': ' + by_type if by_type else ''}), {self.loaded} carregadas "
+                f"({self.loaded_bytes / 1024:,.0f} KB) em {self.seconds:.1f}s")
+
+
+class ResourceSavings:
+    """Totais do bloqueio de recursos na execução (todas as páginas do Selenium)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.totals = {'pages': 0, 'loaded': 0, 'loaded_bytes': 0, 'blocked': 0,
+                           'estimated_saved_bytes': 0, 'seconds': 0.0}
+
+    def add(self, stats: PageLoadStats):
+        with self._lock:
+            self.totals['pages'] += 1
+            self.totals['loaded'] += stats.loaded
+            self.totals['loaded_bytes'] += stats.loaded_bytes
+            self.totals['blocked'] += stats.blocked
+            self.totals['estimated_saved_bytes'] += stats.estimated_saved_bytes
+            self.totals['seconds'] += stats.seconds
+
+    def report(self):
+        """Imprime o total bloqueado (economia estimada) e zera para a próxima execução"""
+        with self._lock:
+            totals = dict(self.totals)
+        if not totals['pages']:
+            return
+        total_requests = totals['loaded'] + totals['blocked']
+        print(f"🚫 Selenium: {totals['blocked']} de {total_requests} requisições bloqueadas em "
+              f"{totals['pages']} páginas (economia estimada pelo tamanho típico de cada tipo: "
+              f"~{totals['estimated_saved_bytes'] / 1048576:.1f} MB; "
+              f"{totals['loaded_bytes'] / 1048576:.1f} MB baixados, "
+              f"{totals['seconds'] / totals['pages']:.1f}s por página)")
+        self.reset()
+
+
+class PageLoadTracker:
+    """Acompanha a página aberta em um driver e fecha o relatório ao sair dela
+
+    É o único leitor do log de performance (get_log esvazia o buffer): quem
+    mais precisar dos eventos, como a captura de JSON, lê por drain().
+    """
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.enabled = BLOCK_RESOURCES and RESOURCE_REPORT
+        self.available = True
+        self._current = None
+        self._started = None
+
+    def start(self, url: str):
+        """Nova navegação: encerra a página anterior e descarta eventos antigos"""
+        self.finish()
+        self.drain()
+        if not self.enabled or not self.available:
+            return
+        self._current = PageLoadStats(url)
+        self._started = time.time()
+
+    def loaded(self):
+        """driver.get retornou (DOMContentLoaded no modo eager)"""
+        if self._current is not None:
+            self._current.seconds = time.time() - self._started
+
+    def finish(self) -> Optional[PageLoadStats]:
+        """Fecha o relatório da página atual (inclui o que carregou na rolagem)"""
+        if self._current is None:
+            return None
+        self.drain()
+        stats, self._current = self._current, None
+        resource_savings.add(stats)
+        print(f"🚫 {stats.summary()}")
+        return stats
+
+    def drain(self) -> list:
+        """Lê os eventos novos do log (somando-os à página atual)"""
+        if not self.available:
+            return []
+        try:
+            entries = self.driver.get_log('performance')
+        except Exception:
+            self.available = False
+            return []
+        if self._current is not None:
+            self._current.add_events(entries)
+        return entries
+
+
+# Totais compartilhados por todos os scrapers Selenium
+resource_savings = ResourceSavings()
@@ -0,0 +1,83 @@
+import atexit
+import json
+import os
+import threading
+from collections import Counter
+from datetime import datetime
+from typing import Dict, List
+from config.settings import SELECTOR_STATS_PATH
+
+
+class SelectorStrategy:
+    """Ordem adaptativa dos seletores por site e campo (persistida entre execuções)
+
+    O seletor que venceu na última página é testado primeiro, depois os mais
+    usados e por fim o resto na ordem original. Em uma execução normal basta
+    um seletor por campo; quando o vencedor muda, o site mudou o HTML.
+    """
+
+    def __init__(self, path: str = SELECTOR_STATS_PATH):
+        self.path = path
+        self.stats = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._load()
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self.stats = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Não foi possível ler {self.path}: {e}")
+
+    def order(self, site: str, field: str, selectors: List[str]) -> List[str]:
+        """Seletores na ordem em que devem ser testados"""
+        with self._lock:
+            entry = self.stats.get(site, {}).get(field)
+            if not entry:
+                return list(selectors)
+            winner, hits = entry.get('winner'), entry.get('hits', {})
+
+        position = {selector: index for index, selector in enumerate(selectors)}
+        return sorted(selectors, key=lambda selector: (
+            selector != winner, -hits.get(selector, 0), position[selector]
+        ))
+
+    def record(self, site: str, field: str, hits: Dict[str, int]):
+        """Registra os seletores que casaram em uma página (o mais frequente vence)"""
+        hits = {selector: count for selector, count in hits.items() if selector and count}
+        if not hits:
+            return
+
+        winner = Counter(hits).most_common(1)[0][0]
+        with self._lock:
+            entry = self.stats.setdefault(site, {}).setdefault(field, {'winner': None, 'hits': {}})
+            for selector, count in hits.items():
+                entry['hits'][selector] = entry['hits'].get(selector, 0) + count
+
+            previous = entry['winner']
+            if previous != winner:
+                if previous:
+                    print(f"🔀 {site}/{field}: seletor mudou de '{previous}' para '{winner}' "
+                          f"(o site pode ter mudado o HTML)")
+                entry['winner'] = winner
+                entry['changed_at'] = datetime.now().isoformat(timespec='seconds')
+            self._dirty = True
+
+    def save(self):
+        """Grava as estatísticas (só se algo mudou)"""
+        with self._lock:
+            if not self._dirty:
+                return
+            tmp_path = self.path + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.stats, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+
+
+# Estratégia compartilhada por todos os scrapers
+selector_strategy = SelectorStrategy()
+atexit.register(selector_strategy.save)
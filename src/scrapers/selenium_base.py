@@ -5,79 +5,298 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from webdriver_manager.chrome import ChromeDriverManager
+import atexit
+import base64
+import json
+import threading
 import time
 import random
+from typing import List, Dict
 import undetected_chromedriver as uc
+from .driver_pool import DriverPool
+from .parse_engine import get_parse_engine
+from .resource_blocker import configure_options, install_blocking, PageLoadTracker
+from .selector_strategy import selector_strategy
+from utils.rate_limiter import rate_limiter
+from utils.metrics import observe_request, count_page, count_error
+from config.settings import (DRIVER_POOL_SIZE, DRIVER_MAX_PAGES, DRIVER_IDLE_TIMEOUT,
+                             PAGE_READY_TIMEOUT, PAGE_STABLE_SECONDS, SELENIUM_EXTRACTION,
+                             SELENIUM_NETWORK_CAPTURE)
+
+# Conta cards na página (-1 se o aviso de "sem resultados" estiver presente)
+_COUNT_CARDS_JS = """
+const [cardSelectors, noResultsSelectors] = arguments;
+for (const selector of noResultsSelectors) {
+    if (document.querySelector(selector)) return -1;
+}
+for (const selector of cardSelectors) {
+    const count = document.querySelectorAll(selector).length;
+    if (count) return count;
+}
+return 0;
+"""
+
+# Extrai os campos dos cards na própria página (mesma regra do extract_card_fields:
+# texto = nós de texto sem espaços nas pontas, atributo = o próprio card primeiro)
+# e conta qual seletor casou em cada campo
+_EXTRACT_CARDS_JS = """
+const [cardSelectors, fields, limit] = arguments;
+const textOf = (element) => {
+    const walker = document.createTreeWalker(element, NodeFilter.SHOW_TEXT);
+    const parts = [];
+    while (walker.nextNode()) {
+        const part = walker.currentNode.nodeValue.trim();
+        if (part) parts.push(part);
+    }
+    return parts.join('');
+};
+const hits = {};
+const fieldOf = (card, name, [selectors, attr]) => {
+    if (attr && card.getAttribute(attr)) return card.getAttribute(attr);
+    for (const selector of selectors) {
+        const found = card.querySelector(selector);
+        if (!found) continue;
+        const value = attr ? found.getAttribute(attr) : textOf(found);
+        if (value) {
+            hits[name] = hits[name] || {};
+            hits[name][selector] = (hits[name][selector] || 0) + 1;
+            return value;
+        }
+    }
+    return null;
+};
+for (const selector of cardSelectors) {
+    const cards = Array.from(document.querySelectorAll(selector));
+    if (!cards.length) continue;
+    const values = cards.slice(0, limit || cards.length).map((card) => {
+        const cardValues = {};
+        for (const [name, spec] of Object.entries(fields)) cardValues[name] = fieldOf(card, name, spec);
+        return cardValues;
+    });
+    return {selector: selector, cards: values, hits: hits};
+}
+return {selector: null, cards: [], hits: hits};
+"""
+
+# Busca um JSON com os cookies da página (execute_async_script: o último argumento é o callback)
+_FETCH_JSON_JS = """
+const url = arguments[0];
+const done = arguments[arguments.length - 1];
+fetch(url, {credentials: 'include', headers: {'Accept': 'application/json'}})
+    .then((response) => response.ok ? response.json() : null)
+    .then(done, () => done(null));
+"""
+
+_driver_pools = {}
+_driver_pools_lock = threading.Lock()
+
+
+def build_chrome_driver(headless=True):
+    """Configura o ChromeDriver de forma stealth"""
+    try:
+        options = uc.ChromeOptions()
+        
+        # Configurações para evitar detecção
+        options.add_argument('--no-sandbox')
+        options.add_argument('--disable-dev-shm-usage')
+        options.add_argument('--disable-blink-features=AutomationControlled')
+        options.add_argument('--disable-features=VizDisplayCompositor')
+        options.add_argument('--disable-background-timer-throttling')
+        options.add_argument('--disable-backgrounding-occluded-windows')
+        options.add_argument('--disable-renderer-backgrounding')
+        options.add_argument('--disable-web-security')
+        options.add_argument('--disable-features=TranslateUI')
+        options.add_argument('--disable-ipc-flooding-protection')
+        options.add_argument('--enable-features=NetworkService,NetworkServiceInProcess')
+        options.add_argument('--disable-client-side-phishing-detection')
+        options.add_argument('--disable-popup-blocking')
+        options.add_argument('--disable-hang-monitor')
+        options.add_argument('--disable-sync')
+        options.add_argument('--disable-default-apps')
+        options.add_argument('--disable-notifications')
+        options.add_argument('--disable-extensions')
+        options.add_argument('--disable-application-cache')
+        options.add_argument('--media-cache-size=1')
+        options.add_argument('--disk-cache-size=1')
+        options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
+        
+        if headless:
+            options.add_argument('--headless=new')
+        
+        # Não espera imagens/iframes e registra a rede para o relatório de bloqueio
+        configure_options(options)
+        
+        # Usa undetected-chromedriver para evitar detecção
+        driver = uc.Chrome(
+            options=options,
+            service=Service(ChromeDriverManager().install())
+        )
+        
+        # Script para remover webdriver property
+        driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+        install_blocking(driver)
+        return driver
+        
+    except Exception as e:
+        print(f"❌ Erro ao configurar driver: {e}")
+        return _build_fallback_driver(headless)
+
+
+def _build_fallback_driver(headless=True):
+    """Configuração fallback caso undetected-chromedriver falhe"""
+    try:
+        options = Options()
+        options.add_argument('--no-sandbox')
+        options.add_argument('--disable-dev-shm-usage')
+        options.add_argument('--disable-blink-features=AutomationControlled')
+        options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
+        
+        if headless:
+            options.add_argument('--headless=new')
+        configure_options(options)
+        
+        driver = webdriver.Chrome(
+            service=Service(ChromeDriverManager().install()),
+            options=options
+        )
+        install_blocking(driver)
+        return driver
+    except Exception as e:
+        print(f"❌ Erro no fallback driver: {e}")
+        return None
+
+
+def get_driver_pool(headless=True) -> DriverPool:
+    """Retorna o pool de drivers compartilhado (um por modo headless)"""
+    with _driver_pools_lock:
+        pool = _driver_pools.get(headless)
+        if pool is None:
+            pool = DriverPool(
+                factory=lambda: build_chrome_driver(headless),
+                max_size=DRIVER_POOL_SIZE,
+                max_pages=DRIVER_MAX_PAGES,
+                idle_timeout=DRIVER_IDLE_TIMEOUT
+            )
+            atexit.register(pool.shutdown)
+            _driver_pools[headless] = pool
+        return pool
+
 
 class SeleniumScraper:
+    # Nome do site nas estatísticas de seletores (None desativa a ordem adaptativa)
+    site = None
+    
     def __init__(self, headless=True):
         self.driver = None
         self.headless = headless
-        self.setup_driver()
+        self._pooled = None
+        self.blocked = False
+        self.page_tracker = None
+        self.parser = get_parse_engine()
     
     def setup_driver(self):
-        """Configura o ChromeDriver de forma stealth"""
+        """Retira um ChromeDriver do pool compartilhado"""
+        if self._pooled is None:
+            self._pooled = get_driver_pool(self.headless).acquire()
+            self.driver = self._pooled.driver if self._pooled else None
+            self.page_tracker = PageLoadTracker(self.driver) if self.driver else None
+        return self.driver
+    
+    def navigate(self, url: str) -> float:
+        """Abre a URL passando pelo rate limiter; retorna o tempo esperado"""
+        waited = rate_limiter.acquire(url)
+        if self.page_tracker:
+            self.page_tracker.start(url)
+        started_at = time.perf_counter()
+        self.driver.get(url)
+        observe_request(url, 'browser', time.perf_counter() - started_at)
+        if self.page_tracker:
+            self.page_tracker.loaded()
+        if self._pooled:
+            self._pooled.pages_served += 1
+        
+        # Redirecionamento para login/captcha indica bloqueio
+        if self._is_blocked():
+            print("❌ Site bloqueou o acesso (login/captcha)")
+            self.blocked = True
+            rate_limiter.penalize(url)
+            count_error(url, 'blocked')
+        else:
+            rate_limiter.reward(url)
+            count_page(url, 'browser')
+        return waited
+    
+    def enable_network_capture(self) -> bool:
+        """Liga o domínio Network do CDP para guardar os corpos das respostas (antes do navigate)"""
+        if not SELENIUM_NETWORK_CAPTURE or not self.page_tracker or not self.page_tracker.available:
+            return False
         try:
-            options = uc.ChromeOptions()
-            
-            # Configurações para evitar detecção
-            options.add_argument('--no-sandbox')
-            options.add_argument('--disable-dev-shm-usage')
-            options.add_argument('--disable-blink-features=AutomationControlled')
-            options.add_argument('--disable-features=VizDisplayCompositor')
-            options.add_argument('--disable-background-timer-throttling')
-            options.add_argument('--disable-backgrounding-occluded-windows')
-            options.add_argument('--disable-renderer-backgrounding')
-            options.add_argument('--disable-web-security')
-            options.add_argument('--disable-features=TranslateUI')
-            options.add_argument('--disable-ipc-flooding-protection')
-            options.add_argument('--enable-features=NetworkService,NetworkServiceInProcess')
-            options.add_argument('--disable-client-side-phishing-detection')
-            options.add_argument('--disable-popup-blocking')
-            options.add_argument('--disable-hang-monitor')
-            options.add_argument('--disable-sync')
-            options.add_argument('--disable-default-apps')
-            options.add_argument('--disable-notifications')
-            options.add_argument('--disable-extensions')
-            options.add_argument('--disable-application-cache')
-            options.add_argument('--media-cache-size=1')
-            options.add_argument('--disk-cache-size=1')
-            options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
-            
-            if self.headless:
-                options.add_argument('--headless=new')
-            
-            # Usa undetected-chromedriver para evitar detecção
-            self.driver = uc.Chrome(
-                options=options,
-                service=Service(ChromeDriverManager().install())
-            )
-            
-            # Script para remover webdriver property
-            self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+            self.driver.execute_cdp_cmd('Network.enable', {})
+            return True
+        except Exception as e:
+            print(f"⚠️ Captura de rede indisponível: {e}")
+            return False
+    
+    def capture_json_responses(self, url_contains: str, timeout=None) -> List[tuple]:
+        """(url, JSON) das respostas cuja URL contém url_contains, lidas do log de performance
+        
+        Espera a primeira resposta até o timeout e devolve todas as que já
+        terminaram de carregar (o corpo vem de Network.getResponseBody).
+        """
+        deadline = time.time() + (timeout or PAGE_READY_TIMEOUT)
+        pending, captured = {}, []
+        while time.time() < deadline:
+            for entry in self.page_tracker.drain():
+                try:
+                    message = json.loads(entry['message'])['message']
+                except (KeyError, TypeError, ValueError):
+                    continue
+                params = message.get('params', {})
+                if message.get('method') == 'Network.responseReceived':
+                    url = params.get('response', {}).get('url', '')
+                    if url_contains in url and 'json' in params.get('response', {}).get('mimeType', ''):
+                        pending[params['requestId']] = url
+                elif message.get('method') == 'Network.loadingFinished' and params.get('requestId') in pending:
+                    url = pending.pop(params['requestId'])
+                    payload = self._response_body_json(params['requestId'])
+                    if payload is not None:
+                        captured.append((url, payload))
+                elif message.get('method') == 'Network.loadingFailed':
+                    pending.pop(params.get('requestId'), None)
             
+            if captured and not pending:
+                return captured
+            time.sleep(0.25)
+        return captured
+    
+    def _response_body_json(self, request_id: str):
+        try:
+            body = self.driver.execute_cdp_cmd('Network.getResponseBody', {'requestId': request_id})
+            text = body.get('body', '')
+            if body.get('base64Encoded'):
+                text = base64.b64decode(text).decode('utf-8', 'replace')
+            return json.loads(text)
         except Exception as e:
-            print(f"❌ Erro ao configurar driver: {e}")
-            self._setup_fallback_driver()
+            print(f"⚠️ Corpo da resposta indisponível: {e}")
+            return None
     
-    def _setup_fallback_driver(self):
-        """Configuração fallback caso undetected-chromedriver falhe"""
+    def fetch_json_in_browser(self, url: str):
+        """GET de um JSON pela própria página (mesma sessão e cookies); None se falhar"""
+        rate_limiter.acquire(url)
         try:
-            options = Options()
-            options.add_argument('--no-sandbox')
-            options.add_argument('--disable-dev-shm-usage')
-            options.add_argument('--disable-blink-features=AutomationControlled')
-            options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
-            
-            if self.headless:
-                options.add_argument('--headless=new')
-            
-            self.driver = webdriver.Chrome(
-                service=Service(ChromeDriverManager().install()),
-                options=options
-            )
+            return self.driver.execute_async_script(_FETCH_JSON_JS, url)
         except Exception as e:
-            print(f"❌ Erro no fallback driver: {e}")
+            print(f"⚠️ Requisição pelo navegador falhou: {e}")
+            return None
+    
+    def _is_blocked(self) -> bool:
+        """Verifica se a navegação caiu em página de bloqueio"""
+        blocked_indicators = ["authwall", "checkpoint", "captcha", "challenge"]
+        try:
+            current_url = self.driver.current_url.lower()
+        except Exception:
+            return False
+        return any(indicator in current_url for indicator in blocked_indicators)
     
     def human_delay(self, min_seconds=2, max_seconds=5):
         """Delay humanoide entre ações"""
@@ -93,6 +312,28 @@ class SeleniumScraper:
             self.driver.execute_script(f"window.scrollTo(0, {scroll_to});")
             self.human_delay(1, 2)
     
+    def scroll_for_new_jobs(self, extract_jobs, scroll_step, steps: int, watermark=None, limit: int = 15) -> List[Dict]:
+        """Rola a página por etapas enquanto aparecem vagas novas
+        
+        Para ao atingir o limite de vagas ou quando o trecho carregado na última
+        rolagem só tem vagas já vistas em execuções anteriores (watermark).
+        """
+        jobs = extract_jobs()
+        checked = 0
+        for step in range(steps):
+            if len(jobs) >= limit:
+                break
+            if watermark is not None and watermark.page_is_seen(jobs[checked:]):
+                print(f"⏹️ '{watermark.query}': só vagas já vistas, parando a rolagem")
+                break
+            checked = len(jobs)
+            scroll_step()
+            jobs = extract_jobs()
+        
+        if watermark is not None:
+            watermark.observe(jobs)
+        return jobs
+    
     def wait_for_element(self, selector, by=By.CSS_SELECTOR, timeout=10):
         """Aguarda elemento aparecer"""
         try:
@@ -103,6 +344,43 @@ class SeleniumScraper:
         except:
             return None
     
+    def wait_for_page_ready(self, card_selectors, no_results_selectors=(), timeout=None, stable_seconds=None) -> str:
+        """Aguarda os cards carregarem e pararem de mudar (ou o aviso de sem resultados)
+        
+        Retorna 'results', 'no_results' ou 'timeout'.
+        """
+        timeout = timeout or PAGE_READY_TIMEOUT
+        stable_seconds = stable_seconds if stable_seconds is not None else PAGE_STABLE_SECONDS
+        deadline = time.time() + timeout
+        card_selectors = list(card_selectors)
+        no_results_selectors = list(no_results_selectors)
+        
+        # Primeiro card ou aviso de "sem resultados"
+        if not self.wait_for_element(', '.join(card_selectors + no_results_selectors), timeout=timeout):
+            return 'timeout'
+        
+        # Aguarda a contagem de cards estabilizar
+        last_count = -1
+        stable_since = time.time()
+        while time.time() < deadline:
+            try:
+                count = self.driver.execute_script(_COUNT_CARDS_JS, card_selectors, no_results_selectors)
+            except Exception:
+                count = 0
+            
+            if count < 0:
+                return 'no_results'
+            
+            now = time.time()
+            if count != last_count:
+                last_count = count
+                stable_since = now
+            elif count > 0 and now - stable_since >= stable_seconds:
+                return 'results'
+            time.sleep(0.25)
+        
+        return 'results' if last_count > 0 else 'timeout'
+    
     def find_elements_safe(self, selector, by=By.CSS_SELECTOR):
         """Encontra elementos com tratamento de erro"""
         try:
@@ -121,7 +399,116 @@ class SeleniumScraper:
         """Retorna o HTML da página"""
         return self.driver.page_source
     
-    def close(self):
-        """Fecha o driver"""
-        if self.driver:
-            self.driver.quit()
\ No newline at end of file
+    def parse_page(self, scope=None):
+        """Parseia o HTML atual (só a subárvore do scope, se informado)"""
+        return self.parser.parse(self.driver.page_source, scope)
+    
+    def smart_find_all(self, root, selectors: list, field='cards', hits: Dict = None):
+        """Tenta múltiplos seletores (vencedor anterior primeiro) até encontrar elementos
+        
+        Com hits, o acerto (um voto por elemento) é somado aos da página em vez
+        de registrado na hora; quem chama registra tudo com record_selector_hits.
+        """
+        for selector in self.ordered_selectors(field, selectors):
+            elements = self.parser.select(root, selector)
+            if elements:
+                page_hits = {} if hits is None else hits
+                field_hits = page_hits.setdefault(field, {})
+                field_hits[selector] = field_hits.get(selector, 0) + len(elements)
+                if hits is None:
+                    self.record_selector_hits(page_hits)
+                return elements
+        return []
+    
+    def ordered_selectors(self, field: str, selectors: list) -> list:
+        """Ordem adaptativa dos seletores do campo neste site"""
+        if not self.site:
+            return list(selectors)
+        return selector_strategy.order(self.site, field, selectors)
+    
+    def record_selector_hits(self, hits: Dict[str, Dict[str, int]]):
+        """Registra quais seletores casaram em cada campo nesta página"""
+        if not self.site:
+            return
+        for field, field_hits in hits.items():
+            selector_strategy.record(self.site, field, field_hits)
+    
+    def extract_cards(self, card_selectors, card_fields, limit=None, scope=None) -> List[Dict]:
+        """Campos de cada card da página
+        
+        card_fields mapeia campo -> (seletores, atributo ou None para texto).
+        No modo 'browser' tudo roda em um execute_script e só o JSON compacto
+        volta pelo WebDriver; no modo 'html' (ou se o script falhar) o
+        page_source é parseado em Python.
+        """
+        card_fields = {
+            name: (self.ordered_selectors(name, selectors), attr)
+            for name, (selectors, attr) in card_fields.items()
+        }
+        
+        if SELENIUM_EXTRACTION == 'browser':
+            result = self.extract_cards_in_browser(
+                self.ordered_selectors('cards', card_selectors), card_fields, limit
+            )
+            if result is not None:
+                hits = dict(result['hits'])
+                if result['selector']:
+                    hits['cards'] = {result['selector']: len(result['cards'])}
+                self.record_selector_hits(hits)
+                return result['cards']
+        
+        root = self.parse_page(scope)
+        hits = {}
+        elements = self.smart_find_all(root, card_selectors, hits=hits)[:limit]
+        cards = [self.extract_card_fields(element, card_fields, hits) for element in elements]
+        self.record_selector_hits(hits)
+        return cards
+    
+    def extract_cards_in_browser(self, card_selectors, card_fields, limit=None):
+        """Extrai os cards com um único execute_script (None se falhar)"""
+        fields = {name: [list(selectors), attr] for name, (selectors, attr) in card_fields.items()}
+        try:
+            return self.driver.execute_script(_EXTRACT_CARDS_JS, list(card_selectors), fields, limit or 0)
+        except Exception as e:
+            print(f"⚠️ Extração no navegador falhou, usando o HTML: {e}")
+            return None
+    
+    def extract_card_fields(self, card, card_fields, hits=None) -> Dict:
+        """Mesma extração do _EXTRACT_CARDS_JS, sobre a árvore do parse engine"""
+        values = {}
+        for name, (selectors, attr) in card_fields.items():
+            value = self.parser.attr(card, attr) if attr else None
+            matched = None
+            for selector in selectors:
+                if value:
+                    break
+                found = self.parser.select_one(card, selector)
+                if found is None:
+                    continue
+                value = self.parser.attr(found, attr) if attr else self.parser.text(found)
+                matched = selector if value else None
+            if matched and hits is not None:
+                field_hits = hits.setdefault(name, {})
+                field_hits[matched] = field_hits.get(matched, 0) + 1
+            values[name] = value or None
+        return values
+    
+    def _extract_text_safe(self, element, selectors, default="N/A"):
+        """Extrai texto com segurança"""
+        for selector in selectors:
+            found = self.parser.select_one(element, selector)
+            if found is not None:
+                text = self.parser.text(found)
+                if text:
+                    return text
+        return default
+    
+    def close(self, discard=False):
+        """Devolve o driver ao pool (discard=True descarta o navegador)"""
+        if self.page_tracker:
+            self.page_tracker.finish()
+            self.page_tracker = None
+        if self._pooled:
+            get_driver_pool(self.headless).release(self._pooled, discard=discard)
+        self._pooled = None
+        self.driver = None
\ No newline at end of file
@@ -0,0 +1,127 @@
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+from models.job import Job, to_jobs
+from utils.metrics import TIER_SECONDS, TIER_SERVED
+from config.settings import (JOB_LEVELS, TECH_KEYWORDS, LOCATION, TIER_MIN_RESULTS,
+                             TIER_CACHE_TTL, TIER_FAILURE_COOLDOWN)
+
+
+class TierResult:
+    """Resultado de uma camada em uma execução"""
+
+    def __init__(self, tier: str, jobs: List[Job], status: str, seconds: float):
+        self.tier = tier
+        self.jobs = jobs
+        self.status = status  # ok, few, blocked, error
+        self.seconds = seconds
+        self.at = time.time()
+
+    @property
+    def ok(self) -> bool:
+        return self.status == 'ok'
+
+
+class TieredFetcher:
+    """Coleta de um site em camadas: API -> HTTP (cloudscraper) -> Selenium
+
+    A camada seguinte só é usada quando a anterior falha, é bloqueada ou
+    traz menos de TIER_MIN_RESULTS vagas. Os scrapers são criados sob
+    demanda, então o navegador só sobe quando a coleta chega nele. O
+    resultado bom de cada camada fica em cache por TIER_CACHE_TTL e uma
+    camada que deu erro ou foi bloqueada é pulada por TIER_FAILURE_COOLDOWN
+    segundos (poucas vagas pode ser só um dia fraco, então não conta).
+    """
+
+    def __init__(self, site: str, tiers: Dict[str, Callable]):
+        self.site = site
+        self.tiers = dict(tiers)
+        self._scrapers = {}
+        self._cache: Dict[str, TierResult] = {}
+        self._failed_at: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self.last_tier = None
+
+    @property
+    def needs_browser(self) -> bool:
+        """O Selenium é a primeira camada (vale aquecer o navegador)"""
+        return next(iter(self.tiers), None) == 'selenium'
+
+    def fetch(self) -> List[Job]:
+        """Vagas do site, vindas da primeira camada que responder bem"""
+        with self._lock:
+            best = None
+            for tier in self.tiers:
+                cached = self._cached(tier)
+                if cached is not None:
+                    print(f"🗃️ {self.site}: resultado da camada '{tier}' em cache ({len(cached.jobs)} vagas)")
+                    return self._served(cached)
+
+                if self._cooling_down(tier):
+                    print(f"⏭️ {self.site}: camada '{tier}' falhou há pouco, pulando")
+                    continue
+
+                result = self._run_tier(tier)
+                TIER_SECONDS.observe(result.seconds, site=self.site, tier=tier, status=result.status)
+                if result.ok:
+                    self._cache[tier] = result
+                    self._failed_at.pop(tier, None)
+                    return self._served(result)
+
+                if result.status in ('error', 'blocked'):
+                    self._failed_at[tier] = time.time()
+                else:
+                    self._failed_at.pop(tier, None)  # Respondeu, só trouxe poucas vagas
+                print(f"⤵️ {self.site}: camada '{tier}' {self._describe(result)}, tentando a próxima")
+                if best is None or len(result.jobs) > len(best.jobs):
+                    best = result
+
+            # Nenhuma camada foi plausível: fica com a que trouxe mais vagas
+            return self._served(best) if best else []
+
+    def _run_tier(self, tier: str) -> TierResult:
+        started_at = time.time()
+        try:
+            scraper = self._scraper(tier)
+            scraper.blocked = False
+            jobs = to_jobs(scraper.scrape_jobs(JOB_LEVELS, TECH_KEYWORDS, LOCATION) or [])
+        except Exception as e:
+            print(f"❌ {self.site}: erro na camada '{tier}': {e}")
+            return TierResult(tier, [], 'error', time.time() - started_at)
+
+        if getattr(scraper, 'blocked', False):
+            status = 'blocked'
+        elif len(jobs) < TIER_MIN_RESULTS:
+            status = 'few'
+        else:
+            status = 'ok'
+        return TierResult(tier, jobs, status, time.time() - started_at)
+
+    def _scraper(self, tier: str):
+        """Cria o scraper da camada na primeira vez que ela é usada"""
+        if tier not in self._scrapers:
+            self._scrapers[tier] = self.tiers[tier]()
+        return self._scrapers[tier]
+
+    def _cached(self, tier: str) -> Optional[TierResult]:
+        cached = self._cache.get(tier)
+        if cached is not None and time.time() - cached.at < TIER_CACHE_TTL:
+            return cached
+        return None
+
+    def _cooling_down(self, tier: str) -> bool:
+        failed_at = self._failed_at.get(tier)
+        is_last = tier == list(self.tiers)[-1]
+        return not is_last and failed_at is not None and time.time() - failed_at < TIER_FAILURE_COOLDOWN
+
+    def _served(self, result: TierResult) -> List[Job]:
+        self.last_tier = result.tier
+        TIER_SERVED.inc(site=self.site, tier=result.tier)
+        return list(result.jobs)
+
+    def _describe(self, result: TierResult) -> str:
+        return {
+            'blocked': 'foi bloqueada',
+            'error': 'deu erro',
+            'few': f"trouxe só {len(result.jobs)} vagas",
+        }.get(result.status, result.status)
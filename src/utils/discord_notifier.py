@@ -1,15 +1,86 @@
 import requests
 import json
-from typing import List, Dict
+import threading
+from typing import List, Dict, Tuple
 from datetime import datetime
 import time
-from config.settings import DISCORD_WEBHOOK_URL
+from requests.adapters import HTTPAdapter
+from config.settings import (
+    DISCORD_WEBHOOK_URL, DISCORD_MAX_RETRIES, DISCORD_POOL_SIZE,
+    DISCORD_CONNECT_TIMEOUT, DISCORD_READ_TIMEOUT
+)
+from models.job import JobLike
+from utils.metrics import WEBHOOK_SECONDS, WEBHOOK_RETRIES, WEBHOOK_FAILURES
+
+# Limites de uma mensagem de webhook do Discord
+MAX_EMBEDS_PER_MESSAGE = 10
+MAX_EMBED_CHARS_PER_MESSAGE = 6000
+
+# Webhook inválido (401/403/404) ou rate limit não é culpa da mensagem
+WEBHOOK_ERROR_STATUSES = (401, 403, 404, 429)
+
+
+def _is_success(status: int) -> bool:
+    return 200 <= status < 300
+
+
+def _is_rejection(status: int) -> bool:
+    """O Discord recusou o conteúdo da mensagem (reenviar não adianta)"""
+    return 400 <= status < 500 and status not in WEBHOOK_ERROR_STATUSES
+
+
+class CountingAdapter(HTTPAdapter):
+    """HTTPAdapter que conta as conexões abertas (as demais requisições reaproveitaram o keep-alive)"""
+    
+    def __init__(self, *args, **kwargs):
+        self.new_connections = 0
+        self._count_lock = threading.Lock()
+        super().__init__(*args, **kwargs)
+    
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        # Cada pool cria conexões de uma subclasse que conta o connect()
+        self.poolmanager.pool_classes_by_scheme = {
+            scheme: type(pool_cls.__name__, (pool_cls,), {'ConnectionCls': self._counting(pool_cls.ConnectionCls)})
+            for scheme, pool_cls in self.poolmanager.pool_classes_by_scheme.items()
+        }
+    
+    def _counting(self, connection_cls):
+        adapter = self
+        
+        class CountingConnection(connection_cls):
+            def connect(self):
+                with adapter._count_lock:
+                    adapter.new_connections += 1
+                return super().connect()
+        
+        return CountingConnection
+
 
 class DiscordNotifier:
     def __init__(self):
         self.webhook_url = DISCORD_WEBHOOK_URL
+        self._rate_limit_reset_at = 0.0
+        self.session = self._build_session()
+        self._stats_lock = threading.Lock()
+        self._stats = {'requests': 0, 'latency': 0.0, 'max_latency': 0.0}
+    
+    def _build_session(self) -> requests.Session:
+        """Sessão com pool de conexões keep-alive (evita um handshake TLS por mensagem)"""
+        session = requests.Session()
+        # Retentativas ficam com o _post, que respeita o rate limit do Discord
+        self.adapter = CountingAdapter(pool_connections=1, pool_maxsize=DISCORD_POOL_SIZE,
+                                       max_retries=0, pool_block=False)
+        session.mount('https://', self.adapter)
+        session.mount('http://', self.adapter)
+        session.headers.update({'Content-Type': 'application/json'})
+        return session
+    
+    def close(self):
+        """Fecha as conexões abertas com o Discord"""
+        self.session.close()
     
-    def send_jobs(self, jobs: List[Dict]):
+    def send_jobs(self, jobs: List[JobLike]):
         """Envia vagas para o webhook do Discord"""
         if not self.webhook_url:
             print("❌ Webhook do Discord não configurado")
@@ -21,54 +92,57 @@ class DiscordNotifier:
             print(message)
             return self._send_simple_message(message)
         
+        if not self.send_summary(jobs):
+            return False
+        delivered, _ = self.deliver_jobs(jobs)
+        return len(delivered) > 0
+    
+    def send_summary(self, jobs: List[JobLike]) -> bool:
+        """Envia o resumo de um lote de vagas novas (uma vez, fora das retentativas)"""
+        if not self.webhook_url:
+            print("❌ Webhook do Discord não configurado")
+            return False
+        
+        if not self._send_summary(jobs):
+            print("❌ Falha ao enviar resumo para Discord")
+            return False
+        return True
+    
+    def deliver_jobs(self, jobs: List[JobLike]) -> Tuple[List[JobLike], List[JobLike]]:
+        """Envia os embeds das vagas; retorna (confirmadas, recusadas pelo Discord)"""
+        if not self.webhook_url:
+            print("❌ Webhook do Discord não configurado")
+            return [], []
+        
         print(f"📤 Enviando {len(jobs)} vagas para Discord...")
         
         try:
-            # Envia um resumo primeiro
-            summary_sent = self._send_summary(jobs)
-            if not summary_sent:
-                print("❌ Falha ao enviar resumo para Discord")
-                return False
-            
-            # Envia cada vaga individualmente
-            success_count = 0
-            for job in jobs[:8]:  # Limita a 8 vagas
-                sent = self._send_job_embed(job)
-                if sent:
-                    success_count += 1
-                time.sleep(1)
-            
-            if len(jobs) > 8:
-                remaining = len(jobs) - 8
-                self._send_simple_message(f"📊 ... e mais {remaining} vagas!")
+            # Envia as vagas em lotes de até 10 embeds por mensagem
+            delivered, rejected = self._send_job_embeds(jobs)
             
-            print(f"✅ {success_count}/{len(jobs)} vagas enviadas para Discord")
-            return success_count > 0
+            print(f"✅ {len(delivered)}/{len(jobs)} vagas enviadas para Discord")
+            if rejected:
+                print(f"🚫 {len(rejected)} vagas recusadas pelo Discord")
+            self.report()
+            return delivered, rejected
             
         except Exception as e:
             print(f"❌ Erro ao enviar para Discord: {e}")
-            return False
+            return [], []
     
     def _send_simple_message(self, message: str):
         """Envia uma mensagem simples"""
         try:
             data = {"content": message}
-            response = requests.post(
-                self.webhook_url,
-                json=data,
-                headers={'Content-Type': 'application/json'},
-                timeout=10
-            )
-            response.raise_for_status()
-            return True
+            return self._post(data)
         except Exception as e:
             print(f"❌ Erro ao enviar mensagem: {e}")
             return False
     
-    def _send_summary(self, jobs: List[Dict]):
+    def _send_summary(self, jobs: List[JobLike]):
         """Envia resumo das vagas"""
         try:
-            platforms = list(set(job['platform'] for job in jobs))
+            platforms = sorted(set(job.get('platform') or 'N/A' for job in jobs))
             
             summary = {
                 "content": f"🚀 **{len(jobs)} NOVAS VAGAS DE TI ENCONTRADAS!**",
@@ -98,64 +172,199 @@ class DiscordNotifier:
                 ]
             }
             
-            response = requests.post(
-                self.webhook_url,
-                json=summary,
-                headers={'Content-Type': 'application/json'},
-                timeout=10
-            )
-            response.raise_for_status()
-            return True
+            return self._post(summary)
             
         except Exception as e:
             print(f"❌ Erro ao enviar resumo: {e}")
             return False
     
-    def _send_job_embed(self, job: Dict):
-        """Envia uma vaga como embed"""
-        try:
-            title = job['title'][:200] + "..." if len(job['title']) > 200 else job['title']
+    def _send_job_embeds(self, jobs: List[JobLike]) -> Tuple[List[JobLike], List[JobLike]]:
+        """Envia as vagas em lotes; retorna (confirmadas, recusadas pelo Discord)"""
+        delivered, rejected = [], []
+        
+        for batch in self._pack_embeds(jobs):
+            status = self._post_status({"embeds": [embed for _, embed in batch]})
+            if _is_success(status):
+                delivered.extend(job for job, _ in batch)
+            elif _is_rejection(status) and len(batch) > 1:
+                # Um embed inválido derruba o lote inteiro: reenvia um a um para achar qual
+                print(f"🔎 Lote de {len(batch)} vagas recusado, reenviando uma a uma")
+                for job, embed in batch:
+                    status = self._post_status({"embeds": [embed]})
+                    if _is_success(status):
+                        delivered.append(job)
+                    elif _is_rejection(status):
+                        rejected.append(job)
+            elif _is_rejection(status):
+                rejected.extend(job for job, _ in batch)
+            else:
+                print(f"❌ Falha ao enviar lote de {len(batch)} vagas")
+        
+        return delivered, rejected
+    
+    def _pack_embeds(self, jobs: List[JobLike]) -> List[List]:
+        """Agrupa os embeds respeitando os limites de uma mensagem"""
+        batches = []
+        batch, batch_chars = [], 0
+        
+        for job in jobs:
+            embed = self._build_job_embed(job)
+            embed_chars = self._embed_chars(embed)
             
-            embed = {
-                "embeds": [
-                    {
-                        "title": f"🏢 {title}",
-                        "color": 0x3498db,
-                        "fields": [
-                            {
-                                "name": "Empresa",
-                                "value": job.get('company', 'N/A')[:100],
-                                "inline": True
-                            },
-                            {
-                                "name": "Localização",
-                                "value": job.get('location', 'N/A')[:50],
-                                "inline": True
-                            },
-                            {
-                                "name": "Plataforma",
-                                "value": job.get('platform', 'N/A'),
-                                "inline": True
-                            }
-                        ],
-                        "url": job.get('url', '#'),
-                        "footer": {
-                            "text": "🤖 Vagas TI Bot - Salvador/BA"
-                        },
-                        "timestamp": datetime.now().isoformat()
-                    }
-                ]
-            }
+            if batch and (len(batch) >= MAX_EMBEDS_PER_MESSAGE
+                          or batch_chars + embed_chars > MAX_EMBED_CHARS_PER_MESSAGE):
+                batches.append(batch)
+                batch, batch_chars = [], 0
+            
+            batch.append((job, embed))
+            batch_chars += embed_chars
+        
+        if batch:
+            batches.append(batch)
+        return batches
+    
+    def _embed_chars(self, embed: Dict) -> int:
+        """Caracteres que contam para o limite do Discord"""
+        total = len(embed.get('title', '')) + len(embed.get('description', ''))
+        total += len(embed.get('footer', {}).get('text', ''))
+        for field in embed.get('fields', []):
+            total += len(field['name']) + len(field['value'])
+        return total
+    
+    def _build_job_embed(self, job: JobLike) -> Dict:
+        """Monta o embed de uma vaga"""
+        # Campo vazio faz o Discord recusar a mensagem (400): vazio ou ausente vira 'N/A'
+        title = job.get('title') or 'N/A'
+        title = title[:200] + "..." if len(title) > 200 else title
+        
+        embed = {
+            "title": f"🏢 {title}",
+            "color": 0x3498db,
+            "fields": [
+                {
+                    "name": "Empresa",
+                    "value": (job.get('company') or 'N/A')[:100],
+                    "inline": True
+                },
+                {
+                    "name": "Localização",
+                    "value": (job.get('location') or 'N/A')[:50],
+                    "inline": True
+                },
+                {
+                    "name": "Plataforma",
+                    "value": (job.get('platform') or 'N/A')[:50],
+                    "inline": True
+                }
+            ],
+            "footer": {
+                "text": "🤖 Vagas TI Bot - Salvador/BA"
+            },
+            "timestamp": datetime.now().isoformat()
+        }
+        
+        # URL inválida ('#') faria o Discord recusar o lote inteiro
+        url = job.get('url') or '#'
+        if url.startswith('http'):
+            embed["url"] = url
+        return embed
+    
+    def _post(self, payload: Dict) -> bool:
+        """Envia ao webhook; True se o Discord aceitou"""
+        return _is_success(self._post_status(payload))
+    
+    def _post_status(self, payload: Dict) -> int:
+        """Envia ao webhook respeitando os headers de rate limit do Discord
+        
+        Retorna o status final (0 se nem chegou a haver resposta).
+        """
+        for attempt in range(DISCORD_MAX_RETRIES + 1):
+            # Bucket esgotado: aguarda o reset anunciado pelo Discord
+            wait = self._rate_limit_reset_at - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
             
-            response = requests.post(
+            try:
+                response = self._timed_post(payload)
+            except requests.RequestException as e:
+                print(f"❌ Erro ao enviar para Discord: {e}")
+                WEBHOOK_FAILURES.inc(reason='error')
+                return 0
+            
+            self._update_rate_limit(response)
+            
+            if response.status_code == 429:
+                retry_after = self._retry_after(response)
+                print(f"⏳ Rate limit do Discord, nova tentativa em {retry_after:.1f}s")
+                self._rate_limit_reset_at = time.monotonic() + retry_after
+                if attempt < DISCORD_MAX_RETRIES:
+                    WEBHOOK_RETRIES.inc()
+                continue
+            
+            try:
+                response.raise_for_status()
+            except requests.HTTPError as e:
+                print(f"❌ Discord recusou a mensagem: {e}")
+                WEBHOOK_FAILURES.inc(reason='rejected')
+            return response.status_code
+        
+        print("❌ Limite de tentativas no Discord esgotado")
+        WEBHOOK_FAILURES.inc(reason='retries')
+        return 429
+    
+    def _timed_post(self, payload: Dict) -> requests.Response:
+        """POST pela sessão registrando a latência"""
+        started_at = time.perf_counter()
+        response = None
+        try:
+            response = self.session.post(
                 self.webhook_url,
-                json=embed,
-                headers={'Content-Type': 'application/json'},
-                timeout=10
+                json=payload,
+                timeout=(DISCORD_CONNECT_TIMEOUT, DISCORD_READ_TIMEOUT)
             )
-            response.raise_for_status()
-            return True
-            
-        except Exception as e:
-            print(f"❌ Erro ao enviar vaga: {e}")
-            return False
\ No newline at end of file
+            return response
+        finally:
+            latency = time.perf_counter() - started_at
+            WEBHOOK_SECONDS.observe(latency, status=response.status_code if response is not None else 'error')
+            with self._stats_lock:
+                self._stats['requests'] += 1
+                self._stats['latency'] += latency
+                self._stats['max_latency'] = max(self._stats['max_latency'], latency)
+    
+    def stats(self) -> Dict:
+        """Requisições, conexões novas/reaproveitadas (keep-alive) e latência média/máxima"""
+        with self._stats_lock:
+            stats = dict(self._stats)
+        stats['new_connections'] = self.adapter.new_connections
+        stats['reused_connections'] = max(0, stats['requests'] - stats['new_connections'])
+        stats['avg_latency'] = stats['latency'] / stats['requests'] if stats['requests'] else 0.0
+        return stats
+    
+    def report(self):
+        """Imprime o uso do pool de conexões e a latência do webhook do Discord"""
+        stats = self.stats()
+        if not stats['requests']:
+            return
+        print(f"🔌 Discord: {stats['requests']} requisições, {stats['new_connections']} conexões novas, "
+              f"{stats['reused_connections']} reaproveitadas, latência média "
+              f"{stats['avg_latency'] * 1000:.0f}ms (máx {stats['max_latency'] * 1000:.0f}ms)")
+    
+    def _update_rate_limit(self, response):
+        """Lê X-RateLimit-Remaining/Reset-After para pausar só quando necessário"""
+        remaining = response.headers.get('X-RateLimit-Remaining')
+        reset_after = response.headers.get('X-RateLimit-Reset-After')
+        if remaining is None or reset_after is None:
+            return
+        
+        try:
+            if int(remaining) == 0:
+                self._rate_limit_reset_at = time.monotonic() + float(reset_after)
+        except ValueError:
+            pass
+    
+    def _retry_after(self, response) -> float:
+        """Tempo de espera de um 429 (corpo JSON ou header Retry-After)"""
+        try:
+            return float(response.json().get('retry_after', 1))
+        except (ValueError, AttributeError):
+            return float(response.headers.get('Retry-After', 1))
\ No newline at end of file
@@ -1,26 +1,30 @@
-import json
-from datetime import datetime
 from typing import List, Dict
+from config.settings import JOBS_DB_PATH
+from .job_store import get_job_store
+from .job_ids import job_key
+from models.job import JobLike
 
-def save_jobs_to_file(jobs: List[Dict], filename: str = "vagas_encontradas.json"):
-    """Salva as vagas encontradas em um arquivo JSON"""
-    with open(filename, 'w', encoding='utf-8') as f:
-        json.dump(jobs, f, ensure_ascii=False, indent=2)
+def save_jobs_to_file(jobs: List[JobLike], filename: str = JOBS_DB_PATH):
+    """Registra as vagas encontradas no histórico"""
+    get_job_store(filename).upsert_many(jobs)
 
-def load_previous_jobs(filename: str = "vagas_encontradas.json") -> List[Dict]:
-    """Carrega vagas anteriores do arquivo"""
-    try:
-        with open(filename, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    except FileNotFoundError:
-        return []
+def load_previous_jobs(filename: str = JOBS_DB_PATH) -> List[Dict]:
+    """Carrega as vagas já vistas do histórico"""
+    return get_job_store(filename).all_jobs()
 
-def get_new_jobs(current_jobs: List[Dict], previous_jobs: List[Dict]) -> List[Dict]:
-    """Retorna apenas as vagas novas"""
-    previous_titles = {job['title'] + job['company'] for job in previous_jobs}
-    return [job for job in current_jobs if job['title'] + job['company'] not in previous_titles]
+def get_new_jobs(current_jobs: List[JobLike], filename: str = JOBS_DB_PATH) -> List[JobLike]:
+    """Retorna apenas as vagas que nunca foram vistas"""
+    new_keys = get_job_store(filename).new_keys(job_key(job) for job in current_jobs)
+    
+    new_jobs = []
+    for job in current_jobs:
+        key = job_key(job)
+        if key in new_keys:
+            new_keys.discard(key)  # Evita repetir a mesma vaga da própria busca
+            new_jobs.append(job)
+    return new_jobs
 
-def format_jobs_for_display(jobs: List[Dict]) -> str:
+def format_jobs_for_display(jobs: List[JobLike]) -> str:
     """Formata as vagas para exibição"""
     if not jobs:
         return "Nenhuma vaga nova encontrada."
@@ -0,0 +1,169 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+from config.settings import HTTP_CACHE_PATH, HTTP_CACHE_TTL, HTTP_CACHE_MAX_BYTES
+
+_caches = {}
+_caches_lock = threading.Lock()
+
+
+class CachedResponse:
+    """Resposta guardada no cache (corpo + validadores)"""
+
+    def __init__(self, key: str, body: bytes, etag: str, last_modified: str, stored_at: float):
+        self.key = key
+        self.body = body
+        self.etag = etag
+        self.last_modified = last_modified
+        self.stored_at = stored_at
+
+    def is_fresh(self, ttl: float) -> bool:
+        return time.time() - self.stored_at < ttl
+
+    def text(self) -> str:
+        return self.body.decode('utf-8', 'replace')
+
+    def json(self):
+        return json.loads(self.body)
+
+
+class HttpCache:
+    """Cache HTTP em disco (SQLite) com revalidação condicional e LRU por tamanho
+
+    Dentro do TTL a resposta sai do cache sem nenhuma requisição. Depois
+    dele a requisição vai com If-None-Match/If-Modified-Since e um 304 só
+    renova a entrada. Quando o tamanho total passa do limite, as entradas
+    acessadas há mais tempo são removidas.
+    """
+
+    def __init__(self, db_path: str = HTTP_CACHE_PATH, ttl: float = HTTP_CACHE_TTL,
+                 max_bytes: int = HTTP_CACHE_MAX_BYTES):
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self.stats = {'hits': 0, 'revalidated': 0, 'misses': 0, 'stored': 0, 'evicted': 0}
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        with self._lock, self.conn:
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS responses (
+                    cache_key TEXT PRIMARY KEY,
+                    url TEXT NOT NULL,
+                    body BLOB NOT NULL,
+                    etag TEXT,
+                    last_modified TEXT,
+                    stored_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL,
+                    size INTEGER NOT NULL
+                )
+            """)
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_accessed ON responses (accessed_at)")
+
+    def key(self, url: str, params: dict = None) -> str:
+        """Chave pela URL normalizada (host minúsculo, parâmetros ordenados)"""
+        parts = urlsplit(url)
+        query = parse_qsl(parts.query, keep_blank_values=True)
+        query += [(str(name), str(value)) for name, value in (params or {}).items() if value is not None]
+        normalized = urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path or '/',
+                                 urlencode(sorted(query)), ''))
+        return hashlib.blake2b(normalized.encode('utf-8'), digest_size=16).hexdigest()
+
+    def lookup(self, url: str, params: dict = None) -> Optional[CachedResponse]:
+        """Entrada do cache para a requisição (marca o acesso para o LRU)"""
+        key = self.key(url, params)
+        with self._lock, self.conn:
+            row = self.conn.execute(
+                "SELECT body, etag, last_modified, stored_at FROM responses WHERE cache_key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self.conn.execute("UPDATE responses SET accessed_at = ? WHERE cache_key = ?", (time.time(), key))
+        return CachedResponse(key, *row)
+
+    def is_fresh(self, cached: Optional[CachedResponse]) -> bool:
+        """Entrada ainda dentro do TTL (conta como hit): dispensa a requisição"""
+        if cached is not None and cached.is_fresh(self.ttl):
+            self._count('hits')
+            return True
+        return False
+
+    def conditional_headers(self, cached: Optional[CachedResponse]) -> Dict[str, str]:
+        """Headers de revalidação para uma entrada vencida"""
+        headers = {}
+        if cached is not None:
+            if cached.etag:
+                headers['If-None-Match'] = cached.etag
+            if cached.last_modified:
+                headers['If-Modified-Since'] = cached.last_modified
+        return headers
+
+    def revalidated(self, cached: CachedResponse) -> CachedResponse:
+        """Servidor respondeu 304: renova o TTL da entrada"""
+        cached.stored_at = time.time()
+        with self._lock, self.conn:
+            self.conn.execute("UPDATE responses SET stored_at = ? WHERE cache_key = ?",
+                              (cached.stored_at, cached.key))
+        self._count('revalidated')
+        return cached
+
+    def store(self, url: str, params: dict, headers, body: bytes):
+        """Guarda uma resposta 200 (conta como miss)"""
+        self._count('misses')
+        if 'no-store' in (headers.get('Cache-Control') or '').lower():
+            return
+        if self.max_bytes <= 0 or len(body) > self.max_bytes:
+            return
+
+        now = time.time()
+        with self._lock, self.conn:
+            self.conn.execute("""
+                INSERT OR REPLACE INTO responses
+                    (cache_key, url, body, etag, last_modified, stored_at, accessed_at, size)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """, (self.key(url, params), url, body, headers.get('ETag'),
+                  headers.get('Last-Modified'), now, now, len(body)))
+            self._evict()
+        self._count('stored')
+
+    def _evict(self):
+        """Remove as entradas menos usadas até caber no limite (chamado com o lock)"""
+        total = self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        evicted = 0
+        rows = self.conn.execute("SELECT cache_key, size FROM responses ORDER BY accessed_at").fetchall()
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            self.conn.execute("DELETE FROM responses WHERE cache_key = ?", (key,))
+            total -= size
+            evicted += 1
+        self.stats['evicted'] += evicted
+
+    def _count(self, name: str):
+        with self._lock:
+            self.stats[name] += 1
+
+    def report(self):
+        """Imprime o aproveitamento do cache"""
+        stats = dict(self.stats)
+        total = stats['hits'] + stats['revalidated'] + stats['misses']
+        if not total:
+            return
+        print(f"🗄️ Cache HTTP: {stats['hits']} hits, {stats['revalidated']} revalidadas (304), "
+              f"{stats['misses']} downloads, {stats['evicted']} removidas "
+              f"({(stats['hits'] + stats['revalidated']) / total:.0%} sem download)")
+
+
+def get_http_cache(db_path: str = HTTP_CACHE_PATH) -> HttpCache:
+    """Retorna o cache compartilhado do arquivo informado"""
+    with _caches_lock:
+        cache = _caches.get(db_path)
+        if cache is None:
+            cache = HttpCache(db_path)
+            _caches[db_path] = cache
+        return cache
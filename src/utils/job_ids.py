@@ -0,0 +1,88 @@
+import hashlib
+import re
+from typing import Dict, List, Optional
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode, unquote
+
+# Padrões do ID nativo da vaga em cada plataforma
+ID_PATTERNS = {
+    'linkedin': [
+        re.compile(r'jobPosting:(\d+)'),                  # data-entity-urn
+        re.compile(r'/jobs/view/(?:[^/?#]*-)?(\d+)'),     # /jobs/view/<slug>-<id>
+        re.compile(r'[?&]currentJobId=(\d+)'),
+    ],
+    'gupy': [
+        re.compile(r'/jobs?/(\d+)'),                      # portal.gupy.io/job/<id>, <empresa>.gupy.io/jobs/<id>
+    ],
+    'infojobs': [
+        re.compile(r'/of-i([0-9a-f]+)'),                  # infojobs.net/.../of-i<id>
+        re.compile(r'__(\d+)\.aspx'),                     # infojobs.com.br/vaga-...__<id>.aspx
+    ],
+}
+
+# Parâmetros de rastreamento removidos das URLs
+TRACKING_PARAMS = {'position', 'pagenum', 'refid', 'trackingid', 'trk', 'trkinfo',
+                   'jobboardsource', 'source', 'origin', 'ref', 'fbclid', 'gclid'}
+
+
+def extract_native_id(platform: str, *sources: Optional[str]) -> Optional[str]:
+    """Extrai o ID nativo da vaga da URL/URN da plataforma"""
+    patterns = ID_PATTERNS.get(platform.lower(), [])
+    for source in sources:
+        if not source:
+            continue
+        source = unquote(source)
+        for pattern in patterns:
+            match = pattern.search(source)
+            if match:
+                return match.group(1)
+    return None
+
+
+def normalize_url(url: str) -> str:
+    """Remove rastreamento, fragmento e variações de host/barra da URL"""
+    if not url or url == '#':
+        return ''
+
+    parts = urlsplit(url.strip())
+    host = parts.netloc.lower()
+    if host.endswith('linkedin.com'):
+        host = 'linkedin.com'  # br.linkedin.com, www.linkedin.com...
+
+    query = sorted(
+        (key, value) for key, value in parse_qsl(parts.query)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith('utm_')
+    )
+    return urlunsplit(('https', host, parts.path.rstrip('/'), urlencode(query), ''))
+
+
+def _normalize_text(text: str) -> str:
+    return ' '.join((text or '').lower().split())
+
+
+def canonical_id(job: Dict) -> str:
+    """ID canônico da vaga: 'plataforma:id_nativo' (com fallbacks)"""
+    platform = (job.get('platform') or 'unknown').lower()
+
+    native_id = job.get('job_id') or extract_native_id(platform, job.get('url'))
+    if native_id:
+        return f"{platform}:{native_id}"
+
+    url = normalize_url(job.get('url'))
+    if url:
+        return f"{platform}:url:{url}"
+
+    return f"{platform}:text:{_normalize_text(job.get('title'))}|{_normalize_text(job.get('company'))}"
+
+
+def job_key(job: Dict) -> str:
+    """Chave compacta de largura fixa (16 hex) para deduplicação"""
+    if job.get('job_key'):
+        return job['job_key']
+    return hashlib.blake2b(canonical_id(job).encode('utf-8'), digest_size=8).hexdigest()
+
+
+def assign_job_keys(jobs: List[Dict]) -> List[Dict]:
+    """Grava a chave em cada vaga para não recalculá-la a cada etapa"""
+    for job in jobs:
+        job['job_key'] = job_key(job)
+    return jobs
\ No newline at end of file
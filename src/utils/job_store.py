@@ -0,0 +1,191 @@
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from typing import List, Dict, Iterable, Optional, Set, Tuple
+from config.settings import JOBS_DB_PATH, LEGACY_JOBS_FILE
+from .job_ids import job_key
+from models.job import job_to_dict
+
+_stores = {}
+_stores_lock = threading.Lock()
+
+
+class JobStore:
+    """Histórico persistente de vagas vistas (SQLite)"""
+
+    # 1: chaves canônicas (hash do ID nativo da vaga)
+    # 2: coluna notified_at (confirmação do webhook)
+    # 3: tabela watermarks (última posição processada por site/busca)
+    SCHEMA_VERSION = 3
+
+    def __init__(self, db_path: str = JOBS_DB_PATH):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._setup()
+
+    def _setup(self):
+        """Cria as tabelas e importa o JSON antigo na primeira execução"""
+        with self._lock, self.conn:
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS jobs (
+                    job_key TEXT PRIMARY KEY,
+                    data TEXT NOT NULL,
+                    first_seen TEXT NOT NULL,
+                    last_seen TEXT NOT NULL,
+                    notified_at TEXT
+                )
+            """)
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_last_seen ON jobs (last_seen)")
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS watermarks (
+                    site TEXT NOT NULL,
+                    query TEXT NOT NULL,
+                    newest TEXT,
+                    keys TEXT NOT NULL,
+                    updated_at TEXT NOT NULL,
+                    PRIMARY KEY (site, query)
+                )
+            """)
+            version = self.conn.execute("PRAGMA user_version").fetchone()[0]
+            if version < 1:
+                self._rekey_jobs()
+            columns = {row[1] for row in self.conn.execute("PRAGMA table_info(jobs)")}
+            if 'notified_at' not in columns:
+                self.conn.execute("ALTER TABLE jobs ADD COLUMN notified_at TEXT")
+            self.conn.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+
+        if self.count() == 0 and os.path.exists(LEGACY_JOBS_FILE):
+            self._import_legacy_file(LEGACY_JOBS_FILE)
+
+    def _rekey_jobs(self):
+        """Migra chaves antigas (título + empresa) para as chaves canônicas"""
+        rows = self.conn.execute("SELECT data, first_seen, last_seen FROM jobs").fetchall()
+        if not rows:
+            return
+
+        merged = {}
+        for data, first_seen, last_seen in rows:
+            job = json.loads(data)
+            key = job_key(job)
+            if key in merged:
+                _, previous_first, previous_last = merged[key]
+                first_seen = min(first_seen, previous_first)
+                last_seen = max(last_seen, previous_last)
+            merged[key] = (data, first_seen, last_seen)
+
+        self.conn.execute("DELETE FROM jobs")
+        self.conn.executemany(
+            "INSERT INTO jobs (job_key, data, first_seen, last_seen) VALUES (?, ?, ?, ?)",
+            [(key,) + values for key, values in merged.items()]
+        )
+        print(f"🔑 {len(rows)} vagas do histórico migradas para chaves canônicas")
+
+    def _import_legacy_file(self, filename: str):
+        """Migra o vagas_encontradas.json para não renotificar vagas antigas"""
+        try:
+            with open(filename, 'r', encoding='utf-8') as f:
+                jobs = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Não foi possível importar {filename}: {e}")
+            return
+
+        seen_at = datetime.fromtimestamp(os.path.getmtime(filename)).isoformat(timespec='seconds')
+        self.upsert_many(jobs, seen_at=seen_at)
+        print(f"📦 {len(jobs)} vagas importadas de {filename}")
+
+    def upsert_many(self, jobs: Iterable[Dict], seen_at: str = None):
+        """Insere/atualiza vagas em uma única transação"""
+        seen_at = seen_at or datetime.now().isoformat(timespec='seconds')
+        rows = [
+            (job_key(job), json.dumps(job_to_dict(job), ensure_ascii=False), seen_at, seen_at)
+            for job in jobs
+        ]
+
+        with self._lock, self.conn:
+            self.conn.executemany("""
+                INSERT INTO jobs (job_key, data, first_seen, last_seen) VALUES (?, ?, ?, ?)
+                ON CONFLICT (job_key) DO UPDATE SET
+                    data = excluded.data,
+                    last_seen = excluded.last_seen
+            """, rows)
+
+    def new_keys(self, keys: Iterable[str]) -> Set[str]:
+        """Quais dessas chaves ainda não foram vistas (uma única consulta indexada)"""
+        keys = list(keys)
+        if not keys:
+            return set()
+
+        with self._lock:
+            rows = self.conn.execute("""
+                SELECT value FROM json_each(?)
+                WHERE value NOT IN (SELECT job_key FROM jobs)
+            """, (json.dumps(keys),)).fetchall()
+        return {row[0] for row in rows}
+
+    def mark_notified(self, jobs: Iterable[Dict]):
+        """Marca as vagas como notificadas (após a confirmação do webhook)"""
+        notified_at = datetime.now().isoformat(timespec='seconds')
+        rows = [
+            (job_key(job), json.dumps(job_to_dict(job), ensure_ascii=False), notified_at, notified_at, notified_at)
+            for job in jobs
+        ]
+
+        # A vaga pode ser confirmada antes de a busca registrá-la no histórico
+        with self._lock, self.conn:
+            self.conn.executemany("""
+                INSERT INTO jobs (job_key, data, first_seen, last_seen, notified_at) VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT (job_key) DO UPDATE SET notified_at = excluded.notified_at
+            """, rows)
+
+    def notified_keys(self, keys: Iterable[str]) -> Set[str]:
+        """Quais dessas chaves já tiveram a notificação confirmada"""
+        with self._lock:
+            rows = self.conn.execute("""
+                SELECT job_key FROM jobs
+                WHERE job_key IN (SELECT value FROM json_each(?)) AND notified_at IS NOT NULL
+            """, (json.dumps(list(keys)),)).fetchall()
+        return {row[0] for row in rows}
+
+    def get_watermark(self, site: str, query: str) -> Optional[Dict]:
+        """Última posição processada da busca (data mais recente + chaves vistas)"""
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT newest, keys FROM watermarks WHERE site = ? AND query = ?", (site, query)
+            ).fetchone()
+        if row is None:
+            return None
+        return {'newest': row[0], 'keys': json.loads(row[1])}
+    
+    def save_watermarks(self, watermarks: Iterable[Tuple[str, str, Optional[str], List[str]]]):
+        """Grava as posições (site, busca, data mais recente, chaves) em uma transação"""
+        updated_at = datetime.now().isoformat(timespec='seconds')
+        rows = [(site, query, newest, json.dumps(keys), updated_at) for site, query, newest, keys in watermarks]
+        
+        with self._lock, self.conn:
+            self.conn.executemany("""
+                INSERT OR REPLACE INTO watermarks (site, query, newest, keys, updated_at)
+                VALUES (?, ?, ?, ?, ?)
+            """, rows)
+    
+    def all_jobs(self) -> List[Dict]:
+        """Todas as vagas vistas, das mais recentes para as mais antigas"""
+        with self._lock:
+            rows = self.conn.execute("SELECT data FROM jobs ORDER BY last_seen DESC").fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def count(self) -> int:
+        with self._lock:
+            return self.conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+
+
+def get_job_store(db_path: str = JOBS_DB_PATH) -> JobStore:
+    """Retorna o store compartilhado do arquivo informado"""
+    with _stores_lock:
+        store = _stores.get(db_path)
+        if store is None:
+            store = JobStore(db_path)
+            _stores[db_path] = store
+        return store
\ No newline at end of file
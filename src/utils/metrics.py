@@ -0,0 +1,273 @@
+import bisect
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Sequence, Tuple
+from urllib.parse import urlparse
+
+# Buckets (segundos) para requisições e buscas; as do Selenium passam de 10s
+DEFAULT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120)
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+def _escape(value: str) -> str:
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Tuple, extra: str = '') -> str:
+    parts = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return '{' + ','.join(parts) + '}' if parts else ''
+
+
+def _format_value(value: float) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) and not value.is_integer() else str(int(value))
+
+
+class Metric:
+    """Métrica com labels; cada combinação de valores é uma série"""
+
+    kind = None
+
+    def __init__(self, name: str, help_text: str, labels: Sequence[str] = ()):
+        self.name = name
+        self.help_text = help_text
+        self.labels = tuple(labels)
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> Tuple:
+        return tuple(str(labels.get(name, '')) for name in self.labels)
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} {self.kind}"]
+        with self._lock:
+            series = sorted(self._series.items())
+        for key, value in series:
+            lines.extend(self._render_series(key, value))
+        return lines
+
+    def _render_series(self, key: Tuple, value) -> List[str]:
+        return [f"{self.name}{_format_labels(self.labels, key)} {_format_value(value)}"]
+
+
+class Counter(Metric):
+    """Contador que só cresce"""
+
+    kind = 'counter'
+
+    def inc(self, amount: float = 1, **labels):
+        if amount < 0:
+            raise ValueError('Contador não pode diminuir')
+        key = self._key(labels)
+        with self._lock:
+            self._series[key] = self._series.get(key, 0) + amount
+
+
+class Gauge(Metric):
+    """Valor atual (ex.: vagas da última execução, para alertar queda de rendimento)"""
+
+    kind = 'gauge'
+
+    def set(self, value: float, **labels):
+        with self._lock:
+            self._series[self._key(labels)] = value
+
+
+class Histogram(Metric):
+    """Distribuição (buckets cumulativos, soma e contagem)"""
+
+    kind = 'histogram'
+
+    def __init__(self, name: str, help_text: str, labels: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, help_text, labels)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [[0] * len(self.buckets), 0.0, 0]
+            index = bisect.bisect_left(self.buckets, value)
+            if index < len(self.buckets):
+                series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    def time(self, **labels):
+        """Context manager que observa a duração do bloco"""
+        return _Timer(self, labels)
+
+    def _render_series(self, key: Tuple, value) -> List[str]:
+        counts, total, count = value
+        lines, cumulative = [], 0
+        for bound, bucket_count in zip(self.buckets, counts):
+            cumulative += bucket_count
+            labels = _format_labels(self.labels, key, f'le="{_format_value(bound)}"')
+            lines.append(f"{self.name}_bucket{labels} {cumulative}")
+        inf_labels = _format_labels(self.labels, key, 'le="+Inf"')
+        lines.append(f"{self.name}_bucket{inf_labels} {count}")
+        lines.append(f"{self.name}_sum{_format_labels(self.labels, key)} {_format_value(total)}")
+        lines.append(f"{self.name}_count{_format_labels(self.labels, key)} {count}")
+        return lines
+
+
+class _Timer:
+    def __init__(self, histogram: Histogram, labels: Dict):
+        self.histogram = histogram
+        self.labels = labels
+
+    def __enter__(self):
+        self.started_at = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.seconds = time.perf_counter() - self.started_at
+        self.histogram.observe(self.seconds, **self.labels)
+        return False
+
+
+class MetricsRegistry:
+    """Métricas do pipeline no formato texto do Prometheus
+
+    No modo daemon são servidas por HTTP (/metrics); numa execução única
+    são gravadas em arquivo (para o textfile collector do node_exporter).
+    """
+
+    def __init__(self):
+        self._metrics: Dict[str, Metric] = {}
+        self._lock = threading.Lock()
+        self._server = None
+
+    def _register(self, metric: Metric) -> Metric:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, help_text: str, labels: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, help_text, labels))
+
+    def gauge(self, name: str, help_text: str, labels: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge(name, help_text, labels))
+
+    def histogram(self, name: str, help_text: str, labels: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, help_text, labels, buckets))
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return '\n'.join(line for metric in metrics for line in metric.render()) + '\n'
+
+    def dump(self, path: str):
+        """Grava as métricas em arquivo (troca atômica, o coletor nunca lê pela metade)"""
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(self.render())
+        os.replace(tmp_path, path)
+        print(f"📈 Métricas gravadas em {path}")
+
+    def serve(self, port: int, host: str = '127.0.0.1'):
+        """Sobe o endpoint /metrics numa thread em segundo plano"""
+        if self._server is not None or not port:
+            return
+        registry = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?')[0] not in ('/metrics', '/'):
+                    self.send_error(404)
+                    return
+                body = registry.render().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', CONTENT_TYPE)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass  # Sem log por scrape
+
+        try:
+            self._server = ThreadingHTTPServer((host, port), Handler)
+        except OSError as e:
+            print(f"⚠️ Não foi possível abrir o endpoint de métricas na porta {port}: {e}")
+            return
+        threading.Thread(target=self._server.serve_forever, name='metrics-http', daemon=True).start()
+        print(f"📈 Métricas em http://{host}:{port}/metrics")
+
+    def shutdown(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+
+# Registro compartilhado e métricas do pipeline
+metrics = MetricsRegistry()
+
+REQUEST_SECONDS = metrics.histogram(
+    'vagas_request_seconds', 'Latência das requisições por host e status da resposta', ('host', 'status'))
+PAGES_FETCHED = metrics.counter(
+    'vagas_pages_fetched_total', 'Páginas/respostas aproveitadas por host e origem (network, cache, revalidated, browser)',
+    ('host', 'source'))
+REQUEST_ERRORS = metrics.counter(
+    'vagas_request_errors_total', 'Requisições que falharam ou foram bloqueadas', ('host', 'reason'))
+QUERY_SECONDS = metrics.histogram(
+    'vagas_query_seconds', 'Duração de cada busca (todas as páginas)', ('site', 'query'))
+QUERY_JOBS = metrics.counter(
+    'vagas_query_jobs_total', 'Vagas devolvidas por busca', ('site', 'query'))
+CARDS_PARSED = metrics.counter(
+    'vagas_cards_parsed_total', 'Cards/registros parseados em vagas', ('site', 'source'))
+TIER_SECONDS = metrics.histogram(
+    'vagas_tier_seconds', 'Duração da coleta por camada', ('site', 'tier', 'status'))
+TIER_SERVED = metrics.counter(
+    'vagas_tier_served_total', 'Execuções servidas por cada camada', ('site', 'tier'))
+JOBS_STAGE = metrics.counter(
+    'vagas_jobs_total', 'Vagas que passaram por cada etapa do pipeline', ('site', 'stage'))
+JOBS_LAST_RUN = metrics.gauge(
+    'vagas_jobs_last_run', 'Vagas na última execução por etapa (queda de rendimento)', ('site', 'stage'))
+DEDUP_HITS = metrics.counter(
+    'vagas_dedup_hits_total', 'Vagas descartadas como duplicadas', ('kind',))
+RUN_SECONDS = metrics.histogram(
+    'vagas_run_seconds', 'Duração das etapas de uma execução', ('phase',),
+    buckets=(1, 5, 10, 30, 60, 120, 300, 600, 1200))
+LAST_RUN_TIMESTAMP = metrics.gauge(
+    'vagas_last_run_timestamp_seconds', 'Fim da última execução (epoch)')
+WEBHOOK_SECONDS = metrics.histogram(
+    'vagas_webhook_seconds', 'Latência dos POSTs ao webhook do Discord', ('status',))
+WEBHOOK_RETRIES = metrics.counter(
+    'vagas_webhook_retries_total', 'Novas tentativas no webhook (429)')
+WEBHOOK_FAILURES = metrics.counter(
+    'vagas_webhook_failures_total', 'Mensagens que não foram entregues ao Discord', ('reason',))
+
+
+def host_of(url: str) -> str:
+    return urlparse(url).netloc or 'desconhecido'
+
+
+def observe_request(url: str, status, seconds: float):
+    """Latência de uma requisição que chegou a ir à rede"""
+    REQUEST_SECONDS.observe(seconds, host=host_of(url), status=status)
+
+
+def count_page(url: str, source: str):
+    PAGES_FETCHED.inc(host=host_of(url), source=source)
+
+
+def count_error(url: str, reason: str):
+    REQUEST_ERRORS.inc(host=host_of(url), reason=reason)
+
+
+def count_cards(site: str, source: str, count: int):
+    """Cards/registros que viraram vaga (source: api, http, network, dom)"""
+    CARDS_PARSED.inc(count, site=site, source=source)
\ No newline at end of file
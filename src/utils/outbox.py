@@ -0,0 +1,195 @@
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import List, Dict
+from config.settings import (OUTBOX_PATH, OUTBOX_RETRY_BASE, OUTBOX_RETRY_MAX, OUTBOX_MAX_REJECTIONS,
+                             OUTBOX_DEAD_LETTER_PATH)
+from .job_ids import job_key
+from .job_store import get_job_store
+from models.job import job_to_dict
+
+
+class NotificationOutbox:
+    """Fila persistente (append-only) entre a busca e o Discord
+
+    As vagas novas são gravadas em disco antes de qualquer envio e um worker
+    em segundo plano as entrega. Cada vaga só sai da fila (e é marcada como
+    notificada no histórico) depois que o webhook confirma o envio. O resumo
+    vai uma vez por lote enfileirado; uma vaga que o Discord recusa
+    OUTBOX_MAX_REJECTIONS vezes (4xx, fora o rate limit) vai para o
+    dead-letter em vez de ser reenviada para sempre.
+    """
+
+    def __init__(self, notifier, path: str = OUTBOX_PATH, dead_letter_path: str = OUTBOX_DEAD_LETTER_PATH):
+        self.notifier = notifier
+        self.path = path
+        self.dead_letter_path = dead_letter_path
+        self.pending = OrderedDict()
+        self.rejections: Dict[str, int] = {}
+        self.summary_due = []  # Vagas enfileiradas cujo resumo ainda não foi enviado
+        self.attempts = 0
+        self.next_attempt_at = 0.0
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+        self._load()
+
+    def _load(self):
+        """Reconstrói a fila pendente a partir do log em disco"""
+        if not os.path.exists(self.path):
+            return
+
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue  # Linha truncada por queda no meio da escrita
+                if record['op'] == 'enqueue':
+                    self.pending[record['key']] = record['job']
+                    if record.get('rejections'):
+                        self.rejections[record['key']] = record['rejections']
+                elif record['op'] == 'ack':
+                    self.pending.pop(record['key'], None)
+                    self.rejections.pop(record['key'], None)
+
+        if self.pending:
+            print(f"📬 {len(self.pending)} notificações pendentes na fila")
+
+    def _append(self, records: List[Dict]):
+        """Grava registros no log e força a ida ao disco"""
+        with open(self.path, 'a', encoding='utf-8') as f:
+            for record in records:
+                f.write(json.dumps(record, ensure_ascii=False) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+
+    def enqueue(self, jobs: List[Dict]) -> int:
+        """Coloca vagas na fila (idempotente pela chave da vaga)"""
+        now = datetime.now().isoformat(timespec='seconds')
+
+        with self._lock:
+            keys = [job_key(job) for job in jobs]
+            already_notified = get_job_store().notified_keys(keys)
+
+            records = []
+            for key, job in zip(keys, jobs):
+                if key in self.pending or key in already_notified:
+                    continue
+                self.pending[key] = job
+                self.summary_due.append(job)
+                records.append({'op': 'enqueue', 'key': key, 'job': job_to_dict(job), 'at': now})
+
+            if records:
+                self._append(records)
+                # Novas vagas: tenta na hora em vez de esperar o backoff
+                self.attempts = 0
+                self.next_attempt_at = 0.0
+
+        self._wake.set()
+        return len(records)
+
+    def drain(self) -> bool:
+        """Tenta entregar tudo o que está pendente; retorna True se a fila esvaziou"""
+        with self._lock:
+            jobs = list(self.pending.values())
+            summary, self.summary_due = self.summary_due, []
+        if not jobs:
+            return True
+
+        # Resumo só uma vez por lote (as retentativas mandam apenas os embeds)
+        if summary and not self.notifier.send_summary(summary):
+            print("⚠️ Resumo não enviado; as vagas continuam na fila")
+
+        delivered, rejected = self.notifier.deliver_jobs(jobs)
+
+        with self._lock:
+            if delivered:
+                get_job_store().mark_notified(delivered)
+                for key in map(job_key, delivered):
+                    self.pending.pop(key, None)
+                    self.rejections.pop(key, None)
+            if rejected:
+                self._count_rejections(rejected)
+            if delivered or rejected:
+                self._compact()
+
+            if self.pending:
+                # Backoff exponencial até o webhook voltar
+                delay = min(OUTBOX_RETRY_MAX, OUTBOX_RETRY_BASE * (2 ** self.attempts))
+                self.attempts += 1
+                self.next_attempt_at = time.time() + delay
+                print(f"📬 {len(self.pending)} notificações pendentes, nova tentativa em {delay:.0f}s")
+                return False
+
+            self.attempts = 0
+            return True
+
+    def _count_rejections(self, jobs: List[Dict]):
+        """Soma uma recusa por vaga; as que passam do limite vão para o dead-letter"""
+        now = datetime.now().isoformat(timespec='seconds')
+        dead = []
+        for job in jobs:
+            key = job_key(job)
+            self.rejections[key] = self.rejections.get(key, 0) + 1
+            if self.rejections[key] >= OUTBOX_MAX_REJECTIONS:
+                dead.append({'key': key, 'job': job_to_dict(job), 'rejections': self.rejections.pop(key), 'at': now})
+                self.pending.pop(key, None)
+
+        if dead:
+            with open(self.dead_letter_path, 'a', encoding='utf-8') as f:
+                for record in dead:
+                    f.write(json.dumps(record, ensure_ascii=False) + '\n')
+            print(f"🪦 {len(dead)} vagas recusadas {OUTBOX_MAX_REJECTIONS}x pelo Discord movidas para "
+                  f"{self.dead_letter_path}")
+
+    def _compact(self):
+        """Reescreve o log só com o que está pendente (e as recusas de cada vaga)"""
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            for key, job in self.pending.items():
+                record = {'op': 'enqueue', 'key': key, 'job': job_to_dict(job)}
+                if self.rejections.get(key):
+                    record['rejections'] = self.rejections[key]
+                f.write(json.dumps(record, ensure_ascii=False) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+
+    def start(self):
+        """Inicia o worker de entrega em segundo plano"""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='notification-outbox', daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 30):
+        """Para o worker (o que não foi entregue continua salvo em disco)"""
+        self._stop.set()
+        self._wake.set()
+        if self._thread:
+            self._thread.join(timeout)
+
+    def _run(self):
+        while not self._stop.is_set():
+            wait = self.next_attempt_at - time.time()
+            if wait > 0:
+                self._wake.wait(wait)
+                self._wake.clear()
+                continue
+
+            if self.pending:
+                try:
+                    self.drain()
+                except Exception as e:
+                    print(f"❌ Erro no worker de notificações: {e}")
+                    self.next_attempt_at = time.time() + OUTBOX_RETRY_BASE
+                continue
+
+            self._wake.wait()
+            self._wake.clear()
\ No newline at end of file
@@ -0,0 +1,126 @@
+import asyncio
+import threading
+import time
+from typing import Dict
+from urllib.parse import urlparse
+from config.settings import RATE_LIMITS
+
+class TokenBucket:
+    """Token bucket com rajada; a taxa se adapta aos sinais de bloqueio (AIMD)"""
+
+    def __init__(self, rate: float, burst: int, min_rate: float):
+        self.max_rate = rate
+        self.rate = rate
+        self.min_rate = min(min_rate, rate)
+        self.burst = max(1, burst)
+        self.tokens = float(self.burst)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+
+    def reserve(self) -> float:
+        """Reserva um token e retorna quantos segundos esperar por ele"""
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+        # Tokens podem ficar negativos: cada reserva enfileira atrás da anterior
+        self.tokens -= 1
+        wait = 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+        return max(wait, self.blocked_until - now)
+
+    def penalize(self, retry_after: float = 0):
+        """Reduz a taxa pela metade e esvazia a rajada"""
+        self.rate = max(self.min_rate, self.rate / 2)
+        self.tokens = min(self.tokens, 0)
+        if retry_after:
+            self.blocked_until = max(self.blocked_until, time.monotonic() + retry_after)
+
+    def reward(self):
+        """Recupera a taxa aos poucos após respostas bem-sucedidas"""
+        if self.rate < self.max_rate:
+            self.rate = min(self.max_rate, self.rate + self.max_rate * 0.1)
+
+
+class HostRateLimiter:
+    """Rate limiter compartilhado, com um token bucket por host"""
+
+    def __init__(self, limits: Dict[str, dict]):
+        self.limits = limits
+        self._buckets = {}
+        self._stats = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, url: str) -> float:
+        """Bloqueia até o host liberar a requisição; retorna o tempo esperado"""
+        wait = self._reserve(url)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, url: str) -> float:
+        """Versão assíncrona de acquire"""
+        wait = self._reserve(url)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def penalize(self, url: str, retry_after: float = 0):
+        """Sinaliza 429/503/bloqueio para o host"""
+        host = self._host(url)
+        with self._lock:
+            bucket = self._bucket(host)
+            bucket.penalize(retry_after)
+            self._stats[host]['penalties'] += 1
+        print(f"🐢 Reduzindo ritmo em {host}: {bucket.rate:.2f} req/s")
+
+    def reward(self, url: str):
+        """Sinaliza resposta bem-sucedida para o host"""
+        with self._lock:
+            self._bucket(self._host(url)).reward()
+
+    def feedback(self, url: str, status_code: int, retry_after=None):
+        """Ajusta a taxa do host a partir do status HTTP da resposta"""
+        if status_code in (429, 503):
+            try:
+                delay = float(retry_after) if retry_after else 0
+            except ValueError:
+                delay = 0
+            self.penalize(url, delay)
+        elif status_code < 400:
+            self.reward(url)
+
+    def stats(self) -> Dict[str, dict]:
+        """Tempo de espera acumulado por host"""
+        with self._lock:
+            return {host: dict(values) for host, values in self._stats.items()}
+
+    def report(self):
+        """Imprime quanto cada host esperou no rate limiter"""
+        for host, values in self.stats().items():
+            print(f"⏳ {host}: {values['requests']} requisições, "
+                  f"{values['waited']:.1f}s de espera (máx {values['max_wait']:.1f}s)")
+
+    def _reserve(self, url: str) -> float:
+        host = self._host(url)
+        with self._lock:
+            wait = self._bucket(host).reserve()
+            stats = self._stats[host]
+            stats['requests'] += 1
+            stats['waited'] += wait
+            stats['max_wait'] = max(stats['max_wait'], wait)
+        return wait
+
+    def _bucket(self, host: str) -> TokenBucket:
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            config = self.limits.get(host, self.limits['default'])
+            bucket = TokenBucket(config['rate'], config['burst'], config.get('min_rate', 0.05))
+            self._buckets[host] = bucket
+            self._stats[host] = {'requests': 0, 'waited': 0.0, 'max_wait': 0.0, 'penalties': 0}
+        return bucket
+
+    def _host(self, url: str) -> str:
+        return urlparse(url).netloc or url
+
+
+rate_limiter = HostRateLimiter(RATE_LIMITS)
\ No newline at end of file
@@ -0,0 +1,101 @@
+import threading
+from datetime import date, timedelta
+from typing import List, Optional
+from config.settings import INCREMENTAL_SCRAPING, WATERMARK_MAX_KEYS
+from models.job import JobLike, posting_time
+from .job_ids import job_key
+from .job_store import get_job_store
+
+
+def _posting_date(job: JobLike) -> Optional[date]:
+    """Dia de publicação (posted_at do Job; None se a plataforma não informar)"""
+    posted_at = posting_time(job)
+    return posted_at.date() if posted_at else None
+
+
+def _day_before(day: Optional[str]) -> Optional[date]:
+    """Dia anterior ao AAAA-MM-DD gravado; None se a data for inválida"""
+    try:
+        return date.fromisoformat(day) - timedelta(days=1) if day else None
+    except ValueError:
+        return None
+
+
+class Watermark:
+    """Posição já processada de uma busca (site + termo)
+
+    Guarda a data de publicação mais recente e as chaves das vagas vistas nas
+    últimas execuções. Uma página em que todas as vagas já foram vistas (ou
+    são anteriores ao dia antes da data mais recente) encerra a
+    paginação/rolagem. A margem de um dia cobre vagas indexadas com atraso:
+    as datas só têm precisão de dia.
+    """
+
+    def __init__(self, site: str, query: str, newest: str = None, keys: List[str] = ()):
+        self.site = site
+        self.query = query
+        self.newest = newest
+        self.keys = list(keys)
+        self._known = frozenset(self.keys)
+        self._cutoff = _day_before(newest)
+        self._observed = {}
+        self._observed_newest = newest
+
+    def is_seen(self, job: JobLike) -> bool:
+        if job_key(job) in self._known:
+            return True
+        posted = _posting_date(job)
+        return bool(posted and self._cutoff and posted < self._cutoff)
+
+    def page_is_seen(self, jobs: List[JobLike]) -> bool:
+        """Página só com vagas já processadas em execuções anteriores"""
+        if not INCREMENTAL_SCRAPING or not jobs:
+            return False
+        return all(self.is_seen(job) for job in jobs)
+
+    def observe(self, jobs: List[JobLike]):
+        """Registra as vagas processadas nesta execução"""
+        for job in jobs:
+            self._observed[job_key(job)] = True
+            posted = _posting_date(job)
+            if posted and (self._observed_newest is None or posted.isoformat() > self._observed_newest):
+                self._observed_newest = posted.isoformat()
+
+    def pending(self):
+        """Nova posição (vistas agora primeiro, limitada a WATERMARK_MAX_KEYS)"""
+        if not self._observed:
+            return None
+        keys = list(self._observed)
+        keys += [key for key in self.keys if key not in self._observed]
+        return self.site, self.query, self._observed_newest, keys[:WATERMARK_MAX_KEYS]
+
+
+class WatermarkTracker:
+    """Watermarks de todas as buscas; só são gravados após a execução ser processada"""
+
+    def __init__(self):
+        self._watermarks = {}
+        self._lock = threading.Lock()
+
+    def get(self, site: str, query: str) -> Watermark:
+        with self._lock:
+            watermark = self._watermarks.get((site, query))
+            if watermark is None:
+                stored = get_job_store().get_watermark(site, query) or {}
+                watermark = Watermark(site, query, stored.get('newest'), stored.get('keys', []))
+                self._watermarks[(site, query)] = watermark
+            return watermark
+
+    def commit(self):
+        """Grava as novas posições (chamado depois que as vagas foram salvas)"""
+        with self._lock:
+            pending = [watermark.pending() for watermark in self._watermarks.values()]
+            self._watermarks = {}
+
+        pending = [row for row in pending if row]
+        if pending:
+            get_job_store().save_watermarks(pending)
+
+
+# Watermarks compartilhados por todos os scrapers
+watermarks = WatermarkTracker()